@@ -0,0 +1,187 @@
+#
+# This file is part of pyasn1 software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pyasn1/license.html
+#
+# This module requires Python 3.5+
+#
+from pyasn1 import debug
+from pyasn1 import error
+from pyasn1.codec.ber import decoder as ber_decoder
+
+__all__ = ['AsyncStreamingDecoder']
+
+LOG = debug.registerLoggee(__name__, flags=debug.DEBUG_DECODER)
+
+
+class AsyncStreamingDecoder(object):
+    """Create an asynchronous iterator that turns BER/CER/DER byte stream into ASN.1 objects.
+
+    On each iteration, awaits exactly as many octets as it takes to
+    read one top-level TLV out of `substrate`, then decodes that TLV
+    into one, possibly nested, ASN.1 object. The event loop is never
+    blocked while waiting for input and no partial serialization ever
+    needs to be re-parsed.
+
+    Parameters
+    ----------
+    substrate: :py:class:`asyncio.StreamReader`
+        BER/CER/DER serialization source, in fact any object with
+        `async read(n)` method returning up to `n` octets and empty
+        octet string on end of stream
+
+    Keyword Args
+    ------------
+    asn1Spec: :py:class:`~pyasn1.type.base.PyAsn1Item`
+        A pyasn1 type object to act as a template guiding the decoder
+
+    decoder: :py:class:`~pyasn1.codec.ber.decoder.Decoder`
+        Decoder to turn each TLV into ASN.1 object, BER decoder by default
+
+    maxDepth, maxComponents, maxValueLength, maxTotalLength: :py:class:`int`
+        Resource limits on each top-level TLV, see
+        :py:class:`~pyasn1.codec.ber.decoder.Decoder`. TLV headers
+        walked while reading are checked right away, so that excessive
+        input is rejected before being read.
+
+    Yields
+    ------
+    : :py:class:`~pyasn1.type.base.PyAsn1Item`
+        Decoded ASN.1 object (possibly, nested)
+
+    Raises
+    ------
+    ~pyasn1.error.PyAsn1Error, ~pyasn1.error.EndOfStreamError
+        `PyAsn1Error` on deserialization error (including
+        `DecodingLimitError` on exceeding resource limits),
+        `EndOfStreamError` on premature stream closure.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        async def handle(reader, writer):
+            async for message in AsyncStreamingDecoder(reader, asn1Spec=LDAPMessage()):
+                print(message)
+
+    """
+    def __init__(self, substrate, asn1Spec=None, decoder=ber_decoder.decode,
+                 **options):
+        self._substrate = substrate
+        self._asn1Spec = asn1Spec
+        self._decoder = decoder
+        self._options = options
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        firstOctet = await self._substrate.read(1)
+
+        if not firstOctet:
+            raise StopAsyncIteration
+
+        substrate = await self._readTlv(firstOctet)
+
+        if LOG:
+            LOG('read %d octets TLV' % len(substrate))
+
+        asn1Object, tail = self._decoder(
+            substrate, asn1Spec=self._asn1Spec, **self._options)
+
+        return asn1Object
+
+    async def _read(self, size):
+        chunks = []
+
+        while size:
+            chunk = await self._substrate.read(size)
+
+            if not chunk:
+                raise error.EndOfStreamError(
+                    'Stream closed with %d octets missing' % size)
+
+            chunks.append(chunk)
+
+            size -= len(chunk)
+
+        return b''.join(chunks)
+
+    async def _readHeader(self, firstOctet):
+        chunks = [firstOctet]
+
+        # long tag ID
+        if firstOctet[0] & 0x1F == 0x1F:
+            while True:
+                chunk = await self._read(1)
+
+                chunks.append(chunk)
+
+                if not chunk[0] & 0x80:
+                    break
+
+        chunk = await self._read(1)
+
+        chunks.append(chunk)
+
+        # long definite length form
+        if chunk[0] > 0x80:
+            chunks.append(await self._read(chunk[0] & 0x7F))
+
+        return b''.join(chunks)
+
+    async def _readTlv(self, firstOctet):
+        # nested definite length TLVs are read as a whole, the decoder
+        # checks them against the limits
+        limits = ber_decoder.DecodingLimits.fromOptions(self._options)
+
+        chunks = []
+
+        # position of the TLV being read within top-level TLV
+        position = 0
+
+        # number of enclosing indefinite length TLVs
+        depth = 0
+
+        while True:
+            header = await self._readHeader(firstOctet)
+
+            chunks.append(header)
+
+            if depth and header == ber_decoder.EOO_SENTINEL:
+                depth -= 1
+
+                if not depth:
+                    break
+
+                position += len(header)
+
+                firstOctet = await self._read(1)
+
+                continue
+
+            tagClass, tagFormat, tagId, offset, length = (
+                ber_decoder.decodeHeader(header))
+
+            if limits is not None:
+                limits.depth = depth
+                limits.checkHeader(tagFormat, length, position)
+
+            position += len(header)
+
+            if length == -1:
+                depth += 1
+
+            else:
+                chunks.append(await self._read(length))
+
+                position += length
+
+                if not depth:
+                    break
+
+            firstOctet = await self._read(1)
+
+        return b''.join(chunks)
@@ -4,11 +4,15 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: http://snmplabs.com/pyasn1/license.html
 #
+import array
+import mmap
 import os
+import sys
 
 from pyasn1 import debug
 from pyasn1 import error
 from pyasn1.codec.ber import eoo
+from pyasn1.codec.streaming import MemoryViewStream
 from pyasn1.codec.streaming import asSeekableStream
 from pyasn1.codec.streaming import isEndOfStream
 from pyasn1.codec.streaming import peekIntoStream
@@ -23,7 +27,8 @@ from pyasn1.type import tagmap
 from pyasn1.type import univ
 from pyasn1.type import useful
 
-__all__ = ['StreamingDecoder', 'Decoder', 'decode']
+__all__ = ['StreamingDecoder', 'CompiledDecoder', 'IterativeDecoder', 'Decoder',
+           'PushDecoder', 'decode', 'SubstrateIndex', 'indexSubstrate']
 
 LOG = debug.registerLoggee(__name__, flags=debug.DEBUG_DECODER)
 
@@ -31,6 +36,15 @@ noValue = base.noValue
 
 SubstrateUnderrunError = error.SubstrateUnderrunError
 
+try:
+    array.array('q')
+    _OFFSET_TYPECODE = 'q'
+
+except ValueError:
+    _OFFSET_TYPECODE = 'l'
+
+_MAX_TAG_ID = (1 << 8 * array.array('L').itemsize) - 1
+
 
 class AbstractPayloadDecoder(object):
     protoComponent = None
@@ -55,6 +69,11 @@ class AbstractPayloadDecoder(object):
         """
         raise error.PyAsn1Error('Indefinite length mode decoder not implemented for %s' % (tagSet,)) # TODO: Seems more like an NotImplementedError?
 
+    #: Payload decoders capable of turning a complete primitive-form
+    #: payload into ASN.1 object without consuming the stream implement
+    #: it as `primitiveValueDecoder(octets, asn1Spec, tagSet, **options)`.
+    primitiveValueDecoder = None
+
     @staticmethod
     def _passAsn1Object(asn1Object, options):
         if 'asn1Object' not in options:
@@ -139,13 +158,16 @@ class IntegerPayloadDecoder(AbstractSimplePayloadDecoder):
             if isinstance(chunk, SubstrateUnderrunError):
                 yield chunk
 
-        if chunk:
-            value = from_bytes(chunk, signed=True)
+        yield self.primitiveValueDecoder(chunk, asn1Spec, tagSet, **options)
+
+    def primitiveValueDecoder(self, octets, asn1Spec, tagSet=None, **options):
+        if octets:
+            value = from_bytes(octets, signed=True)
 
         else:
             value = 0
 
-        yield self._createComponent(asn1Spec, tagSet, value, **options)
+        return self._createComponent(asn1Spec, tagSet, value, **options)
 
 
 class BooleanPayloadDecoder(IntegerPayloadDecoder):
@@ -185,24 +207,11 @@ class BitStringPayloadDecoder(AbstractSimplePayloadDecoder):
 
         if tagSet[0].tagFormat == tag.tagFormatSimple:  # XXX what tag to check?
 
-            for trailingBits in readFromStream(substrate, 1, options):
-                if isinstance(trailingBits, SubstrateUnderrunError):
-                    yield trailingBits
-
-            trailingBits = ord(trailingBits)
-            if trailingBits > 7:
-                raise error.PyAsn1Error(
-                    'Trailing bits overflow %s' % trailingBits
-                )
-
-            for chunk in readFromStream(substrate, length - 1, options):
+            for chunk in readFromStream(substrate, length, options):
                 if isinstance(chunk, SubstrateUnderrunError):
                     yield chunk
 
-            value = self.protoComponent.fromOctetString(
-                chunk, internalFormat=True, padding=trailingBits)
-
-            yield self._createComponent(asn1Spec, tagSet, value, **options)
+            yield self.primitiveValueDecoder(chunk, asn1Spec, tagSet, **options)
 
             return
 
@@ -240,6 +249,21 @@ class BitStringPayloadDecoder(AbstractSimplePayloadDecoder):
 
         yield self._createComponent(asn1Spec, tagSet, bitString, **options)
 
+    def primitiveValueDecoder(self, octets, asn1Spec, tagSet=None, **options):
+        if not octets:
+            raise error.PyAsn1Error('Empty BIT STRING substrate')
+
+        trailingBits = oct2int(octets[0])
+        if trailingBits > 7:
+            raise error.PyAsn1Error(
+                'Trailing bits overflow %s' % trailingBits
+            )
+
+        value = self.protoComponent.fromOctetString(
+            octets[1:], internalFormat=True, padding=trailingBits)
+
+        return self._createComponent(asn1Spec, tagSet, value, **options)
+
     def indefLenValueDecoder(self, substrate, asn1Spec,
                              tagSet=None, length=None, state=None,
                              decodeFun=None, substrateFun=None,
@@ -256,6 +280,8 @@ class BitStringPayloadDecoder(AbstractSimplePayloadDecoder):
         # All inner fragments are of the same type, treat them as octet string
         substrateFun = self.substrateCollector
 
+        limits = options.get('decodingLimits')
+
         bitString = self.protoComponent.fromOctetString(null, internalFormat=True)
 
         while True:  # loop over fragments
@@ -284,6 +310,9 @@ class BitStringPayloadDecoder(AbstractSimplePayloadDecoder):
                 prepend=bitString, padding=trailingBits
             )
 
+            if limits is not None:
+                limits.checkValueLength(tagSet, len(bitString) // 8)
+
         yield self._createComponent(asn1Spec, tagSet, bitString, **options)
 
 
@@ -308,7 +337,7 @@ class OctetStringPayloadDecoder(AbstractSimplePayloadDecoder):
                 if isinstance(chunk, SubstrateUnderrunError):
                     yield chunk
 
-            yield self._createComponent(asn1Spec, tagSet, chunk, **options)
+            yield self.primitiveValueDecoder(chunk, asn1Spec, tagSet, **options)
 
             return
 
@@ -336,6 +365,9 @@ class OctetStringPayloadDecoder(AbstractSimplePayloadDecoder):
 
         yield self._createComponent(asn1Spec, tagSet, header, **options)
 
+    def primitiveValueDecoder(self, octets, asn1Spec, tagSet=None, **options):
+        return self._createComponent(asn1Spec, tagSet, octets, **options)
+
     def indefLenValueDecoder(self, substrate, asn1Spec,
                              tagSet=None, length=None, state=None,
                              decodeFun=None, substrateFun=None,
@@ -351,6 +383,8 @@ class OctetStringPayloadDecoder(AbstractSimplePayloadDecoder):
         # All inner fragments are of the same type, treat them as octet string
         substrateFun = self.substrateCollector
 
+        limits = options.get('decodingLimits')
+
         header = null
 
         while True:  # loop over fragments
@@ -370,6 +404,9 @@ class OctetStringPayloadDecoder(AbstractSimplePayloadDecoder):
 
             header += component
 
+            if limits is not None:
+                limits.checkValueLength(tagSet, len(header))
+
         yield self._createComponent(asn1Spec, tagSet, header, **options)
 
 
@@ -388,12 +425,15 @@ class NullPayloadDecoder(AbstractSimplePayloadDecoder):
             if isinstance(chunk, SubstrateUnderrunError):
                 yield chunk
 
+        yield self.primitiveValueDecoder(chunk, asn1Spec, tagSet, **options)
+
+    def primitiveValueDecoder(self, octets, asn1Spec, tagSet=None, **options):
         component = self._createComponent(asn1Spec, tagSet, '', **options)
 
-        if chunk:
-            raise error.PyAsn1Error('Unexpected %d-octet substrate for Null' % length)
+        if octets:
+            raise error.PyAsn1Error('Unexpected %d-octet substrate for Null' % len(octets))
 
-        yield component
+        return component
 
 
 class ObjectIdentifierPayloadDecoder(AbstractSimplePayloadDecoder):
@@ -410,10 +450,13 @@ class ObjectIdentifierPayloadDecoder(AbstractSimplePayloadDecoder):
             if isinstance(chunk, SubstrateUnderrunError):
                 yield chunk
 
-        if not chunk:
+        yield self.primitiveValueDecoder(chunk, asn1Spec, tagSet, **options)
+
+    def primitiveValueDecoder(self, octets, asn1Spec, tagSet=None, **options):
+        if not octets:
             raise error.PyAsn1Error('Empty substrate')
 
-        chunk = octs2ints(chunk)
+        chunk = octs2ints(octets)
 
         oid = ()
         index = 0
@@ -453,7 +496,7 @@ class ObjectIdentifierPayloadDecoder(AbstractSimplePayloadDecoder):
         else:
             raise error.PyAsn1Error('Malformed first OID octet: %s' % chunk[0])
 
-        yield self._createComponent(asn1Spec, tagSet, oid, **options)
+        return self._createComponent(asn1Spec, tagSet, oid, **options)
 
 
 class RealPayloadDecoder(AbstractSimplePayloadDecoder):
@@ -470,9 +513,13 @@ class RealPayloadDecoder(AbstractSimplePayloadDecoder):
             if isinstance(chunk, SubstrateUnderrunError):
                 yield chunk
 
+        yield self.primitiveValueDecoder(chunk, asn1Spec, tagSet, **options)
+
+    def primitiveValueDecoder(self, octets, asn1Spec, tagSet=None, **options):
+        chunk = octets
+
         if not chunk:
-            yield self._createComponent(asn1Spec, tagSet, 0.0, **options)
-            return
+            return self._createComponent(asn1Spec, tagSet, 0.0, **options)
 
         fo = oct2int(chunk[0])
         chunk = chunk[1:]
@@ -563,7 +610,7 @@ class RealPayloadDecoder(AbstractSimplePayloadDecoder):
                 'Unknown encoding (tag %s)' % fo
             )
 
-        yield self._createComponent(asn1Spec, tagSet, value, **options)
+        return self._createComponent(asn1Spec, tagSet, value, **options)
 
 
 class AbstractConstructedPayloadDecoder(AbstractPayloadDecoder):
@@ -1473,6 +1520,254 @@ for typeDecoder in TAG_MAP.values():
 EOO_SENTINEL = ints2octs((0, 0))
 
 
+def decodeHeader(substrate, offset=0):
+    """Decode BER TLV header out of in-memory substrate.
+
+    Parameters
+    ----------
+    substrate: :py:class:`bytes` or :py:class:`memoryview`
+        BER/CER/DER serialization
+
+    Keyword Args
+    ------------
+    offset: :py:class:`int`
+        Position of the first tag octet within `substrate`
+
+    Returns
+    -------
+    : :py:class:`tuple`
+        Tag class, tag format, tag ID, the position of the first value
+        octet and value length (-1 stands for indefinite length)
+
+    Raises
+    ------
+    ~pyasn1.error.SubstrateUnderrunError
+        If TLV header is not fully contained in `substrate`
+    """
+    try:
+        firstOctet = oct2int(substrate[offset])
+        offset += 1
+
+        tagClass = firstOctet & 0xC0
+        tagFormat = firstOctet & 0x20
+        tagId = firstOctet & 0x1F
+
+        if tagId == 0x1F:
+            tagId = 0
+
+            while True:
+                integerTag = oct2int(substrate[offset])
+                offset += 1
+                tagId <<= 7
+                tagId |= (integerTag & 0x7F)
+
+                if not integerTag & 0x80:
+                    break
+
+        firstOctet = oct2int(substrate[offset])
+        offset += 1
+
+    except IndexError:
+        raise error.SubstrateUnderrunError(
+            'Short substrate for TLV header at %s' % offset)
+
+    if firstOctet < 128:
+        length = firstOctet
+
+    elif firstOctet > 128:
+        size = firstOctet & 0x7F
+
+        if offset + size > len(substrate):
+            raise error.SubstrateUnderrunError(
+                '%s<%s at %s' % (size, len(substrate) - offset, offset))
+
+        length = 0
+        for idx in range(offset, offset + size):
+            length <<= 8
+            length |= oct2int(substrate[idx])
+
+        offset += size
+
+    else:  # 128 means indefinite
+        length = -1
+
+    return tagClass, tagFormat, tagId, offset, length
+
+
+def skipTlv(substrate, offset=0):
+    """Skip over BER TLV in in-memory substrate without decoding it.
+
+    Definite length TLVs are skipped by length, indefinite length TLVs
+    get walked to their end-of-octets sentinel. Nested indefinite length
+    TLVs are just counted, so arbitrarily deep nesting does not exhaust
+    Python stack.
+
+    Parameters
+    ----------
+    substrate: :py:class:`memoryview`
+        BER serialization
+
+    Keyword Args
+    ------------
+    offset: :py:class:`int`
+        Position of the first tag octet within `substrate`
+
+    Returns
+    -------
+    : :py:class:`int`
+        Position next to the end of TLV
+
+    Raises
+    ------
+    ~pyasn1.error.PyAsn1Error, ~pyasn1.error.SubstrateUnderrunError
+        On broken TLV framing
+    """
+    substrateLength = len(substrate)
+
+    # number of enclosing indefinite length TLVs
+    depth = 0
+
+    while True:
+        tagClass, tagFormat, tagId, offset, length = decodeHeader(
+            substrate, offset)
+
+        if length == -1:
+            if not tagFormat:
+                raise error.PyAsn1Error(
+                    'Indefinite length encoding of primitive value '
+                    'at %s' % offset)
+
+            depth += 1
+
+        else:
+            offset += length
+
+            if offset > substrateLength:
+                raise error.SubstrateUnderrunError(
+                    '%d-octet short at %s' % (offset - substrateLength, offset))
+
+        while depth:
+            if offset >= substrateLength:
+                raise error.SubstrateUnderrunError(
+                    'Missing end-of-octets sentinel at %s' % offset)
+
+            if substrate[offset:offset + 2].tobytes() != EOO_SENTINEL:
+                break
+
+            offset += 2
+            depth -= 1
+
+        if not depth:
+            return offset
+
+
+# Tag and single-tag TagSet objects by identifier octet of short tags
+SHORT_TAGS = [None] * 256
+SHORT_TAG_SETS = [None] * 256
+
+for firstOctet in range(256):
+    if firstOctet & 0x1F != 0x1F:
+        SHORT_TAGS[firstOctet] = tag.Tag(
+            tagClass=firstOctet & 0xC0, tagFormat=firstOctet & 0x20,
+            tagId=firstOctet & 0x1F)
+        SHORT_TAG_SETS[firstOctet] = tag.TagSet((), SHORT_TAGS[firstOctet])
+
+del firstOctet
+
+_DISPATCH_TABLES = {}
+_DISPATCH_TABLES_LIMIT = 64
+
+
+def _getDispatchTable(tagMap):
+    """Map identifier octet of short tags onto payload decoders of `tagMap`.
+
+    The tables are built once per tag map and shared by all decoders.
+    Any change to tag map contents after that invalidates the table.
+    """
+    try:
+        snapshot, table = _DISPATCH_TABLES[id(tagMap)]
+
+    except KeyError:
+        pass
+
+    else:
+        if snapshot == tagMap:
+            return table
+
+    table = [tagSet is not None and tagMap.get(tagSet) or None
+             for tagSet in SHORT_TAG_SETS]
+
+    if len(_DISPATCH_TABLES) >= _DISPATCH_TABLES_LIMIT:
+        _DISPATCH_TABLES.clear()
+
+    _DISPATCH_TABLES[id(tagMap)] = dict(tagMap), table
+
+    return table
+
+
+class DecodingLimits(object):
+    """Resources consumed while decoding one top-level TLV.
+
+    Shared by all nested decoder invocations through `decodingLimits`
+    option. Limits are checked as soon as TLV header is read, that is
+    before any of the TLV value is read or turned into objects.
+    """
+
+    def __init__(self, maxDepth=None, maxComponents=None,
+                 maxValueLength=None, maxTotalLength=None):
+        self.maxDepth = maxDepth
+        self.maxComponents = maxComponents
+        self.maxValueLength = maxValueLength
+        self.maxTotalLength = maxTotalLength
+
+        self.depth = 0
+        self.components = 0
+        self.totalLength = 0
+
+    @classmethod
+    def fromOptions(cls, options):
+        limits = [options.get(name) for name in (
+            'maxDepth', 'maxComponents', 'maxValueLength', 'maxTotalLength')]
+
+        if limits.count(None) < len(limits):
+            return cls(*limits)
+
+    def checkTlv(self, tagSet, length):
+        self.checkHeader(tagSet[0].tagFormat, length, tagSet)
+
+    def checkHeader(self, tagFormat, length, location):
+        if self.maxDepth is not None and self.depth > self.maxDepth:
+            raise error.DecodingLimitError(
+                'TLV nesting level exceeds %d at %s' % (self.maxDepth, location))
+
+        self.components += 1
+
+        if (self.maxComponents is not None and
+                self.components > self.maxComponents):
+            raise error.DecodingLimitError(
+                'Number of TLVs exceeds %d at %s' % (self.maxComponents, location))
+
+        if length == -1:
+            return
+
+        self.checkValueLength(location, length)
+
+        if tagFormat == tag.tagFormatSimple:
+            self.totalLength += length
+
+            if (self.maxTotalLength is not None and
+                    self.totalLength > self.maxTotalLength):
+                raise error.DecodingLimitError(
+                    'Total values length exceeds %d at %s' % (
+                        self.maxTotalLength, location))
+
+    def checkValueLength(self, location, length):
+        if self.maxValueLength is not None and length > self.maxValueLength:
+            raise error.DecodingLimitError(
+                'Value length %d exceeds %d at %s' % (
+                    length, self.maxValueLength, location))
+
+
 class SingleItemDecoder(object):
     defaultErrorState = stErrorCondition
     #defaultErrorState = stDumpRawValue
@@ -1480,16 +1775,17 @@ class SingleItemDecoder(object):
 
     supportIndefLength = True
 
+    # encoding rules decoded objects may be later re-encoded under
+    # without actually running the encoder
+    encodingRules = 'ber'
+
     TAG_MAP = TAG_MAP
     TYPE_MAP = TYPE_MAP
 
     def __init__(self, **options):
         self._tagMap = options.get('tagMap', self.TAG_MAP)
         self._typeMap = options.get('typeMap', self.TYPE_MAP)
-
-        # Tag & TagSet objects caches
-        self._tagCache = {}
-        self._tagSetCache = {}
+        self._dispatchTable = _getDispatchTable(self._tagMap)
 
     def __call__(self, substrate, asn1Spec=None,
                  tagSet=None, length=None, state=stDecodeTag,
@@ -1498,6 +1794,13 @@ class SingleItemDecoder(object):
 
         allowEoo = options.pop('allowEoo', False)
 
+        try:
+            limits = options['decodingLimits']
+
+        except KeyError:
+            # nested invocations share resource counters of the top-level one
+            limits = options['decodingLimits'] = DecodingLimits.fromOptions(options)
+
         if LOG:
             LOG('decoder called at scope %s with state %d, working with up '
                 'to %s octets of substrate: '
@@ -1521,37 +1824,47 @@ class SingleItemDecoder(object):
 
         tagMap = self._tagMap
         typeMap = self._typeMap
-        tagCache = self._tagCache
-        tagSetCache = self._tagSetCache
+
+        # identifier octet of a lone short tag, if that is all there is
+        # to the tag set
+        dispatchOctet = None
 
         value = noValue
 
-        substrate.markedPosition = substrate.tell()
+        substrate.markedPosition = headerPosition = substrate.tell()
+
+        # Complete in-memory substrate is read by index, bypassing
+        # the resumable stream reading protocol
+        if substrate.__class__ is MemoryViewStream:
+            view = substrate.getbuffer()
+
+        else:
+            view = None
 
         while state is not stStop:
 
             if state is stDecodeTag:
                 # Decode tag
-                isShortTag = True
+                if view is not None:
+                    try:
+                        tagClass, tagFormat, tagId, offset, length = decodeHeader(
+                            view, substrate.tell())
 
-                for firstByte in readFromStream(substrate, 1, options):
-                    if isinstance(firstByte, SubstrateUnderrunError):
-                        yield firstByte
+                    except SubstrateUnderrunError:
+                        # let the stream reading code report it
+                        view = None
 
-                firstOctet = ord(firstByte)
+                if view is None:
+                    for firstByte in readFromStream(substrate, 1, options):
+                        if isinstance(firstByte, SubstrateUnderrunError):
+                            yield firstByte
 
-                try:
-                    lastTag = tagCache[firstOctet]
+                    firstOctet = ord(firstByte)
 
-                except KeyError:
-                    integerTag = firstOctet
-                    tagClass = integerTag & 0xC0
-                    tagFormat = integerTag & 0x20
-                    tagId = integerTag & 0x1F
-
-                    if tagId == 0x1F:
-                        isShortTag = False
-                        lengthOctetIdx = 0
+                    if firstOctet & 0x1F == 0x1F:
+                        tagClass = firstOctet & 0xC0
+                        tagFormat = firstOctet & 0x20
+                        firstOctet = None
                         tagId = 0
 
                         while True:
@@ -1565,40 +1878,53 @@ class SingleItemDecoder(object):
                                 )
 
                             integerTag = ord(integerByte)
-                            lengthOctetIdx += 1
                             tagId <<= 7
                             tagId |= (integerTag & 0x7F)
 
                             if not integerTag & 0x80:
                                 break
 
+                elif tagId < 0x1F:
+                    firstOctet = tagClass | tagFormat | tagId
+
+                else:
+                    firstOctet = None
+
+                if firstOctet is None:
+                    # long tags are not tabulated
                     lastTag = tag.Tag(
                         tagClass=tagClass, tagFormat=tagFormat, tagId=tagId
                     )
 
-                    if isShortTag:
-                        # cache short tags
-                        tagCache[firstOctet] = lastTag
-
-                if tagSet is None:
-                    if isShortTag:
-                        try:
-                            tagSet = tagSetCache[firstOctet]
+                    if tagSet is None:
+                        tagSet = tag.TagSet((), lastTag)
 
-                        except KeyError:
-                            # base tag not recovered
-                            tagSet = tag.TagSet((), lastTag)
-                            tagSetCache[firstOctet] = tagSet
                     else:
-                        tagSet = tag.TagSet((), lastTag)
+                        tagSet = lastTag + tagSet
+
+                elif tagSet is None:
+                    tagSet = SHORT_TAG_SETS[firstOctet]
+                    dispatchOctet = firstOctet
 
                 else:
-                    tagSet = lastTag + tagSet
+                    tagSet = SHORT_TAGS[firstOctet] + tagSet
 
-                state = stDecodeLength
+                if view is None:
+                    state = stDecodeLength
 
-                if LOG:
-                    LOG('tag decoded into %s, decoding length' % tagSet)
+                    if LOG:
+                        LOG('tag decoded into %s, decoding length' % tagSet)
+
+                else:
+                    substrate.seek(offset, os.SEEK_SET)
+
+                    if length == -1 and not self.supportIndefLength:
+                        raise error.PyAsn1Error('Indefinite length encoding not supported by this codec')
+
+                    state = stGetValueDecoder
+
+                    if LOG:
+                        LOG('tag decoded into %s, value length decoded into %d' % (tagSet, length))
 
             if state is stDecodeLength:
                 # Decode length
@@ -1643,6 +1969,9 @@ class SingleItemDecoder(object):
                     LOG('value length decoded into %d' % length)
 
             if state is stGetValueDecoder:
+                if limits is not None:
+                    limits.checkTlv(tagSet, length)
+
                 if asn1Spec is None:
                     state = stGetValueDecoderByTag
 
@@ -1665,26 +1994,28 @@ class SingleItemDecoder(object):
             # from the wire.
             #
             if state is stGetValueDecoderByTag:
-                try:
-                    concreteDecoder = tagMap[tagSet]
-
-                except KeyError:
-                    concreteDecoder = None
-
-                if concreteDecoder:
-                    state = stDecodeValue
+                if dispatchOctet is not None:
+                    concreteDecoder = self._dispatchTable[dispatchOctet]
 
                 else:
                     try:
-                        concreteDecoder = tagMap[tagSet[:1]]
+                        concreteDecoder = tagMap[tagSet]
 
                     except KeyError:
                         concreteDecoder = None
 
-                    if concreteDecoder:
-                        state = stDecodeValue
-                    else:
-                        state = stTryAsExplicitTag
+                    if not concreteDecoder:
+                        try:
+                            concreteDecoder = tagMap[tagSet[:1]]
+
+                        except KeyError:
+                            concreteDecoder = None
+
+                if concreteDecoder:
+                    state = stDecodeValue
+
+                else:
+                    state = stTryAsExplicitTag
 
                 if LOG:
                     LOG('codec %s chosen by a built-in type, decoding %s' % (concreteDecoder and concreteDecoder.__class__.__name__ or "<none>", state is stDecodeValue and 'value' or 'as explicit tag'))
@@ -1761,7 +2092,21 @@ class SingleItemDecoder(object):
 
                 original_position = substrate.tell()
 
-                if length == -1:  # indef length
+                if (view is not None and length != -1 and
+                        not substrateFun and
+                        concreteDecoder.primitiveValueDecoder is not None and
+                        tagSet[0].tagFormat == tag.tagFormatSimple and
+                        original_position + length <= len(view)):
+                    value = concreteDecoder.primitiveValueDecoder(
+                        view[original_position:original_position + length].tobytes(),
+                        asn1Spec, tagSet, **options)
+
+                    substrate.seek(original_position + length, os.SEEK_SET)
+
+                elif length == -1:  # indef length
+                    if limits is not None:
+                        limits.depth += 1
+
                     for value in concreteDecoder.indefLenValueDecoder(
                             substrate, asn1Spec,
                             tagSet, length, stGetValueDecoder,
@@ -1769,7 +2114,13 @@ class SingleItemDecoder(object):
                         if isinstance(value, SubstrateUnderrunError):
                             yield value
 
+                    if limits is not None:
+                        limits.depth -= 1
+
                 else:
+                    if limits is not None:
+                        limits.depth += 1
+
                     for value in concreteDecoder.valueDecoder(
                             substrate, asn1Spec,
                             tagSet, length, stGetValueDecoder,
@@ -1777,11 +2128,21 @@ class SingleItemDecoder(object):
                         if isinstance(value, SubstrateUnderrunError):
                             yield value
 
+                    if limits is not None:
+                        limits.depth -= 1
+
                     bytesRead = substrate.tell() - original_position
                     if bytesRead != length:
                         raise PyAsn1Error(
                             "Read %s bytes instead of expected %s." % (bytesRead, length))
 
+                if (isinstance(value, base.ConstructedAsn1Type) and
+                        options.get('keepSubstrate', False) and
+                        isinstance(substrate, MemoryViewStream)):
+                    # slicing Python 2 mmap makes a copy
+                    value._substrate = self.encodingRules, memoryview(
+                        substrate.getbuffer()[headerPosition:substrate.tell()])
+
                 if LOG:
                    LOG('codec %s yields type %s, value:\n%s\n...' % (
                        concreteDecoder.__class__.__name__, value.__class__.__name__,
@@ -1835,7 +2196,9 @@ class StreamingDecoder(object):
     Parameters
     ----------
     substrate: :py:class:`file`, :py:class:`io.BytesIO`
-        BER/CER/DER serialization in form of a byte stream
+        BER/CER/DER serialization in form of a byte stream or an in-memory
+        buffer (:py:class:`bytearray`, :py:class:`memoryview`,
+        :py:class:`mmap.mmap`) which is read in place
 
     Keyword Args
     ------------
@@ -1846,6 +2209,33 @@ class StreamingDecoder(object):
         me required is that ASN.1 structure is encoded in the *IMPLICIT*
         tagging mode.
 
+    maxLookback: :py:class:`int`
+        Maximum number of octets to buffer for backtracking while
+        reading non-seekable `substrate`, unlimited by default
+
+    keepSubstrate: :py:class:`bool`
+        If :obj:`True`, decoded constructed objects refer to the part of
+        in-memory `substrate` they have been decoded from, see
+        :py:attr:`~pyasn1.type.base.ConstructedAsn1Type.substrate`
+
+    maxDepth: :py:class:`int`
+        Maximum TLV nesting level, top-level TLV being at level 0
+
+    maxComponents: :py:class:`int`
+        Maximum number of TLVs making up one top-level ASN.1 object
+
+    maxValueLength: :py:class:`int`
+        Maximum length of any TLV value, including values of constructed
+        strings assembled from fragments
+
+    maxTotalLength: :py:class:`int`
+        Maximum summary length of primitive TLV values making up one
+        top-level ASN.1 object
+
+    All limits are checked as soon as each TLV header is read and
+    :py:class:`~pyasn1.error.DecodingLimitError` is raised on violation.
+    Limits are unset by default.
+
     Yields
     ------
     : :py:class:`~pyasn1.type.base.PyAsn1Item`, :py:class:`~pyasn1.error.SubstrateUnderrunError`
@@ -1864,9 +2254,10 @@ class StreamingDecoder(object):
 
     Raises
     ------
-    ~pyasn1.error.PyAsn1Error, ~pyasn1.error.EndOfStreamError
+    ~pyasn1.error.PyAsn1Error, ~pyasn1.error.EndOfStreamError, ~pyasn1.error.DecodingLimitError
         `PyAsn1Error` on deserialization error, `EndOfStreamError` on
-         premature stream closure.
+         premature stream closure, `DecodingLimitError` on exceeding
+         any of the configured limits.
 
     Examples
     --------
@@ -1904,7 +2295,8 @@ class StreamingDecoder(object):
 
     def __init__(self, substrate, asn1Spec=None, **options):
         self._singleItemDecoder = self.SINGLE_ITEM_DECODER(**options)
-        self._substrate = asSeekableStream(substrate)
+        self._substrate = asSeekableStream(
+            substrate, maxLookback=options.get('maxLookback'))
         self._asn1Spec = asn1Spec
         self._options = options
 
@@ -1923,89 +2315,2395 @@ class StreamingDecoder(object):
             if chunk:
                 break
 
-
-class Decoder(object):
-    """Create a BER decoder object.
-
-    Parse BER/CER/DER octet-stream into one, possibly nested, ASN.1 object.
-    """
-    STREAMING_DECODER = StreamingDecoder
-
     @classmethod
-    def __call__(cls, substrate, asn1Spec=None, **options):
-        """Turns BER/CER/DER octet stream into an ASN.1 object.
+    def fromPath(cls, path, asn1Spec=None, **options):
+        """Turn BER/CER/DER serialization stored in a file into ASN.1 objects.
 
-        Takes BER/CER/DER octet-stream in form of :py:class:`bytes` (Python 3)
-        or :py:class:`str` (Python 2) and decode it into an ASN.1 object
-        (e.g. :py:class:`~pyasn1.type.base.PyAsn1Item` derivative) which
-        may be a scalar or an arbitrary nested structure.
+        The file gets memory-mapped read-only and decoded right out of
+        the mapping, so the operating system page cache is used in place
+        of file reads. Top-level ASN.1 objects are yielded one by one
+        while decoding proceeds.
 
         Parameters
         ----------
-        substrate: :py:class:`bytes` (Python 3) or :py:class:`str` (Python 2)
-            BER/CER/DER octet-stream to parse
+        path: :py:class:`str`
+            Path to a file holding one or more concatenated BER/CER/DER
+            serializations
 
         Keyword Args
         ------------
         asn1Spec: :py:class:`~pyasn1.type.base.PyAsn1Item`
-            A pyasn1 type object (:py:class:`~pyasn1.type.base.PyAsn1Item`
-            derivative) to act as a template guiding the decoder.
-            Depending on the ASN.1 structure being decoded, `asn1Spec` may or
-            may not be required. Most common reason for it to require is that
-            ASN.1 structure is encoded in *IMPLICIT* tagging mode.
+            A pyasn1 type object to act as a template guiding the decoder
 
-        Returns
-        -------
-        : :py:class:`tuple`
-            A tuple of :py:class:`~pyasn1.type.base.PyAsn1Item` object
-            recovered from BER/CER/DER substrate and the unprocessed trailing
-            portion of the `substrate` (may be empty)
+        Yields
+        ------
+        : :py:class:`~pyasn1.type.base.PyAsn1Item`
+            Decoded ASN.1 object (possibly, nested)
 
         Raises
         ------
-        : :py:class:`~pyasn1.error.PyAsn1Error`
-            :py:class:`~pyasn1.error.SubstrateUnderrunError` on insufficient
-            input or :py:class:`~pyasn1.error.PyAsn1Error` on decoding error.
+        ~pyasn1.error.PyAsn1Error, ~pyasn1.error.SubstrateUnderrunError, ~pyasn1.error.EndOfStreamError
+            `PyAsn1Error` on deserialization error, `SubstrateUnderrunError`
+             or `EndOfStreamError` on truncated file.
 
         Examples
         --------
-        Decode BER/CER/DER serialisation without ASN.1 schema
 
         .. code-block:: pycon
 
-           >>> s, unprocessed = decode(b'0\t\x02\x01\x01\x02\x01\x02\x02\x01\x03')
-           >>> str(s)
-           SequenceOf:
-            1 2 3
+            >>> for crl in StreamingDecoder.fromPath('crls.der', asn1Spec=CertificateList()):
+            ...     print(crl['tbsCertList']['issuer'])
 
-        Decode BER/CER/DER serialisation with ASN.1 schema
+        """
+        with open(path, 'rb') as source:
+            # empty files can not be mapped
+            if not os.fstat(source.fileno()).st_size:
+                return
 
-        .. code-block:: pycon
+            substrate = mmap.mmap(
+                source.fileno(), 0, access=mmap.ACCESS_READ)
 
-           >>> seq = SequenceOf(componentType=Integer())
-           >>> s, unprocessed = decode(
-                b'0\t\x02\x01\x01\x02\x01\x02\x02\x01\x03', asn1Spec=seq)
-           >>> str(s)
-           SequenceOf:
-            1 2 3
+        try:
+            streamingDecoder = cls(substrate, asn1Spec, **options)
 
-        """
-        substrate = asSeekableStream(substrate)
+            try:
+                for asn1Object in streamingDecoder:
+                    if isinstance(asn1Object, SubstrateUnderrunError):
+                        raise error.SubstrateUnderrunError(
+                            'Short substrate on input')
 
-        streamingDecoder = cls.STREAMING_DECODER(
-            substrate, asn1Spec, **options)
+                    yield asn1Object
 
-        for asn1Object in streamingDecoder:
-            if isinstance(asn1Object, SubstrateUnderrunError):
-                raise error.SubstrateUnderrunError('Short substrate on input')
+            finally:
+                streamingDecoder._substrate.close()
 
+        finally:
             try:
-                tail = next(readFromStream(substrate))
+                substrate.close()
 
-            except error.EndOfStreamError:
-                tail = null
+            except BufferError:
+                # original serializations kept by decoded objects refer
+                # to the mapping, it gets unmapped along with them
+                pass
 
-            return asn1Object, tail
+
+class SubstrateIndex(object):
+    """Flat index of BER/CER/DER TLVs.
+
+    Each TLV found in the substrate takes one row. Rows are laid out
+    in the order TLVs occur in the substrate, columns are kept in
+    :py:class:`array.array` objects:
+
+    * `depths` - TLV nesting level, 0 for top-level TLVs
+    * `tags` - tag class and tag format octet bits
+    * `tagIds` - tag ID
+    * `headerOffsets` - position of the first tag octet
+    * `contentOffsets` - position of the first value octet
+    * `lengths` - value length (for indefinite length encoding
+      not including end-of-octets sentinel)
+    * `descendants` - number of TLVs nested into this one
+
+    Examples
+    --------
+
+    .. code-block:: pycon
+
+        >>> index = indexSubstrate(b'0\t\x02\x01\x01\x02\x01\x02\x02\x01\x03')
+        >>> index[0]
+        (0, 0, 32, 16, 0, 2, 9)
+        >>> [index[x][5] for x in index.children(0)]
+        [4, 7, 10]
+    """
+    def __init__(self):
+        self.depths = array.array('L')
+        self.tags = array.array('B')
+        self.tagIds = array.array('L')
+        self.headerOffsets = array.array(_OFFSET_TYPECODE)
+        self.contentOffsets = array.array(_OFFSET_TYPECODE)
+        self.lengths = array.array(_OFFSET_TYPECODE)
+        self.descendants = array.array('L')
+
+    def __len__(self):
+        return len(self.depths)
+
+    def __getitem__(self, row):
+        """Return TLV description.
+
+        Parameters
+        ----------
+        row: :py:class:`int`
+            Row number
+
+        Returns
+        -------
+        : :py:class:`tuple`
+            TLV depth, tag class, tag format, tag ID, header offset,
+            content offset and value length
+        """
+        tags = self.tags[row]
+
+        return (self.depths[row], tags & 0xC0, tags & 0x20, self.tagIds[row],
+                self.headerOffsets[row], self.contentOffsets[row],
+                self.lengths[row])
+
+    def children(self, row=None):
+        """Iterate over TLVs immediately nested into the given one.
+
+        Parameters
+        ----------
+        row: :py:class:`int`
+            Row number of constructed TLV, top-level TLVs are iterated
+            over if not given
+
+        Returns
+        -------
+        : :py:class:`iterator`
+            Row numbers of child TLVs
+        """
+        if row is None:
+            child, end = 0, len(self.depths)
+
+        else:
+            child, end = row + 1, row + self.descendants[row] + 1
+
+        while child < end:
+            yield child
+
+            child += self.descendants[child] + 1
+
+    def append(self, depth, tags, tagId, headerOffset, contentOffset, length):
+        self.depths.append(depth)
+        self.tags.append(tags)
+        self.tagIds.append(tagId)
+        self.headerOffsets.append(headerOffset)
+        self.contentOffsets.append(contentOffset)
+        self.lengths.append(length)
+        self.descendants.append(0)
+
+
+def indexSubstrate(substrate, offset=0, maxDepth=None):
+    """Index TLVs of BER/CER/DER serialization.
+
+    Walks all TLV headers of one or more consecutive TLVs found in
+    `substrate` without decoding values and without creating any
+    ASN.1 objects. Along the way, TLVs framing gets checked for
+    integrity.
+
+    Parameters
+    ----------
+    substrate: :py:class:`bytes`, :py:class:`bytearray`, :py:class:`memoryview` or :py:class:`mmap.mmap`
+        BER/CER/DER serialization
+
+    Keyword Args
+    ------------
+    offset: :py:class:`int`
+        Position to start indexing from
+
+    maxDepth: :py:class:`int`
+        Maximum TLV nesting level, top-level TLV being at level 0.
+        Unlimited by default.
+
+    Returns
+    -------
+    : :py:class:`SubstrateIndex`
+        TLVs index
+
+    Raises
+    ------
+    ~pyasn1.error.PyAsn1Error, ~pyasn1.error.SubstrateUnderrunError
+        On broken TLV framing or too deep nesting
+    """
+    if isinstance(substrate, univ.OctetString):
+        substrate = substrate.asOctets()
+
+    try:
+        substrate = memoryview(substrate)
+
+    except TypeError:
+        raise error.UnsupportedSubstrateError(
+            'Cannot index ' + substrate.__class__.__name__)
+
+    index = SubstrateIndex()
+
+    substrateLength = len(substrate)
+
+    # rows, ends (None for indefinite length) and nearest definite
+    # length ends (None for top-level) of enclosing TLVs
+    containers = []
+
+    while True:
+        while containers:
+            row, end, limit = containers[-1]
+
+            if end is None or offset < end:
+                break
+
+            containers.pop()
+
+            index.descendants[row] = len(index) - row - 1
+
+        if offset >= substrateLength:
+            if containers:
+                raise error.SubstrateUnderrunError(
+                    'Missing end-of-octets sentinel at %s' % offset)
+
+            break
+
+        if containers:
+            limit = containers[-1][2]
+
+        else:
+            limit = None
+
+        if (containers and containers[-1][1] is None and
+                substrate[offset:offset + 2].tobytes() == EOO_SENTINEL):
+            if limit is not None and offset + 2 > limit:
+                raise error.PyAsn1Error(
+                    'End-of-octets sentinel at %s overruns its enclosing '
+                    'TLV' % offset)
+
+            row, end, limit = containers.pop()
+
+            index.lengths[row] = offset - index.contentOffsets[row]
+            index.descendants[row] = len(index) - row - 1
+
+            offset += 2
+
+            continue
+
+        if maxDepth is not None and len(containers) > maxDepth:
+            raise error.DecodingLimitError(
+                'TLV nesting level exceeds %d at %s' % (maxDepth, offset))
+
+        tagClass, tagFormat, tagId, contentOffset, length = decodeHeader(
+            substrate, offset)
+
+        if not (tagClass or tagFormat or tagId):
+            raise error.PyAsn1Error(
+                'Unexpected end-of-octets sentinel at %s' % offset)
+
+        if tagId > _MAX_TAG_ID:
+            raise error.PyAsn1Error(
+                'Tag ID %s at %s is out of range' % (tagId, offset))
+
+        if length == -1:
+            if not tagFormat:
+                raise error.PyAsn1Error(
+                    'Indefinite length encoding of primitive value '
+                    'at %s' % offset)
+
+            end = None
+
+            if limit is not None and contentOffset > limit:
+                raise error.PyAsn1Error(
+                    'TLV at %s overruns its enclosing TLV' % offset)
+
+        else:
+            end = contentOffset + length
+
+            if end > substrateLength:
+                raise error.SubstrateUnderrunError(
+                    '%d-octet short at %s' % (end - substrateLength, offset))
+
+            if limit is not None and end > limit:
+                raise error.PyAsn1Error(
+                    'TLV at %s overruns its enclosing TLV' % offset)
+
+        index.append(len(containers), tagClass | tagFormat, tagId,
+                     offset, contentOffset, max(length, 0))
+
+        row = len(index) - 1
+
+        if end is None:
+            containers.append((row, None, limit))
+
+            offset = contentOffset
+
+            continue
+
+        if tagFormat:
+            containers.append((row, end, end))
+
+            offset = contentOffset
+
+        else:
+            offset = end
+
+    return index
+
+
+(planGeneric,
+ planScalar,
+ planSequence,
+ planSet,
+ planSequenceOf,
+ planChoice) = [x for x in range(6)]
+
+
+# what to do with the components named in decoding filter
+(filterSkip,
+ filterRaw) = [x for x in range(2)]
+
+
+class DecodingPlan(object):
+    """Precomputed decoding instructions for one ASN.1 schema node."""
+    def __init__(self, asn1Spec):
+        self.asn1Spec = asn1Spec
+        self.kind = planGeneric
+        # tags of the EXPLICIT tagging layers, outermost first
+        self.outerKeys = ()
+        # tag of the value TLV itself
+        self.innerKey = None
+        # tags this node may start with on the wire (None for any)
+        self.keys = None
+        self.concreteDecoder = None
+        self.components = ()
+        # names of SEQUENCE, SET and CHOICE components
+        self.names = ()
+        self.optional = ()
+        self.positions = None
+        self.requiredComponents = frozenset()
+        self.openTypes = ()
+
+
+class CompiledDecoder(object):
+    """Create a BER decoder specialized for one ASN.1 schema.
+
+    Walks `asn1Spec` once and precomputes what the generic decoder
+    would otherwise figure out for every component of every message:
+    the tags expected on the wire, the payload decoder of each scalar
+    component, the way OPTIONAL/DEFAULT and SET components as well as
+    CHOICE alternatives map onto the wire tags and the open types to
+    resolve.
+
+    The resulting object decodes complete in-memory BER/CER/DER
+    serializations of `asn1Spec`. The parts of the schema that can not
+    be planned in advance (e.g. ANY type) are handed over to the
+    generic decoder.
+
+    Parameters
+    ----------
+    asn1Spec: :py:class:`~pyasn1.type.base.PyAsn1Item`
+        A pyasn1 type object to specialize the decoder for
+
+    Keyword Args
+    ------------
+    tagMap, typeMap: :py:class:`dict`
+        Payload decoders to use instead of the codec defaults
+
+    lazy: :py:class:`bool`
+        If :obj:`True`, definite length constructed components are not
+        decoded until first accessed
+
+    keepSubstrate: :py:class:`bool`
+        If :obj:`True`, decoded constructed objects refer to the part of
+        `substrate` they have been decoded from
+
+    skipComponents: :py:class:`list`
+        Dot-separated paths to the components to skip over by length
+        leaving them absent in the decoded object. SEQUENCE OF/SET OF
+        components are referred to by position or by `*` standing for
+        all of them e.g. `records.*.signature`
+
+    rawComponents: :py:class:`list`
+        Dot-separated paths to the components to capture as
+        :py:class:`~pyasn1.type.univ.Any` objects holding complete
+        component serialization rather than decode
+
+    Examples
+    --------
+    Decode many BER serialisations of the same schema
+
+    .. code-block:: pycon
+
+        >>> seq = SequenceOf(componentType=Integer())
+        >>> decodeSeq = CompiledDecoder(seq)
+        >>> s, unprocessed = decodeSeq(b'0\t\x02\x01\x01\x02\x01\x02\x02\x01\x03')
+        >>> str(s)
+        SequenceOf:
+         1 2 3
+    """
+
+    SINGLE_ITEM_DECODER = SingleItemDecoder
+
+    def __init__(self, asn1Spec, **options):
+        self._singleItemDecoder = self.SINGLE_ITEM_DECODER(**options)
+        self._tagMap = options.get('tagMap', self._singleItemDecoder.TAG_MAP)
+        self._typeMap = options.get('typeMap', self._singleItemDecoder.TYPE_MAP)
+        self._supportIndefLength = self._singleItemDecoder.supportIndefLength
+        self._encodingRules = self._singleItemDecoder.encodingRules
+        self._plans = {}
+        self._plan = self._compile(asn1Spec)
+        self._options = self._addComponentFilter(options)
+
+        if LOG:
+            LOG('compiled decoding plan for %s' % asn1Spec.prettyPrintType())
+
+    def __call__(self, substrate, **options):
+        """Turns BER/CER/DER octet stream into an ASN.1 object.
+
+        Parameters
+        ----------
+        substrate: :py:class:`bytes` (Python 3) or :py:class:`str` (Python 2)
+            BER/CER/DER octet-stream to parse, :py:class:`bytearray`,
+            :py:class:`memoryview` and :py:class:`mmap.mmap` are read
+            in place
+
+        Returns
+        -------
+        : :py:class:`tuple`
+            A tuple of :py:class:`~pyasn1.type.base.PyAsn1Item` object
+            recovered from BER/CER/DER substrate and the unprocessed trailing
+            portion of the `substrate` (may be empty)
+
+        Raises
+        ------
+        : :py:class:`~pyasn1.error.PyAsn1Error`
+            :py:class:`~pyasn1.error.SubstrateUnderrunError` on insufficient
+            input or :py:class:`~pyasn1.error.PyAsn1Error` on decoding error.
+        """
+        return self._decode(substrate, self._mergeOptions(options))
+
+    def decodeMany(self, substrates, **options):
+        """Turns many independent BER/CER/DER octet streams into ASN.1 objects.
+
+        Parameters
+        ----------
+        substrates:
+            Iterable of BER/CER/DER octet-streams to parse
+
+        Yields
+        ------
+        : :py:class:`tuple`, :py:class:`~pyasn1.error.PyAsn1Error`
+            For each of the `substrates`, in order, either a tuple of
+            recovered ASN.1 object and the unprocessed trailing portion
+            of the substrate or the exception object describing
+            decoding failure
+        """
+        # resolve per-call options once for all substrates
+        options = self._mergeOptions(options)
+
+        for substrate in substrates:
+            try:
+                result = self._decode(substrate, options)
+
+            except error.PyAsn1Error:
+                result = sys.exc_info()[1]
+
+            yield result
+
+    def extract(self, substrate, paths, **options):
+        """Decode only the requested components of BER/CER/DER serialization.
+
+        Serializations of the components not lying on the requested
+        paths are skipped by length, nothing gets decoded out of them.
+
+        Parameters
+        ----------
+        substrate: :py:class:`bytes` (Python 3) or :py:class:`str` (Python 2)
+            BER/CER/DER octet-stream to parse
+
+        paths: :py:class:`list`
+            Dot-separated component names relative to `asn1Spec`.
+            SEQUENCE OF/SET OF components are referred to by position
+            e.g. `tbsCertificate.extensions.0.extnID`
+
+        Returns
+        -------
+        : :py:class:`dict`
+            Fully decoded ASN.1 objects keyed by requested path. Paths
+            to the components absent in `substrate` (e.g. OPTIONAL
+            components or CHOICE alternatives) are not included.
+
+        Raises
+        ------
+        : :py:class:`~pyasn1.error.PyAsn1Error`
+            :py:class:`~pyasn1.error.SubstrateUnderrunError` on insufficient
+            input or :py:class:`~pyasn1.error.PyAsn1Error` on decoding error
+            or unknown component name.
+        """
+        substrate = self._asMemoryView(substrate)
+
+        options = self._mergeOptions(options)
+
+        tree = {}
+
+        for path in paths:
+            names = path.split('.')
+
+            node = tree
+
+            for name in names[:-1]:
+                node = node.setdefault(name, [None, {}])[1]
+
+            node.setdefault(names[-1], [None, {}])[0] = path
+
+        results = {}
+
+        self._extractComponents(
+            self._plan, substrate, 0, tree, results,
+            self._addDecodingLimits(options))
+
+        return results
+
+    def _decode(self, substrate, options):
+        substrate = self._asMemoryView(substrate)
+
+        asn1Object, offset = self._decodeComponent(
+            self._plan, substrate, 0, self._addDecodingLimits(options))
+
+        return asn1Object, substrate[offset:].tobytes()
+
+    @staticmethod
+    def _addDecodingLimits(options):
+        # resource counters are per top-level TLV
+        limits = DecodingLimits.fromOptions(options)
+
+        if limits is None:
+            return options
+
+        return dict(options, decodingLimits=limits)
+
+    def _mergeOptions(self, options):
+        if not options:
+            return self._options
+
+        options = dict(self._options, **options)
+
+        if 'skipComponents' in options or 'rawComponents' in options:
+            options.pop('componentFilter', None)
+            options = self._addComponentFilter(options)
+
+        return options
+
+    def _addComponentFilter(self, options):
+        skipPaths = options.get('skipComponents') or ()
+        rawPaths = options.get('rawComponents') or ()
+
+        if not skipPaths and not rawPaths:
+            return options
+
+        tree = {}
+
+        for action, paths in ((filterSkip, skipPaths), (filterRaw, rawPaths)):
+            for path in paths:
+                names = path.split('.')
+
+                node = tree
+
+                for name in names[:-1]:
+                    node = node.setdefault(name, [None, {}])[1]
+
+                node = node.setdefault(names[-1], [None, {}])
+
+                if node[0] is not None and node[0] != action:
+                    raise error.PyAsn1Error(
+                        'Component %s is both skipped and captured' % path)
+
+                node[0] = action
+
+        self._checkComponentFilter(self._plan, tree)
+
+        return dict(options, componentFilter=tree)
+
+    def _checkComponentFilter(self, plan, tree):
+        kind = plan.kind
+
+        if kind not in (planSequence, planSet, planSequenceOf, planChoice):
+            raise error.PyAsn1Error(
+                'Can not filter components %s out of %r' % (
+                    ', '.join(tree), plan.asn1Spec))
+
+        for name, (action, subtree) in tree.items():
+            if kind is planSequenceOf:
+                if name != '*' and not name.isdigit():
+                    raise error.PyAsn1Error(
+                        'Bad %r component position %s' % (plan.asn1Spec, name))
+
+                componentPlan = plan.components[0]
+
+            else:
+                try:
+                    componentPlan = plan.components[plan.names.index(name)]
+
+                except ValueError:
+                    raise error.PyAsn1Error(
+                        'Unknown %r component %s' % (plan.asn1Spec, name))
+
+            if action is None:
+                self._checkComponentFilter(componentPlan, subtree)
+
+    def _decodeFilteredComponent(self, plan, substrate, offset, node, options):
+        action, subtree = node
+
+        if action is None:
+            return self._decodeComponent(
+                plan, substrate, offset, dict(options, componentFilter=subtree))
+
+        limits = options.get('decodingLimits')
+
+        if limits is not None:
+            tagClass, tagFormat, tagId, valueOffset, length = decodeHeader(
+                substrate, offset)
+
+            limits.checkHeader(tagFormat, length, offset)
+
+        end = self._skipComponent(substrate, offset)
+
+        if action is filterSkip:
+            return noValue, end
+
+        return univ.Any(substrate[offset:end].tobytes()), end
+
+    @staticmethod
+    def _asMemoryView(substrate):
+        if isinstance(substrate, univ.OctetString):
+            substrate = substrate.asOctets()
+
+        try:
+            return memoryview(substrate)
+
+        except TypeError:
+            raise error.UnsupportedSubstrateError(
+                'Cannot decode ' + substrate.__class__.__name__)
+
+    def _skipComponent(self, substrate, offset):
+        if not self._supportIndefLength:
+            tagClass, tagFormat, tagId, valueOffset, length = decodeHeader(
+                substrate, offset)
+
+            if length == -1:
+                raise error.PyAsn1Error(
+                    'Indefinite length encoding not supported by this codec')
+
+        return skipTlv(substrate, offset)
+
+    def _extractComponent(self, plan, substrate, offset, node, results, options):
+        path, tree = node
+
+        if path is None:
+            limits = options.get('decodingLimits')
+
+            if limits is not None:
+                depth = limits.depth
+
+            self._extractComponents(
+                plan, substrate, offset, tree, results, options)
+
+            if limits is not None:
+                limits.depth = depth
+
+            return
+
+        asn1Object, offset = self._decodeComponent(
+            plan, substrate, offset, options)
+
+        results[path] = asn1Object
+
+        if tree:
+            self._extractDecodedComponents(asn1Object, tree, results)
+
+    def _extractDecodedComponents(self, asn1Object, tree, results):
+        for name, (path, subtree) in tree.items():
+            if asn1Object.typeId in (univ.SequenceOf.typeId, univ.SetOf.typeId):
+                idx = int(name)
+
+                if idx >= len(asn1Object):
+                    continue
+
+                component = asn1Object[idx]
+
+            elif asn1Object.typeId == univ.Choice.typeId:
+                if name != asn1Object.getName():
+                    continue
+
+                component = asn1Object.getComponent()
+
+            else:
+                component = asn1Object[name]
+
+                if not component.isValue:
+                    continue
+
+            if path is not None:
+                results[path] = component
+
+            if subtree:
+                self._extractDecodedComponents(component, subtree, results)
+
+    def _extractComponents(self, plan, substrate, offset, tree, results, options):
+        kind = plan.kind
+
+        if kind not in (planSequence, planSet, planSequenceOf, planChoice):
+            raise error.PyAsn1Error(
+                'Can not extract components %s out of %r' % (
+                    ', '.join(tree), plan.asn1Spec))
+
+        limits = options.get('decodingLimits')
+
+        for outerKey in plan.outerKeys:
+            location = offset
+
+            tagClass, tagFormat, tagId, offset, length = decodeHeader(
+                substrate, offset)
+
+            if ((tagClass | tagId if tagId < 31 else (tagClass, tagId)) != outerKey or
+                    tagFormat != tag.tagFormatConstructed):
+                raise self._mismatch(plan.asn1Spec, substrate, location)
+
+            if limits is not None:
+                limits.checkHeader(tagFormat, length, location)
+                limits.depth += 1
+
+        if kind is planChoice:
+            try:
+                idx = plan.positions[self._peekTagKey(substrate, offset)]
+
+            except KeyError:
+                raise self._mismatch(plan.asn1Spec, substrate, offset)
+
+            namedTypes = plan.asn1Spec.componentType
+
+            for name in tree:
+                namedTypes.getPositionByName(name)
+
+            name = namedTypes.getNameByPosition(idx)
+
+            if name in tree:
+                self._extractComponent(
+                    plan.components[idx], substrate, offset, tree[name],
+                    results, options)
+
+            return
+
+        location = offset
+
+        tagClass, tagFormat, tagId, offset, length = decodeHeader(
+            substrate, offset)
+
+        if (tagClass | tagId if tagId < 31 else (tagClass, tagId)) != plan.innerKey:
+            raise self._mismatch(plan.asn1Spec, substrate, location)
+
+        if tagFormat != tag.tagFormatConstructed:
+            raise error.PyAsn1Error('Constructed tag format expected')
+
+        if limits is not None:
+            limits.checkHeader(tagFormat, length, location)
+            limits.depth += 1
+
+        if length == -1:
+            if not self._supportIndefLength:
+                raise error.PyAsn1Error(
+                    'Indefinite length encoding not supported by this codec')
+
+            end = None
+
+        else:
+            end = offset + length
+
+            if end > len(substrate):
+                raise error.SubstrateUnderrunError('Short substrate on input')
+
+        if kind is planSequenceOf:
+            try:
+                wanted = dict([(int(name), node) for name, node in tree.items()])
+
+            except ValueError:
+                raise error.PyAsn1Error(
+                    'Components of %r are referred to by position, not by '
+                    'name' % (plan.asn1Spec,))
+
+        else:
+            namedTypes = plan.asn1Spec.componentType
+
+            wanted = dict([(namedTypes.getPositionByName(name), node)
+                           for name, node in tree.items()])
+
+        idx = 0
+
+        while wanted:
+            if end is None:
+                if self._isEndOfOctets(substrate, offset):
+                    break
+
+            elif offset >= end:
+                break
+
+            if kind is planSequenceOf:
+                componentPlan = plan.components[0]
+
+            else:
+                idx = self._getComponentPosition(plan, substrate, offset, idx)
+                componentPlan = plan.components[idx]
+
+            if idx in wanted:
+                self._extractComponent(
+                    componentPlan, substrate, offset, wanted.pop(idx),
+                    results, options)
+
+            elif limits is not None:
+                tagClass, tagFormat, tagId, valueOffset, length = decodeHeader(
+                    substrate, offset)
+
+                limits.checkHeader(tagFormat, length, offset)
+
+            offset = self._skipComponent(substrate, offset)
+            idx += 1
+
+    @staticmethod
+    def _tagKey(singleTag):
+        if singleTag.tagId < 31:
+            return singleTag.tagClass | singleTag.tagId
+
+        return singleTag.tagClass, singleTag.tagId
+
+    @staticmethod
+    def _peekTagKey(substrate, offset):
+        try:
+            firstOctet = oct2int(substrate[offset])
+
+        except IndexError:
+            raise error.SubstrateUnderrunError(
+                'Short substrate for TLV header at %s' % offset)
+
+        if firstOctet & 0x1F != 0x1F:
+            return firstOctet & 0xDF
+
+        tagClass, tagFormat, tagId, offset, length = decodeHeader(
+            substrate, offset)
+
+        return tagClass, tagId
+
+    def _compile(self, asn1Spec):
+        try:
+            return self._plans[id(asn1Spec)]
+
+        except KeyError:
+            pass
+
+        plan = self._plans[id(asn1Spec)] = DecodingPlan(asn1Spec)
+
+        tagSet = asn1Spec.tagSet
+        typeId = asn1Spec.typeId
+
+        if tagSet:
+            plan.keys = frozenset([self._tagKey(tagSet[-1])])
+
+        try:
+            concreteDecoder = self._typeMap[typeId]
+
+        except KeyError:
+            baseTagSet = tag.TagSet(tagSet.baseTag, tagSet.baseTag)
+            concreteDecoder = self._tagMap.get(baseTagSet)
+
+        if concreteDecoder is None or typeId == univ.Any.typeId:
+            return plan
+
+        plan.concreteDecoder = concreteDecoder
+
+        superTags = tagSet.superTags
+
+        if typeId == univ.Choice.typeId:
+            if not isinstance(concreteDecoder, ChoicePayloadDecoder):
+                return plan
+
+            components = [self._compile(namedType.asn1Object)
+                          for namedType in asn1Spec.componentType.namedTypes]
+
+            positions = self._mapPositions(components)
+            if positions is None:
+                return plan
+
+            plan.components = components
+            plan.names = tuple(asn1Spec.componentType)
+            plan.positions = positions
+            plan.outerKeys = tuple([self._tagKey(x) for x in reversed(superTags)])
+
+            if not tagSet:
+                plan.keys = frozenset(positions)
+
+            plan.kind = planChoice
+
+            return plan
+
+        if not tagSet:
+            return plan
+
+        plan.outerKeys = tuple([self._tagKey(x) for x in reversed(superTags[1:])])
+        plan.innerKey = self._tagKey(superTags[0])
+
+        if typeId in (univ.Sequence.typeId, univ.Set.typeId):
+            if (isinstance(concreteDecoder, ChoicePayloadDecoder) or
+                    not isinstance(concreteDecoder, ConstructedPayloadDecoderBase)):
+                return plan
+
+            namedTypes = asn1Spec.componentType
+
+            if not namedTypes:
+                return plan
+
+            components = [self._compile(namedType.asn1Object)
+                          for namedType in namedTypes.namedTypes]
+
+            if typeId == univ.Set.typeId:
+                positions = self._mapPositions(components)
+                if positions is None:
+                    return plan
+
+                plan.positions = positions
+                plan.kind = planSet
+
+            else:
+                plan.kind = planSequence
+
+            plan.components = components
+            plan.names = tuple(namedTypes)
+            plan.optional = tuple(
+                [namedType.isOptional or namedType.isDefaulted
+                 for namedType in namedTypes.namedTypes])
+            plan.requiredComponents = namedTypes.requiredComponents
+            plan.openTypes = tuple(
+                [(idx, namedType)
+                 for idx, namedType in enumerate(namedTypes.namedTypes)
+                 if namedType.openType])
+
+        elif typeId in (univ.SequenceOf.typeId, univ.SetOf.typeId):
+            if (not isinstance(concreteDecoder, ConstructedPayloadDecoderBase) or
+                    asn1Spec.componentType is None):
+                return plan
+
+            plan.components = (self._compile(asn1Spec.componentType),)
+            plan.kind = planSequenceOf
+
+        elif concreteDecoder.primitiveValueDecoder is not None:
+            plan.kind = planScalar
+
+        return plan
+
+    @staticmethod
+    def _mapPositions(components):
+        positions = {}
+
+        for idx, component in enumerate(components):
+            if component.keys is None:
+                return
+
+            for key in component.keys:
+                if key in positions:
+                    return
+
+                positions[key] = idx
+
+        return positions
+
+    @staticmethod
+    def _isEndOfOctets(substrate, offset):
+        return substrate[offset:offset + 2].tobytes() == EOO_SENTINEL
+
+    @staticmethod
+    def _mismatch(asn1Spec, substrate, offset):
+        tagClass, tagFormat, tagId, offset, length = decodeHeader(
+            substrate, offset)
+
+        tagSet = tag.TagSet((), tag.Tag(tagClass, tagFormat, tagId))
+
+        return error.PyAsn1Error(
+            '%s not in asn1Spec: %r' % (tagSet, asn1Spec))
+
+    def _decodeGeneric(self, plan, substrate, offset, options):
+        tagClass, tagFormat, tagId, valueOffset, length = decodeHeader(
+            substrate, offset)
+
+        if length == -1:
+            end = len(substrate)
+
+        else:
+            end = valueOffset + length
+
+        stream = MemoryViewStream(substrate[offset:end])
+
+        for asn1Object in self._singleItemDecoder(
+                stream, plan.asn1Spec, **options):
+            if isinstance(asn1Object, SubstrateUnderrunError):
+                raise error.SubstrateUnderrunError('Short substrate on input')
+
+        return asn1Object, offset + stream.tell()
+
+    def _decodeComponent(self, plan, substrate, offset, options):
+        kind = plan.kind
+
+        if kind is planGeneric:
+            return self._decodeGeneric(plan, substrate, offset, options)
+
+        start = offset
+        ends = []
+        lengths = []
+
+        for outerKey in plan.outerKeys:
+            tagClass, tagFormat, tagId, valueOffset, length = decodeHeader(
+                substrate, offset)
+
+            if ((tagClass | tagId if tagId < 31 else (tagClass, tagId)) != outerKey or
+                    tagFormat != tag.tagFormatConstructed):
+                raise self._mismatch(plan.asn1Spec, substrate, offset)
+
+            if length == -1:
+                if not self._supportIndefLength:
+                    raise error.PyAsn1Error(
+                        'Indefinite length encoding not supported by this codec')
+
+                ends.append(None)
+
+            else:
+                ends.append(valueOffset + length)
+
+            lengths.append((length, offset))
+
+            offset = valueOffset
+
+        limits = options.get('decodingLimits')
+
+        if limits is not None:
+            depth = limits.depth
+
+        if kind is planChoice:
+            if limits is not None:
+                self._checkOuterHeaders(limits, lengths)
+
+            asn1Object, offset = self._decodeChoice(
+                plan, substrate, offset, options)
+
+        else:
+            tagClass, tagFormat, tagId, valueOffset, length = decodeHeader(
+                substrate, offset)
+
+            if (tagClass | tagId if tagId < 31 else (tagClass, tagId)) != plan.innerKey:
+                raise self._mismatch(plan.asn1Spec, substrate, offset)
+
+            if length == -1 and not self._supportIndefLength:
+                raise error.PyAsn1Error(
+                    'Indefinite length encoding not supported by this codec')
+
+            if kind is planScalar:
+                if tagFormat != tag.tagFormatSimple or length == -1:
+                    # chunked string, let the generic decoder assemble it
+                    return self._decodeGeneric(plan, substrate, start, options)
+
+                if limits is not None:
+                    self._checkOuterHeaders(limits, lengths)
+                    limits.checkHeader(tagFormat, length, offset)
+
+                offset = valueOffset + length
+
+                if offset > len(substrate):
+                    raise error.SubstrateUnderrunError(
+                        'Short substrate on input')
+
+                asn1Object = plan.concreteDecoder.primitiveValueDecoder(
+                    substrate[valueOffset:offset].tobytes(), plan.asn1Spec,
+                    plan.asn1Spec.tagSet, **options)
+
+            else:
+                if tagFormat != tag.tagFormatConstructed:
+                    raise error.PyAsn1Error('Constructed tag format expected')
+
+                if limits is not None:
+                    self._checkOuterHeaders(limits, lengths)
+                    limits.checkHeader(tagFormat, length, offset)
+                    limits.depth += 1
+
+                if length != -1 and options.get('lazy', False):
+                    asn1Object, offset = self._decodeLazily(
+                        plan, substrate, valueOffset, length, options)
+
+                elif kind is planSequenceOf:
+                    asn1Object, offset = self._decodeSequenceOf(
+                        plan, substrate, valueOffset, length, options)
+
+                else:
+                    asn1Object, offset = self._decodeSequence(
+                        plan, substrate, valueOffset, length, options)
+
+        while ends:
+            end = ends.pop()
+
+            if end is None:
+                if not self._isEndOfOctets(substrate, offset):
+                    raise error.PyAsn1Error(
+                        'No end-of-octets sentinel at %s' % offset)
+
+                offset += 2
+
+            elif offset != end:
+                raise error.PyAsn1Error(
+                    'Read %s bytes instead of expected %s.' % (
+                        offset - start, end - start))
+
+        if limits is not None:
+            limits.depth = depth
+
+        if kind is not planScalar and (options.get('lazy', False) or
+                                       options.get('keepSubstrate', False)):
+            asn1Object._substrate = self._encodingRules, substrate[start:offset]
+
+        return asn1Object, offset
+
+    @staticmethod
+    def _checkOuterHeaders(limits, lengths):
+        for length, location in lengths:
+            limits.checkHeader(tag.tagFormatConstructed, length, location)
+            limits.depth += 1
+
+    def _decodeLazily(self, plan, substrate, offset, length, options):
+        end = offset + length
+
+        if end > len(substrate):
+            raise error.SubstrateUnderrunError('Short substrate on input')
+
+        if plan.kind is planSequenceOf:
+            decodeComponents = self._decodeSequenceOf
+
+        else:
+            decodeComponents = self._decodeSequence
+
+        limits = options.get('decodingLimits')
+
+        if limits is not None:
+            # deferred components are accounted for as if decoded in place
+            depth = limits.depth
+
+        def materialize():
+            if LOG:
+                LOG('decoding lazy %s at %s' % (plan.asn1Spec.__class__.__name__, offset))
+
+            if limits is not None:
+                limits.depth = depth
+
+            asn1Object, _ = decodeComponents(
+                plan, substrate, offset, length, options)
+
+            return asn1Object._componentValues
+
+        asn1Object = plan.asn1Spec.clone()
+
+        del asn1Object._componentValues
+
+        asn1Object._lazyComponents = materialize
+
+        return asn1Object, end
+
+    def _decodeChoice(self, plan, substrate, offset, options):
+        try:
+            idx = plan.positions[self._peekTagKey(substrate, offset)]
+
+        except KeyError:
+            raise self._mismatch(plan.asn1Spec, substrate, offset)
+
+        componentFilter = options.get('componentFilter')
+
+        if componentFilter is None:
+            component, offset = self._decodeComponent(
+                plan.components[idx], substrate, offset, options)
+
+        else:
+            node = componentFilter.get(plan.names[idx])
+
+            options = dict(options)
+            del options['componentFilter']
+
+            if node is None:
+                component, offset = self._decodeComponent(
+                    plan.components[idx], substrate, offset, options)
+
+            else:
+                component, offset = self._decodeFilteredComponent(
+                    plan.components[idx], substrate, offset, node, options)
+
+        asn1Object = plan.asn1Spec.clone()
+
+        if component is not noValue:
+            asn1Object.setComponentByPosition(
+                idx, component,
+                verifyConstraints=False,
+                matchTags=False, matchConstraints=False
+            )
+
+        return asn1Object, offset
+
+    def _decodeSequenceOf(self, plan, substrate, offset, length, options):
+        asn1Object = plan.asn1Spec.clone()
+        asn1Object.clear()
+
+        componentPlan = plan.components[0]
+
+        componentFilter = options.get('componentFilter')
+
+        if componentFilter is not None:
+            options = dict(options)
+            del options['componentFilter']
+
+            anyNode = componentFilter.get('*')
+
+        if length == -1:
+            end = None
+
+        else:
+            end = offset + length
+
+            if end > len(substrate):
+                raise error.SubstrateUnderrunError('Short substrate on input')
+
+        idx = 0
+        position = 0
+
+        while True:
+            if end is None:
+                if self._isEndOfOctets(substrate, offset):
+                    offset += 2
+                    break
+
+            elif offset >= end:
+                break
+
+            if componentFilter is None:
+                component, offset = self._decodeComponent(
+                    componentPlan, substrate, offset, options)
+
+            else:
+                node = componentFilter.get(str(position), anyNode)
+
+                position += 1
+
+                if node is None:
+                    component, offset = self._decodeComponent(
+                        componentPlan, substrate, offset, options)
+
+                else:
+                    component, offset = self._decodeFilteredComponent(
+                        componentPlan, substrate, offset, node, options)
+
+                    if component is noValue:
+                        continue
+
+            asn1Object.setComponentByPosition(
+                idx, component,
+                verifyConstraints=False,
+                matchTags=False, matchConstraints=False
+            )
+
+            idx += 1
+
+        if end is not None and offset != end:
+            raise error.PyAsn1Error(
+                'Read %s bytes instead of expected %s.' % (
+                    offset - end + length, length))
+
+        return asn1Object, offset
+
+    def _decodeSequence(self, plan, substrate, offset, length, options):
+        asn1Object = plan.asn1Spec.clone()
+        asn1Object.clear()
+
+        components = plan.components
+
+        if length == -1:
+            end = None
+
+        else:
+            end = offset + length
+
+            if end > len(substrate):
+                raise error.SubstrateUnderrunError('Short substrate on input')
+
+        componentFilter = options.get('componentFilter')
+
+        if componentFilter is not None:
+            options = dict(options)
+            del options['componentFilter']
+
+        seenIndices = set()
+        idx = 0
+
+        while True:
+            if end is None:
+                if self._isEndOfOctets(substrate, offset):
+                    offset += 2
+                    break
+
+            elif offset >= end:
+                break
+
+            idx = self._getComponentPosition(plan, substrate, offset, idx)
+
+            if componentFilter is None:
+                node = None
+
+            else:
+                node = componentFilter.get(plan.names[idx])
+
+            if node is None:
+                component, offset = self._decodeComponent(
+                    components[idx], substrate, offset, options)
+
+            else:
+                component, offset = self._decodeFilteredComponent(
+                    components[idx], substrate, offset, node, options)
+
+            if component is not noValue:
+                asn1Object.setComponentByPosition(
+                    idx, component,
+                    verifyConstraints=False,
+                    matchTags=False, matchConstraints=False
+                )
+
+            seenIndices.add(idx)
+            idx += 1
+
+        if end is not None and offset != end:
+            raise error.PyAsn1Error(
+                'Read %s bytes instead of expected %s.' % (
+                    offset - end + length, length))
+
+        if not plan.requiredComponents.issubset(seenIndices):
+            raise error.PyAsn1Error(
+                'ASN.1 object %s has uninitialized '
+                'components' % asn1Object.__class__.__name__)
+
+        if plan.openTypes:
+            self._decodeOpenTypes(asn1Object, plan, options)
+
+        return asn1Object, offset
+
+    def _getComponentPosition(self, plan, substrate, offset, idx):
+        tagKey = self._peekTagKey(substrate, offset)
+
+        if plan.positions is not None:
+            try:
+                return plan.positions[tagKey]
+
+            except KeyError:
+                raise self._mismatch(plan.asn1Spec, substrate, offset)
+
+        components = plan.components
+
+        while True:
+            try:
+                keys = components[idx].keys
+
+            except IndexError:
+                raise error.PyAsn1Error(
+                    'Excessive components decoded at %r' % (plan.asn1Spec,)
+                )
+
+            if keys is None:
+                if plan.optional[idx]:
+                    # exact tag match of a subsequent component wins
+                    # over untagged ANY, the way generic decoder does it
+                    candidate = idx + 1
+
+                    while candidate < len(components):
+                        keys = components[candidate].keys
+
+                        if keys is not None and tagKey in keys:
+                            return candidate
+
+                        if not plan.optional[candidate]:
+                            break
+
+                        candidate += 1
+
+                return idx
+
+            if tagKey in keys:
+                return idx
+
+            if not plan.optional[idx]:
+                raise self._mismatch(
+                    components[idx].asn1Spec, substrate, offset)
+
+            idx += 1
+
+    def _decodeOpenTypes(self, asn1Object, plan, options):
+        openTypes = options.get('openTypes', {})
+
+        if not openTypes and not options.get('decodeOpenTypes', False):
+            return
+
+        for idx, namedType in plan.openTypes:
+            if namedType.isOptional and not asn1Object.getComponentByPosition(idx).isValue:
+                continue
+
+            governingValue = asn1Object.getComponentByName(
+                namedType.openType.name
+            )
+
+            try:
+                openType = openTypes[governingValue]
+
+            except KeyError:
+                try:
+                    openType = namedType.openType[governingValue]
+
+                except KeyError:
+                    if LOG:
+                        LOG('failed to resolve open type by governing '
+                            'value %r' % (governingValue,))
+                    continue
+
+            openTypePlan = self._compile(openType)
+
+            containerValue = asn1Object.getComponentByPosition(idx)
+
+            if containerValue.typeId in (
+                    univ.SetOf.typeId, univ.SequenceOf.typeId):
+
+                for pos, containerElement in enumerate(containerValue):
+                    component, offset = self._decodeComponent(
+                        openTypePlan, memoryview(containerElement.asOctets()),
+                        0, options)
+
+                    containerValue[pos] = component
+
+            else:
+                component, offset = self._decodeComponent(
+                    openTypePlan, memoryview(containerValue.asOctets()),
+                    0, options)
+
+                asn1Object.setComponentByPosition(idx, component)
+
+
+(frameExplicit,
+ frameConstructed,
+ frameString) = [x for x in range(3)]
+
+
+class DecodingFrame(object):
+    """Constructed TLV being decoded by :py:class:`IterativeDecoder`."""
+    def __init__(self, kind, tagSet, concreteDecoder, end, limit):
+        self.kind = kind
+        self.tagSet = tagSet
+        self.concreteDecoder = concreteDecoder
+        # end of TLV value, None for indefinite length
+        self.end = end
+        # end of the nearest definite length TLV, None for top-level
+        self.limit = limit
+        # decoded components or, for strings, payload fragments
+        self.components = []
+
+
+class IterativeDecoder(object):
+    """Create a non-recursive BER decoder of in-memory serialization.
+
+    Decodes BER/CER/DER serialization without ASN.1 schema into the
+    same objects the generic decoder produces when `asn1Spec` is not
+    given. Rather than descending into constructed TLVs by nested
+    Python calls, constructed TLVs being decoded are kept on an explicit
+    stack. Nesting depth of the input is therefore not limited by the
+    Python recursion limit, each nesting level costs just one stack
+    entry.
+
+    Nesting depth and other resources consumed by the input can be
+    capped by the same options the generic decoder takes so that
+    offending input gets rejected as soon as the offending TLV header
+    is read.
+
+    Keyword Args
+    ------------
+    tagMap: :py:class:`dict`
+        Payload decoders to use instead of the codec defaults
+
+    maxDepth: :py:class:`int`
+        Maximum TLV nesting level, top-level TLV being at level 0.
+        Unlimited by default.
+
+    maxComponents, maxValueLength, maxTotalLength: :py:class:`int`
+        Resource limits on the serialization being decoded, see
+        :py:class:`~pyasn1.codec.ber.decoder.Decoder`
+
+    Examples
+    --------
+
+    .. code-block:: pycon
+
+        >>> decode = IterativeDecoder(maxDepth=32)
+        >>> s, unprocessed = decode(b'0\t\x02\x01\x01\x02\x01\x02\x02\x01\x03')
+        >>> str(s)
+        SequenceOf:
+         1 2 3
+    """
+
+    SINGLE_ITEM_DECODER = SingleItemDecoder
+
+    def __init__(self, **options):
+        singleItemDecoder = self.SINGLE_ITEM_DECODER(**options)
+        self._tagMap = options.get('tagMap', singleItemDecoder.TAG_MAP)
+        self._supportIndefLength = singleItemDecoder.supportIndefLength
+        self._options = options
+        self._dispatchTable = _getDispatchTable(self._tagMap)
+
+    def __call__(self, substrate, **options):
+        """Turns BER/CER/DER octet stream into an ASN.1 object.
+
+        Parameters
+        ----------
+        substrate: :py:class:`bytes` (Python 3) or :py:class:`str` (Python 2)
+            BER/CER/DER octet-stream to parse, :py:class:`bytearray`,
+            :py:class:`memoryview` and :py:class:`mmap.mmap` are read
+            in place
+
+        Keyword Args
+        ------------
+        maxDepth, maxComponents, maxValueLength, maxTotalLength: :py:class:`int`
+            Resource limits overriding the ones given to the constructor
+
+        Returns
+        -------
+        : :py:class:`tuple`
+            A tuple of :py:class:`~pyasn1.type.base.PyAsn1Item` object
+            recovered from BER/CER/DER substrate and the unprocessed trailing
+            portion of the `substrate` (may be empty)
+
+        Raises
+        ------
+        : :py:class:`~pyasn1.error.PyAsn1Error`
+            :py:class:`~pyasn1.error.SubstrateUnderrunError` on insufficient
+            input or :py:class:`~pyasn1.error.PyAsn1Error` on decoding error
+            including too deep nesting.
+        """
+        substrate = CompiledDecoder._asMemoryView(substrate)
+
+        if options:
+            options = dict(self._options, **options)
+
+        else:
+            options = self._options
+
+        asn1Object, offset = self._decode(substrate, 0, options)
+
+        return asn1Object, substrate[offset:].tobytes()
+
+    def _decode(self, substrate, offset, options):
+        tagMap = self._tagMap
+        dispatchTable = self._dispatchTable
+
+        limits = DecodingLimits.fromOptions(options)
+
+        substrateLength = len(substrate)
+
+        # constructed TLVs being decoded, innermost last
+        stack = []
+
+        while True:
+            if stack:
+                frame = stack[-1]
+
+                if frame.end is None:
+                    if offset >= substrateLength:
+                        raise error.SubstrateUnderrunError(
+                            'Missing end-of-octets sentinel at %s' % offset)
+
+                    isComplete = substrate[offset:offset + 2].tobytes() == EOO_SENTINEL
+
+                    if isComplete:
+                        if frame.limit is not None and offset + 2 > frame.limit:
+                            raise error.PyAsn1Error(
+                                'End-of-octets sentinel at %s overruns its '
+                                'enclosing TLV' % offset)
+
+                        offset += 2
+
+                else:
+                    isComplete = offset >= frame.end
+
+                if isComplete:
+                    stack.pop()
+
+                    if frame.kind is frameString:
+                        if stack and stack[-1].kind is frameString:
+                            # nested fragments make up the enclosing string
+                            stack[-1].components.extend(frame.components)
+                            continue
+
+                        if limits is not None:
+                            limits.checkValueLength(
+                                frame.tagSet, self._stringLength(frame))
+
+                    asn1Object = self._closeFrame(frame, options)
+
+                    if not stack:
+                        return asn1Object, offset
+
+                    stack[-1].components.append(asn1Object)
+
+                    continue
+
+            else:
+                frame = None
+
+            tagClass, tagFormat, tagId, valueOffset, length = decodeHeader(
+                substrate, offset)
+
+            if limits is not None:
+                limits.depth = len(stack)
+                limits.checkHeader(tagFormat, length, offset)
+
+            if frame is None:
+                limit = None
+
+            else:
+                limit = frame.limit
+
+            if length == -1:
+                if not self._supportIndefLength:
+                    raise error.PyAsn1Error(
+                        'Indefinite length encoding not supported by this codec')
+
+                end = None
+
+                if limit is not None and valueOffset > limit:
+                    raise error.PyAsn1Error(
+                        'TLV at %s overruns its enclosing TLV' % offset)
+
+            else:
+                end = limit = valueOffset + length
+
+                if end > substrateLength:
+                    raise error.SubstrateUnderrunError(
+                        '%d-octet short at %s' % (end - substrateLength, offset))
+
+                if frame is not None and frame.limit is not None and end > frame.limit:
+                    raise error.PyAsn1Error(
+                        'TLV at %s overruns its enclosing TLV' % offset)
+
+            if frame is not None and frame.kind is frameString:
+                protoTag = frame.concreteDecoder.protoComponent.tagSet[0]
+
+                if tagClass != protoTag.tagClass or tagId != protoTag.tagId:
+                    raise error.PyAsn1Error(
+                        '%s not in asn1Spec: %r' % (
+                            tag.TagSet((), tag.Tag(tagClass, tagFormat, tagId)),
+                            frame.concreteDecoder.protoComponent))
+
+                if tagFormat:
+                    stack.append(
+                        DecodingFrame(frameString, frame.tagSet,
+                                      frame.concreteDecoder, end, limit))
+
+                    offset = valueOffset
+
+                elif end is None:
+                    raise error.PyAsn1Error(
+                        'Indefinite length encoding of primitive value '
+                        'at %s' % offset)
+
+                else:
+                    frame.components.append(
+                        substrate[valueOffset:end].tobytes())
+
+                    offset = end
+
+                continue
+
+            if tagId < 31:
+                firstOctet = tagClass | tagFormat | tagId
+
+                lastTag = SHORT_TAGS[firstOctet]
+
+            else:
+                firstOctet = None
+
+                lastTag = tag.Tag(tagClass, tagFormat, tagId)
+
+            isExplicitlyTagged = frame is not None and frame.kind is frameExplicit
+
+            if firstOctet is not None and not isExplicitlyTagged:
+                tagSet = SHORT_TAG_SETS[firstOctet]
+                concreteDecoder = dispatchTable[firstOctet]
+
+            else:
+                if isExplicitlyTagged:
+                    tagSet = lastTag + frame.tagSet
+
+                else:
+                    tagSet = tag.TagSet((), lastTag)
+
+                try:
+                    concreteDecoder = tagMap[tagSet]
+
+                except KeyError:
+                    try:
+                        concreteDecoder = tagMap[tagSet[:1]]
+
+                    except KeyError:
+                        concreteDecoder = None
+
+            if concreteDecoder is None:
+                if tagFormat and tagClass != tag.tagClassUniversal:
+                    # Assume explicit tagging
+                    kind = frameExplicit
+
+                else:
+                    raise error.PyAsn1Error(
+                        '%s not in asn1Spec: %r' % (tagSet, None))
+
+            elif isinstance(concreteDecoder, ConstructedPayloadDecoderBase):
+                if not tagFormat:
+                    raise error.PyAsn1Error('Constructed tag format expected')
+
+                if concreteDecoder.protoRecordComponent is None:
+                    raise error.PyAsn1Error(
+                        '%s can not be decoded without ASN.1 schema' % (tagSet,))
+
+                kind = frameConstructed
+
+            elif concreteDecoder.primitiveValueDecoder is None:
+                raise error.PyAsn1Error(
+                    '%s does not support iterative decoding' % (
+                        concreteDecoder.__class__.__name__,))
+
+            elif tagFormat:
+                if not getattr(concreteDecoder, 'supportConstructedForm', False):
+                    if hasattr(concreteDecoder, 'supportConstructedForm'):
+                        raise error.PyAsn1Error(
+                            'Constructed encoding form prohibited '
+                            'at %s' % concreteDecoder.__class__.__name__)
+
+                    raise error.PyAsn1Error('Simple tag format expected')
+
+                kind = frameString
+
+            elif end is None:
+                raise error.PyAsn1Error(
+                    'Indefinite length mode decoder not implemented '
+                    'for %s' % (tagSet,))
+
+            else:
+                asn1Object = concreteDecoder.primitiveValueDecoder(
+                    substrate[valueOffset:end].tobytes(), None, tagSet,
+                    **options)
+
+                if not stack:
+                    return asn1Object, end
+
+                frame.components.append(asn1Object)
+
+                offset = end
+
+                continue
+
+            stack.append(
+                DecodingFrame(kind, tagSet, concreteDecoder, end, limit))
+
+            offset = valueOffset
+
+    @staticmethod
+    def _stringLength(frame):
+        length = sum([len(fragment) for fragment in frame.components])
+
+        if isinstance(frame.concreteDecoder, BitStringPayloadDecoder):
+            # leading octet of each fragment counts trailing bits
+            length -= len(frame.components)
+
+        return length
+
+    @staticmethod
+    def _closeFrame(frame, options):
+        components = frame.components
+
+        if frame.kind is frameExplicit:
+            if len(components) != 1:
+                raise error.PyAsn1Error(
+                    'Explicitly tagged %s holds %d values' % (
+                        frame.tagSet, len(components)))
+
+            return components[0]
+
+        concreteDecoder = frame.concreteDecoder
+
+        if frame.kind is frameString:
+            if not isinstance(concreteDecoder, BitStringPayloadDecoder):
+                return concreteDecoder.primitiveValueDecoder(
+                    null.join(components), None, frame.tagSet, **options)
+
+            bitString = concreteDecoder.protoComponent.fromOctetString(
+                null, internalFormat=True)
+
+            for fragment in components:
+                if not fragment:
+                    raise error.PyAsn1Error('Empty BIT STRING substrate')
+
+                trailingBits = oct2int(fragment[0])
+                if trailingBits > 7:
+                    raise error.PyAsn1Error(
+                        'Trailing bits overflow %s' % trailingBits
+                    )
+
+                bitString = concreteDecoder.protoComponent.fromOctetString(
+                    fragment[1:], internalFormat=True,
+                    prepend=bitString, padding=trailingBits
+                )
+
+            return concreteDecoder._createComponent(
+                None, frame.tagSet, bitString, **options)
+
+        # Guess SEQUENCE/SET or SEQUENCE OF/SET OF the same way
+        # the generic decoder does
+        if len(set([component.tagSet for component in components])) > 1:
+            protoComponent = concreteDecoder.protoRecordComponent
+
+        else:
+            protoComponent = concreteDecoder.protoSequenceComponent
+
+        asn1Object = protoComponent.clone(
+            tagSet=tag.TagSet(protoComponent.tagSet.baseTag,
+                              *frame.tagSet.superTags)
+        )
+        asn1Object.clear()
+
+        for idx, component in enumerate(components):
+            asn1Object.setComponentByPosition(
+                idx, component,
+                verifyConstraints=False,
+                matchTags=False, matchConstraints=False
+            )
+
+        return asn1Object
+
+
+class Decoder(object):
+    """Create a BER decoder object.
+
+    Parse BER/CER/DER octet-stream into one, possibly nested, ASN.1 object.
+    """
+    STREAMING_DECODER = StreamingDecoder
+    COMPILED_DECODER = CompiledDecoder
+
+    # most recently compiled decoders by schema, shared by all codecs
+    _compiledDecoders = {}
+    _compiledDecodersLimit = 64
+
+    @classmethod
+    def __call__(cls, substrate, asn1Spec=None, **options):
+        """Turns BER/CER/DER octet stream into an ASN.1 object.
+
+        Takes BER/CER/DER octet-stream in form of :py:class:`bytes` (Python 3)
+        or :py:class:`str` (Python 2) and decode it into an ASN.1 object
+        (e.g. :py:class:`~pyasn1.type.base.PyAsn1Item` derivative) which
+        may be a scalar or an arbitrary nested structure.
+
+        Parameters
+        ----------
+        substrate: :py:class:`bytes` (Python 3) or :py:class:`str` (Python 2)
+            BER/CER/DER octet-stream to parse. Buffer objects such as
+            :py:class:`bytearray`, :py:class:`memoryview` or
+            :py:class:`mmap.mmap` are decoded in place without copying.
+
+        Keyword Args
+        ------------
+        asn1Spec: :py:class:`~pyasn1.type.base.PyAsn1Item`
+            A pyasn1 type object (:py:class:`~pyasn1.type.base.PyAsn1Item`
+            derivative) to act as a template guiding the decoder.
+            Depending on the ASN.1 structure being decoded, `asn1Spec` may or
+            may not be required. Most common reason for it to require is that
+            ASN.1 structure is encoded in *IMPLICIT* tagging mode.
+
+        lazy: :py:class:`bool`
+            If :obj:`True` and `asn1Spec` is given, definite length SEQUENCE,
+            SET, SEQUENCE OF and SET OF components are not decoded until
+            first accessed. Such objects refer to `substrate` which must stay
+            intact. Untouched components are re-encoded by copying their
+            original serialization. File-like `substrate` is decoded
+            eagerly.
+
+        skipComponents, rawComponents: :py:class:`list`
+            Dot-separated paths to the components of `asn1Spec` to
+            skip over by length or to capture undecoded, see
+            :py:class:`~pyasn1.codec.ber.decoder.CompiledDecoder`.
+            Only in-memory `substrate` is supported, file-like objects
+            are rejected with
+            :py:class:`~pyasn1.error.UnsupportedSubstrateError`.
+
+        keepSubstrate: :py:class:`bool`
+            If :obj:`True`, decoded constructed objects refer to the part
+            of `substrate` they have been decoded from (which must stay
+            intact), see
+            :py:attr:`~pyasn1.type.base.ConstructedAsn1Type.substrate`.
+            Encoders copy these serializations into the output unless
+            the objects get modified.
+
+        maxDepth, maxComponents, maxValueLength, maxTotalLength: :py:class:`int`
+            Resource limits on the serialization being decoded, see
+            :py:class:`~pyasn1.codec.ber.decoder.StreamingDecoder`.
+            In `lazy` mode deferred components are checked once they
+            get decoded.
+
+        Returns
+        -------
+        : :py:class:`tuple`
+            A tuple of :py:class:`~pyasn1.type.base.PyAsn1Item` object
+            recovered from BER/CER/DER substrate and the unprocessed trailing
+            portion of the `substrate` (may be empty)
+
+        Raises
+        ------
+        : :py:class:`~pyasn1.error.PyAsn1Error`
+            :py:class:`~pyasn1.error.SubstrateUnderrunError` on insufficient
+            input, :py:class:`~pyasn1.error.DecodingLimitError` on exceeding
+            resource limits or :py:class:`~pyasn1.error.PyAsn1Error` on
+            decoding error.
+
+        Examples
+        --------
+        Decode BER/CER/DER serialisation without ASN.1 schema
+
+        .. code-block:: pycon
+
+           >>> s, unprocessed = decode(b'0\t\x02\x01\x01\x02\x01\x02\x02\x01\x03')
+           >>> str(s)
+           SequenceOf:
+            1 2 3
+
+        Decode BER/CER/DER serialisation with ASN.1 schema
+
+        .. code-block:: pycon
+
+           >>> seq = SequenceOf(componentType=Integer())
+           >>> s, unprocessed = decode(
+                b'0\t\x02\x01\x01\x02\x01\x02\x02\x01\x03', asn1Spec=seq)
+           >>> str(s)
+           SequenceOf:
+            1 2 3
+
+        """
+        if asn1Spec is not None:
+            if options.get('skipComponents') or options.get('rawComponents'):
+                return cls.compile(asn1Spec, **options)(substrate)
+
+            if options.get('lazy', False):
+                try:
+                    substrate = cls.COMPILED_DECODER._asMemoryView(substrate)
+
+                except error.UnsupportedSubstrateError:
+                    pass  # nothing to defer decoding to, stream gets consumed
+
+                else:
+                    return cls.compile(asn1Spec, **options)(substrate)
+
+        substrate = asSeekableStream(substrate)
+
+        streamingDecoder = cls.STREAMING_DECODER(
+            substrate, asn1Spec, **options)
+
+        for asn1Object in streamingDecoder:
+            if isinstance(asn1Object, SubstrateUnderrunError):
+                raise error.SubstrateUnderrunError('Short substrate on input')
+
+            try:
+                tail = next(readFromStream(substrate))
+
+            except error.EndOfStreamError:
+                tail = null
+
+            return asn1Object, tail
+
+    @classmethod
+    def decodeMany(cls, substrates, asn1Spec=None, **options):
+        """Turns many independent BER/CER/DER octet streams into ASN.1 objects.
+
+        Decoder set up, including tag caches and, if `asn1Spec` is given,
+        compiled decoding plan, is done once and shared by all the
+        `substrates`. A failure to decode any of the `substrates` does not
+        stop decoding the rest of them.
+
+        Parameters
+        ----------
+        substrates:
+            Iterable of BER/CER/DER octet-streams to parse, each in any form
+            accepted by :py:meth:`__call__`
+
+        Keyword Args
+        ------------
+        asn1Spec: :py:class:`~pyasn1.type.base.PyAsn1Item`
+            A pyasn1 type object to act as a template guiding the decoder
+            through each of the `substrates`
+
+        Other keyword arguments, including resource limits, are
+        the same as :py:meth:`__call__` takes.
+
+        Yields
+        ------
+        : :py:class:`tuple`, :py:class:`~pyasn1.error.PyAsn1Error`
+            For each of the `substrates`, in order, either a tuple of
+            recovered ASN.1 object and the unprocessed trailing portion
+            of the substrate or the exception object describing
+            decoding failure
+
+        Examples
+        --------
+
+        .. code-block:: pycon
+
+           >>> seq = SequenceOf(componentType=Integer())
+           >>> for result in decode.decodeMany(
+           ...         [b'0\x03\x02\x01\x01', b'0\x03\x02'], asn1Spec=seq):
+           ...     print(result)
+           (<SequenceOf value object, ... payload [<Integer value object, ... payload [1]>]>, b'')
+           Short substrate on input
+
+        """
+        # compiled decoders do not call back `substrateFun`
+        if asn1Spec is not None and not options.get('substrateFun'):
+            for result in cls.compile(asn1Spec, **options).decodeMany(substrates):
+                yield result
+
+            return
+
+        singleItemDecoder = cls.STREAMING_DECODER.SINGLE_ITEM_DECODER(**options)
+
+        for substrate in substrates:
+            try:
+                result = cls._decodeOne(
+                    singleItemDecoder, substrate, asn1Spec, **options)
+
+            except error.PyAsn1Error:
+                result = sys.exc_info()[1]
+
+            yield result
+
+    @staticmethod
+    def _decodeOne(singleItemDecoder, substrate, asn1Spec, **options):
+        substrate = asSeekableStream(substrate)
+
+        for asn1Object in singleItemDecoder(substrate, asn1Spec, **options):
+            if isinstance(asn1Object, SubstrateUnderrunError):
+                raise error.SubstrateUnderrunError('Short substrate on input')
+
+            try:
+                tail = next(readFromStream(substrate))
+
+            except error.EndOfStreamError:
+                tail = null
+
+            return asn1Object, tail
+
+    @classmethod
+    def compile(cls, asn1Spec, **options):
+        """Create a decoder specialized for the given ASN.1 schema.
+
+        The returned callable behaves as this decoder called with
+        the same `asn1Spec` over and over again, but does not repeat
+        schema dispatch for every message it decodes.
+
+        Compiled decoders are cached by `asn1Spec` identity, so that
+        repeated calls with the same schema object (including `lazy`
+        decoding) do not walk the schema again.
+
+        Parameters
+        ----------
+        asn1Spec: :py:class:`~pyasn1.type.base.PyAsn1Item`
+            A pyasn1 type object to specialize the decoder for
+
+        Returns
+        -------
+        : :py:class:`CompiledDecoder`
+            Callable taking BER/CER/DER octet-stream and returning a tuple
+            of decoded ASN.1 object and the unprocessed trailing portion
+            of the substrate
+
+        Examples
+        --------
+
+        .. code-block:: pycon
+
+           >>> decodeSeq = decode.compile(SequenceOf(componentType=Integer()))
+           >>> s, unprocessed = decodeSeq(b'0\t\x02\x01\x01\x02\x01\x02\x02\x01\x03')
+           >>> str(s)
+           SequenceOf:
+            1 2 3
+
+        """
+        try:
+            # component paths typically come in lists
+            key = cls, id(asn1Spec), tuple(sorted(
+                [(name, tuple(value) if isinstance(value, list) else value)
+                 for name, value in options.items()]))
+            hash(key)
+
+        except TypeError:
+            # e.g. custom tag maps
+            return cls.COMPILED_DECODER(asn1Spec, **options)
+
+        try:
+            cachedSpec, compiledDecoder = cls._compiledDecoders[key]
+
+        except KeyError:
+            pass
+
+        else:
+            if cachedSpec is asn1Spec:
+                return compiledDecoder
+
+        if len(cls._compiledDecoders) >= cls._compiledDecodersLimit:
+            cls._compiledDecoders.clear()
+
+        compiledDecoder = cls.COMPILED_DECODER(asn1Spec, **options)
+
+        # holding schema reference keeps its id() unique
+        cls._compiledDecoders[key] = asn1Spec, compiledDecoder
+
+        return compiledDecoder
+
+    @classmethod
+    def extract(cls, substrate, asn1Spec, paths, **options):
+        """Decode only the requested components of BER/CER/DER serialization.
+
+        Serializations of the components not lying on the requested
+        paths are skipped by length, nothing gets decoded out of them.
+        When extracting from many serializations of the same schema,
+        reuse :py:meth:`CompiledDecoder.extract` of :py:meth:`compile`
+        result.
+
+        Parameters
+        ----------
+        substrate: :py:class:`bytes` (Python 3) or :py:class:`str` (Python 2)
+            BER/CER/DER octet-stream to parse
+
+        asn1Spec: :py:class:`~pyasn1.type.base.PyAsn1Item`
+            ASN.1 schema of the whole `substrate`
+
+        paths: :py:class:`list`
+            Dot-separated component names relative to `asn1Spec`.
+            SEQUENCE OF/SET OF components are referred to by position
+            e.g. `tbsCertificate.extensions.0.extnID`
+
+        Returns
+        -------
+        : :py:class:`dict`
+            Fully decoded ASN.1 objects keyed by requested path. Paths
+            to the components absent in `substrate` (e.g. OPTIONAL
+            components or CHOICE alternatives) are not included.
+
+        Raises
+        ------
+        : :py:class:`~pyasn1.error.PyAsn1Error`
+            :py:class:`~pyasn1.error.SubstrateUnderrunError` on insufficient
+            input or :py:class:`~pyasn1.error.PyAsn1Error` on decoding error
+            or unknown component name.
+
+        Examples
+        --------
+
+        .. code-block:: pycon
+
+           >>> seq = Sequence(componentType=NamedTypes(
+           ...     NamedType('id', Integer()),
+           ...     NamedType('ints', SequenceOf(componentType=Integer()))))
+           >>> decode.extract(
+           ...     b'0\x0b\x02\x01\x07\x30\x06\x02\x01\x01\x02\x01\x02',
+           ...     seq, ['ints.1'])
+           {'ints.1': <Integer value object, tagSet <TagSet object, tags 0:0:2>, payload [2]>}
+
+        """
+        return cls.compile(asn1Spec, **options).extract(substrate, paths)
+
+
+class PushDecoder(object):
+    """Create a push-style BER/CER/DER decoder.
+
+    Serialization is pushed into the decoder in arbitrary pieces as
+    they arrive (e.g. from a non-blocking socket). The decoder frames
+    top-level TLVs incrementally, only looking at the octets it has
+    not seen before, and decodes each TLV once it is complete.
+
+    Keyword Args
+    ------------
+    asn1Spec: :py:class:`~pyasn1.type.base.PyAsn1Item`
+        A pyasn1 type object to act as a template guiding the decoder
+        through each top-level TLV
+
+    maxDepth, maxComponents, maxValueLength, maxTotalLength: :py:class:`int`
+        Resource limits on each top-level TLV, see :py:class:`Decoder`.
+        TLV headers walked while framing are checked right away, so
+        that excessive input is rejected before being buffered.
+
+    Examples
+    --------
+
+    .. code-block:: pycon
+
+        >>> decoder = PushDecoder(asn1Spec=SequenceOf(componentType=Integer()))
+        >>> decoder.feed(b'0\t\x02\x01\x01\x02')
+        >>> decoder.popDecoded()
+        []
+        >>> decoder.feed(b'\x01\x02\x02\x01\x03')
+        >>> decoder.popDecoded()
+        [<SequenceOf value object, ... payload [<Integer value object, ... payload [1]>, ...]>]
+
+    """
+    DECODER = Decoder
+
+    def __init__(self, asn1Spec=None, **options):
+        self._decoder = self.DECODER()
+        self._asn1Spec = asn1Spec
+        self._options = options
+        self._supportIndefLength = (
+            self.DECODER.STREAMING_DECODER.SINGLE_ITEM_DECODER.supportIndefLength)
+        self._buffer = bytearray()
+        # position of the first octet not yet looked at
+        self._offset = 0
+        # number of value octets of definite length TLV yet to arrive
+        self._remaining = 0
+        # number of enclosing indefinite length TLVs
+        self._depth = 0
+        # resources consumed by the top-level TLV being framed
+        self._limits = None
+        self._decoded = []
+
+    def feed(self, substrate):
+        """Push a piece of BER/CER/DER serialization into the decoder.
+
+        Parameters
+        ----------
+        substrate: :py:class:`bytes`, :py:class:`bytearray` or :py:class:`memoryview`
+            Next piece of serialization, possibly ending in the middle
+            of a TLV
+
+        Raises
+        ------
+        ~pyasn1.error.PyAsn1Error
+            On decoding error (including `DecodingLimitError` on
+            exceeding resource limits), once all complete TLVs buffered
+            so far are processed. A TLV failing to decode is dropped as a
+            whole. On framing error (e.g. indefinite length header
+            under DER) only the octets framed so far, usually just the
+            offending TLV header, are dropped. If several TLVs fail,
+            the first error is raised.
+        """
+        self._buffer.extend(substrate)
+
+        failure = None
+
+        while True:
+            try:
+                if not self._frame():
+                    break
+
+            except error.PyAsn1Error:
+                if failure is None:
+                    failure = sys.exc_info()[1]
+
+                del self._buffer[:self._offset]
+
+                self._offset = self._remaining = self._depth = 0
+
+                continue
+
+            substrate = bytes(self._buffer[:self._offset])
+
+            del self._buffer[:self._offset]
+
+            self._offset = 0
+
+            try:
+                asn1Object, tail = self._decoder(
+                    substrate, asn1Spec=self._asn1Spec, **self._options)
+
+            except error.PyAsn1Error:
+                if failure is None:
+                    failure = sys.exc_info()[1]
+
+                continue
+
+            self._decoded.append(asn1Object)
+
+        if failure is not None:
+            raise failure
+
+    def popDecoded(self):
+        """Take ASN.1 objects decoded so far out of the decoder.
+
+        Returns
+        -------
+        : :py:class:`list`
+            ASN.1 objects decoded out of the serialization pushed so far,
+            in order, possibly empty
+        """
+        decoded, self._decoded = self._decoded, []
+
+        return decoded
+
+    def _frame(self):
+        """Advance over TLV headers and values that have arrived.
+
+        Returns `True` once a whole top-level TLV is buffered.
+        """
+        # view of the buffer must not outlive this call, or the
+        # buffer could not be resized
+        buffer = memoryview(self._buffer)
+
+        if not self._offset:
+            # buffer starts with the next top-level TLV
+            self._limits = DecodingLimits.fromOptions(self._options)
+
+        while True:
+            if self._remaining:
+                size = min(self._remaining, len(buffer) - self._offset)
+
+                self._offset += size
+                self._remaining -= size
+
+                if self._remaining:
+                    return False
+
+                if not self._depth:
+                    return True
+
+            if self._offset >= len(buffer):
+                return False
+
+            try:
+                tagClass, tagFormat, tagId, offset, length = decodeHeader(
+                    buffer, self._offset)
+
+            except error.SubstrateUnderrunError:
+                return False
+
+            position, self._offset = self._offset, offset
+
+            if self._depth and not (tagClass or tagFormat or tagId or length):
+                # end-of-octets sentinel
+                self._depth -= 1
+
+                if not self._depth:
+                    return True
+
+                continue
+
+            if self._limits is not None:
+                self._limits.depth = self._depth
+
+                try:
+                    self._limits.checkHeader(tagFormat, length, position)
+
+                except error.DecodingLimitError:
+                    # traceback must not hold the view either
+                    buffer = None
+                    raise
+
+            if length == -1:
+                if not self._supportIndefLength:
+                    buffer = None
+
+                    raise error.PyAsn1Error(
+                        'Indefinite length encoding not supported by this codec')
+
+                self._depth += 1
+
+            elif length:
+                self._remaining = length
+
+            elif not self._depth:
+                return True
 
 
 #: Turns BER octet stream into an ASN.1 object.
@@ -2017,7 +4715,8 @@ class Decoder(object):
 #: Parameters
 #: ----------
 #: substrate: :py:class:`bytes` (Python 3) or :py:class:`str` (Python 2)
-#:     BER octet-stream
+#:     BER octet-stream, buffer objects (:py:class:`bytearray`,
+#:     :py:class:`memoryview`, :py:class:`mmap.mmap`) are read in place
 #:
 #: Keyword Args
 #: ------------
@@ -4,7 +4,9 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: http://snmplabs.com/pyasn1/license.html
 #
+import mmap
 import sys
+from collections import OrderedDict
 
 from pyasn1 import debug
 from pyasn1 import error
@@ -12,18 +14,23 @@ from pyasn1.codec.ber import eoo
 from pyasn1.compat.integer import to_bytes
 from pyasn1.compat.octets import (int2oct, oct2int, ints2octs, null,
                                   str2octs, isOctetsType)
+from pyasn1.type import base
 from pyasn1.type import char
 from pyasn1.type import tag
 from pyasn1.type import univ
 from pyasn1.type import useful
 
-__all__ = ['Encoder', 'encode']
+_PY2 = sys.version_info < (3,)
+
+__all__ = ['Encoder', 'StreamingEncoder', 'TwoPassEncoder', 'CompiledEncoder',
+           'encode']
 
 LOG = debug.registerLoggee(__name__, flags=debug.DEBUG_ENCODER)
 
 
 class AbstractItemEncoder(object):
     supportIndefLenMode = True
+    supportComponentsStreaming = False
 
     # An outcome of otherwise legit call `encodeFun(eoo.endOfOctets)`
     eooIntegerSubstrate = (0, 0)
@@ -73,6 +80,25 @@ class AbstractItemEncoder(object):
     def encodeValue(self, value, asn1Spec, encodeFun, **options):
         raise error.PyAsn1Error('Not implemented')
 
+    @staticmethod
+    def _getPayload(value, asn1Spec):
+        """Turn Python value into payload of simple ASN.1 type.
+
+        Coerces and validates value the same way ASN.1 object
+        instantiation does, just without building the object.
+        """
+        value = asn1Spec.prettyIn(value)
+
+        if asn1Spec.subtypeSpec:
+            try:
+                asn1Spec.subtypeSpec(value)
+
+            except error.PyAsn1Error:
+                exType, exValue, exTb = sys.exc_info()
+                raise exType('%s at %s' % (exValue, asn1Spec.__class__.__name__))
+
+        return value
+
     def encode(self, value, asn1Spec=None, encodeFun=None, **options):
 
         if asn1Spec is None:
@@ -87,69 +113,87 @@ class AbstractItemEncoder(object):
             )
             return substrate
 
-        defMode = options.get('defMode', True)
+        try:
+            substrate, isConstructed, isOctets = self.encodeValue(
+                value, asn1Spec, encodeFun, **options
+            )
 
-        substrate = null
+        except error.PyAsn1Error:
+            exc = sys.exc_info()
+            raise error.PyAsn1Error(
+                'Error encoding %r: %s' % (value, exc[1]))
+
+        if LOG:
+            LOG('encoded %svalue %s into %s' % (
+                isConstructed and 'constructed ' or '', value, substrate
+            ))
 
-        for idx, singleTag in enumerate(tagSet.superTags):
+        if not substrate and isConstructed and options.get('ifNotEmpty', False):
+            return substrate
 
-            defModeOverride = defMode
+        if not isOctets:
+            substrate = ints2octs(substrate)
 
-            # base tag?
-            if not idx:
-                try:
-                    substrate, isConstructed, isOctets = self.encodeValue(
-                        value, asn1Spec, encodeFun, **options
-                    )
+        identifiers = []
 
-                except error.PyAsn1Error:
-                    exc = sys.exc_info()
-                    raise error.PyAsn1Error(
-                        'Error encoding %r: %s' % (value, exc[1]))
+        for singleTag in tagSet.superTags:
+            identifier = self.encodeTag(singleTag, isConstructed)
 
-                if LOG:
-                    LOG('encoded %svalue %s into %s' % (
-                        isConstructed and 'constructed ' or '', value, substrate
-                    ))
+            if LOG:
+                LOG('encoded %stag %s into %s' % (
+                    isConstructed and 'constructed ' or '',
+                    singleTag, debug.hexdump(ints2octs(identifier))))
 
-                if not substrate and isConstructed and options.get('ifNotEmpty', False):
-                    return substrate
+            identifiers.append(ints2octs(identifier))
 
-                if not isConstructed:
-                    defModeOverride = True
+        return self.addHeaders(
+            substrate, isConstructed, identifiers, options.get('defMode', True))
 
-                    if LOG:
-                        LOG('overridden encoding mode into definitive for primitive type')
+    def addHeaders(self, substrate, isConstructed, identifiers, defMode):
+        """Turn value serialization into complete TLV.
 
-            header = self.encodeTag(singleTag, isConstructed)
+        Wraps `substrate` into length octets and encoded tags
+        (`identifiers`, base tag first) of all tagging layers.
+        """
+        # primitive values are always of definite length
+        defModeOverride = defMode or not isConstructed
 
-            if LOG:
-                LOG('encoded %stag %s into %s' % (
-                    isConstructed and 'constructed ' or '',
-                    singleTag, debug.hexdump(ints2octs(header))))
+        if LOG and not isConstructed:
+            LOG('overridden encoding mode into definitive for primitive type')
 
-            header += self.encodeLength(len(substrate), defModeOverride)
+        length = len(substrate)
+
+        # outer headers and end-of-octets get joined with the value once
+        headers = []
+        eoos = []
+
+        for identifier in identifiers:
+            header = identifier + ints2octs(
+                self.encodeLength(length, defModeOverride))
 
             if LOG:
                 LOG('encoded %s octets (tag + payload) into %s' % (
-                    len(substrate), debug.hexdump(ints2octs(header))))
+                    length, debug.hexdump(header)))
 
-            if isOctets:
-                substrate = ints2octs(header) + substrate
+            headers.append(header)
 
-                if not defModeOverride:
-                    substrate += self.eooOctetsSubstrate
+            length += len(header)
 
-            else:
-                substrate = header + substrate
+            if not defModeOverride:
+                eoos.append(self.eooOctetsSubstrate)
 
-                if not defModeOverride:
-                    substrate += self.eooIntegerSubstrate
+                length += len(self.eooOctetsSubstrate)
 
-        if not isOctets:
-            substrate = ints2octs(substrate)
+            defModeOverride = defMode
 
-        return substrate
+        if len(headers) == 1 and not eoos:
+            return header + substrate
+
+        headers.reverse()
+        headers.append(substrate)
+        headers.extend(eoos)
+
+        return null.join(headers)
 
 
 class EndOfOctetsEncoder(AbstractItemEncoder):
@@ -169,6 +213,9 @@ class IntegerEncoder(AbstractItemEncoder):
     supportCompactZero = False
 
     def encodeValue(self, value, asn1Spec, encodeFun, **options):
+        if asn1Spec is not None:
+            value = self._getPayload(value, asn1Spec)
+
         if value == 0:
             if LOG:
                 LOG('encoding %spayload for zero INTEGER' % (
@@ -187,8 +234,18 @@ class IntegerEncoder(AbstractItemEncoder):
 class BitStringEncoder(AbstractItemEncoder):
     def encodeValue(self, value, asn1Spec, encodeFun, **options):
         if asn1Spec is not None:
-            # TODO: try to avoid ASN.1 schema instantiation
-            value = asn1Spec.clone(value)
+            payload = self._getPayload(value, asn1Spec)
+
+            valueLength = len(payload)
+
+            padding = -valueLength % 8
+
+            maxChunkSize = options.get('maxChunkSize', 0)
+            if not maxChunkSize or valueLength + padding <= maxChunkSize * 8:
+                substrate = to_bytes(payload << padding, length=valueLength + padding)
+                return int2oct(padding) + substrate, False, True
+
+            value = asn1Spec.clone(payload)
 
         valueLength = len(value)
         if valueLength % 8:
@@ -216,13 +273,13 @@ class BitStringEncoder(AbstractItemEncoder):
         alignedValue = alignedValue.clone(tagSet=tagSet)
 
         stop = 0
-        substrate = null
+        chunks = []
         while stop < valueLength:
             start = stop
             stop = min(start + maxChunkSize * 8, valueLength)
-            substrate += encodeFun(alignedValue[start:stop], asn1Spec, **options)
+            chunks.append(encodeFun(alignedValue[start:stop], asn1Spec, **options))
 
-        return substrate, True, True
+        return null.join(chunks), True, True
 
 
 class OctetStringEncoder(AbstractItemEncoder):
@@ -233,9 +290,12 @@ class OctetStringEncoder(AbstractItemEncoder):
             substrate = value.asOctets()
 
         elif not isOctetsType(value):
-            substrate = asn1Spec.clone(value).asOctets()
+            substrate = self._getOctets(value, asn1Spec)
 
         else:
+            if asn1Spec.subtypeSpec:
+                self._getPayload(value, asn1Spec)
+
             substrate = value
 
         maxChunkSize = options.get('maxChunkSize', 0)
@@ -273,17 +333,34 @@ class OctetStringEncoder(AbstractItemEncoder):
             asn1Spec = asn1Spec.clone(tagSet=tagSet)
 
         pos = 0
-        substrate = null
+        chunks = []
 
         while True:
             chunk = value[pos:pos + maxChunkSize]
             if not chunk:
                 break
 
-            substrate += encodeFun(chunk, asn1Spec, **options)
+            chunks.append(encodeFun(chunk, asn1Spec, **options))
             pos += maxChunkSize
 
-        return substrate, True, True
+        return null.join(chunks), True, True
+
+    def _getOctets(self, value, asn1Spec):
+        payload = self._getPayload(value, asn1Spec)
+
+        # character strings hold text
+        if isinstance(asn1Spec, char.AbstractCharacterString):
+            try:
+                return payload.encode(asn1Spec.encoding)
+
+            except UnicodeEncodeError:
+                exc = sys.exc_info()[1]
+                raise error.PyAsn1UnicodeEncodeError(
+                    "Can't encode string '%s' with codec "
+                    "%s" % (payload, asn1Spec.encoding), exc
+                )
+
+        return payload
 
 
 class NullEncoder(AbstractItemEncoder):
@@ -296,12 +373,42 @@ class NullEncoder(AbstractItemEncoder):
 class ObjectIdentifierEncoder(AbstractItemEncoder):
     supportIndefLenMode = False
 
+    #: Maximum number of OID payloads to keep in the process-wide
+    #: cache, set to 0 to disable caching
+    payloadCacheSize = 1024
+
+    # least recently used OID payloads go first
+    _payloadCache = OrderedDict()
+
     def encodeValue(self, value, asn1Spec, encodeFun, **options):
-        if asn1Spec is not None:
-            value = asn1Spec.clone(value)
+        if asn1Spec is None:
+            oid = value.asTuple()
+
+        else:
+            oid = self._getPayload(value, asn1Spec)
+
+        cache = self._payloadCache
+
+        try:
+            octets = cache.pop(oid)
+
+        except KeyError:
+            octets = self._encodeArcs(oid, value)
+
+        if self.payloadCacheSize:
+            cache[oid] = octets
+
+            while len(cache) > self.payloadCacheSize:
+                try:
+                    cache.popitem(last=False)
 
-        oid = value.asTuple()
+                except KeyError:
+                    break
+
+        return octets, False, True
 
+    @staticmethod
+    def _encodeArcs(oid, value):
         # Build the first pair
         try:
             first = oid[0]
@@ -326,30 +433,31 @@ class ObjectIdentifierEncoder(AbstractItemEncoder):
         else:
             raise error.PyAsn1Error('Impossible first/second arcs at %s' % (value,))
 
-        octets = ()
+        octets = []
 
         # Cycle through subIds
         for subOid in oid:
             if 0 <= subOid <= 127:
                 # Optimize for the common case
-                octets += (subOid,)
+                octets.append(subOid)
 
             elif subOid > 127:
                 # Pack large Sub-Object IDs
-                res = (subOid & 0x7f,)
+                res = [subOid & 0x7f]
                 subOid >>= 7
 
                 while subOid:
-                    res = (0x80 | (subOid & 0x7f),) + res
+                    res.append(0x80 | (subOid & 0x7f))
                     subOid >>= 7
 
                 # Add packed Sub-Object ID to resulted Object ID
-                octets += res
+                res.reverse()
+                octets.extend(res)
 
             else:
                 raise error.PyAsn1Error('Negative OID arc %s at %s' % (subOid, value))
 
-        return octets, False, False
+        return ints2octs(octets)
 
 
 class RealEncoder(AbstractItemEncoder):
@@ -520,14 +628,18 @@ class RealEncoder(AbstractItemEncoder):
 
 
 class SequenceEncoder(AbstractItemEncoder):
+    supportComponentsStreaming = True
     omitEmptyOptionals = False
 
     # TODO: handling three flavors of input is too much -- split over codecs
 
-    def encodeValue(self, value, asn1Spec, encodeFun, **options):
-
-        substrate = null
+    def _iterComponents(self, value, asn1Spec, **options):
+        """Yield components to encode, in order.
 
+        Each component comes along with its ASN.1 type (if any), open
+        type to wrap component serialization into (if any) and options
+        to encode component with.
+        """
         omitEmptyOptionals = options.get(
             'omitEmptyOptionals', self.omitEmptyOptionals)
 
@@ -543,15 +655,30 @@ class SequenceEncoder(AbstractItemEncoder):
 
             namedTypes = value.componentType
 
-            for idx, component in enumerate(value.values()):
+            for idx, name in enumerate(value):
+                # absent components are not instantiated to keep
+                # serialization cached in `value` valid
+                component = value.getComponentByPosition(
+                    idx, instantiate=False)
+
                 if namedTypes:
                     namedType = namedTypes[idx]
 
-                    if namedType.isOptional and not component.isValue:
+                    if namedType.isOptional and component is univ.noValue:
                         if LOG:
                             LOG('not encoding OPTIONAL component %r' % (namedType,))
                         continue
 
+                    if namedType.isDefaulted and component is univ.noValue:
+                        if LOG:
+                            LOG('not encoding DEFAULT component %r' % (namedType,))
+                        continue
+
+                if component is univ.noValue:
+                    # let the encoder complain about missing component
+                    component = value.getComponentByPosition(idx)
+
+                if namedTypes:
                     if namedType.isDefaulted and component == namedType.asn1Object:
                         if LOG:
                             LOG('not encoding DEFAULT component %r' % (namedType,))
@@ -568,24 +695,17 @@ class SequenceEncoder(AbstractItemEncoder):
                     if wrapType.typeId in (
                             univ.SetOf.typeId, univ.SequenceOf.typeId):
 
-                        substrate += encodeFun(
-                                component, asn1Spec,
-                                **dict(options, wrapType=wrapType.componentType))
-
-                    else:
-                        chunk = encodeFun(component, asn1Spec, **options)
+                        yield (component, asn1Spec, None,
+                               dict(options, wrapType=wrapType.componentType))
 
-                        if wrapType.isSameTypeWith(component):
-                            substrate += chunk
+                    elif wrapType.isSameTypeWith(component):
+                        yield component, asn1Spec, None, options
 
-                        else:
-                            substrate += encodeFun(chunk, wrapType, **options)
-
-                            if LOG:
-                                LOG('wrapped with wrap type %r' % (wrapType,))
+                    else:
+                        yield component, asn1Spec, wrapType, options
 
                 else:
-                    substrate += encodeFun(component, asn1Spec, **options)
+                    yield component, asn1Spec, None, options
 
         else:
             # bare Python value + ASN.1 schema
@@ -619,31 +739,48 @@ class SequenceEncoder(AbstractItemEncoder):
                     if componentSpec.typeId in (
                             univ.SetOf.typeId, univ.SequenceOf.typeId):
 
-                        substrate += encodeFun(
-                                component, componentSpec,
-                                **dict(options, wrapType=componentSpec.componentType))
+                        yield (component, componentSpec, None,
+                               dict(options, wrapType=componentSpec.componentType))
+
+                    elif componentSpec.isSameTypeWith(component):
+                        yield component, componentSpec, None, options
 
                     else:
-                        chunk = encodeFun(component, componentSpec, **options)
+                        yield component, componentSpec, componentSpec, options
 
-                        if componentSpec.isSameTypeWith(component):
-                            substrate += chunk
+                else:
+                    yield component, componentSpec, None, options
 
-                        else:
-                            substrate += encodeFun(chunk, componentSpec, **options)
+    def encodeValue(self, value, asn1Spec, encodeFun, **options):
 
-                            if LOG:
-                                LOG('wrapped with wrap type %r' % (componentSpec,))
+        chunks = []
 
-                else:
-                    substrate += encodeFun(component, componentSpec, **options)
+        for component, componentSpec, wrapType, componentOptions in self._iterComponents(
+                value, asn1Spec, **options):
 
-        return substrate, True, True
+            chunk = encodeFun(component, componentSpec, **componentOptions)
+
+            if wrapType is not None:
+                chunk = encodeFun(chunk, wrapType, **componentOptions)
+
+                if LOG:
+                    LOG('wrapped with wrap type %r' % (wrapType,))
+
+            chunks.append(chunk)
+
+        return null.join(chunks), True, True
 
 
 class SequenceOfEncoder(AbstractItemEncoder):
-    def _encodeComponents(self, value, asn1Spec, encodeFun, **options):
+    supportComponentsStreaming = True
 
+    def _iterComponents(self, value, asn1Spec, **options):
+        """Yield components to encode, in order.
+
+        Each component comes along with its ASN.1 type (if any), open
+        type to wrap component serialization into (if any) and options
+        to encode component with.
+        """
         if asn1Spec is None:
             inconsistency = value.isInconsistent
             if inconsistency:
@@ -652,17 +789,27 @@ class SequenceOfEncoder(AbstractItemEncoder):
         else:
             asn1Spec = asn1Spec.componentType
 
-        chunks = []
-
         wrapType = options.pop('wrapType', None)
 
         for idx, component in enumerate(value):
-            chunk = encodeFun(component, asn1Spec, **options)
-
             if (wrapType is not None and
                     not wrapType.isSameTypeWith(component)):
                 # wrap encoded value with wrapper container (e.g. ANY)
-                chunk = encodeFun(chunk, wrapType, **options)
+                yield component, asn1Spec, wrapType, options
+
+            else:
+                yield component, asn1Spec, None, options
+
+    def _encodeComponents(self, value, asn1Spec, encodeFun, **options):
+        chunks = []
+
+        for component, componentSpec, wrapType, componentOptions in self._iterComponents(
+                value, asn1Spec, **options):
+
+            chunk = encodeFun(component, componentSpec, **componentOptions)
+
+            if wrapType is not None:
+                chunk = encodeFun(chunk, wrapType, **componentOptions)
 
                 if LOG:
                     LOG('wrapped with wrap type %r' % (wrapType,))
@@ -679,7 +826,15 @@ class SequenceOfEncoder(AbstractItemEncoder):
 
 
 class ChoiceEncoder(AbstractItemEncoder):
-    def encodeValue(self, value, asn1Spec, encodeFun, **options):
+    supportComponentsStreaming = True
+
+    def _iterComponents(self, value, asn1Spec, **options):
+        """Yield the chosen component to encode.
+
+        The component comes along with its ASN.1 type (if any), open
+        type to wrap component serialization into (always `None`) and
+        options to encode component with.
+        """
         if asn1Spec is None:
             component = value.getComponent()
         else:
@@ -693,7 +848,17 @@ class ChoiceEncoder(AbstractItemEncoder):
             component = value[name]
             asn1Spec = asn1Spec[name]
 
-        return encodeFun(component, asn1Spec, **options), True, True
+        yield component, asn1Spec, None, options
+
+    def encodeValue(self, value, asn1Spec, encodeFun, **options):
+        substrate = null
+
+        for component, componentSpec, wrapType, componentOptions in self._iterComponents(
+                value, asn1Spec, **options):
+
+            substrate += encodeFun(component, componentSpec, **componentOptions)
+
+        return substrate, True, True
 
 
 class AnyEncoder(OctetStringEncoder):
@@ -701,7 +866,7 @@ class AnyEncoder(OctetStringEncoder):
         if asn1Spec is None:
             value = value.asOctets()
         elif not isOctetsType(value):
-            value = asn1Spec.clone(value).asOctets()
+            value = self._getOctets(value, asn1Spec)
 
         return value, not options.get('defMode', True), True
 
@@ -778,6 +943,13 @@ class SingleItemEncoder(object):
     fixedDefLengthMode = None
     fixedChunkSize = None
 
+    # serializations produced by decoders of these encoding rules
+    # can be copied into the output as-is
+    reusableEncodingRules = ('ber', 'cer', 'der')
+
+    # encoding rules constructed objects serializations get cached under
+    encodingRules = 'ber'
+
     TAG_MAP = TAG_MAP
     TYPE_MAP = TYPE_MAP
 
@@ -786,15 +958,42 @@ class SingleItemEncoder(object):
         self._typeMap = options.get('typeMap', self.TYPE_MAP)
 
     def __call__(self, value, asn1Spec=None, **options):
-        try:
-            if asn1Spec is None:
-                typeId = value.typeId
-            else:
-                typeId = asn1Spec.typeId
+        if (asn1Spec is None and
+                getattr(value, '_substrate', None) is not None and
+                self._isSubstrateReusable(value, **options)):
+            return value._substrate[1].tobytes()
 
-        except AttributeError:
-            raise error.PyAsn1Error('Value %r is not ASN.1 type instance '
-                                    'and "asn1Spec" not given' % (value,))
+        if self.fixedDefLengthMode is not None:
+            options.update(defMode=self.fixedDefLengthMode)
+
+        if self.fixedChunkSize is not None:
+            options.update(maxChunkSize=self.fixedChunkSize)
+
+        cacheKey = None
+        cacheSubstrate = False
+
+        if (asn1Spec is None and
+                options.get('cacheEncoding', False) and
+                self._tagMap is self.TAG_MAP and
+                self._typeMap is self.TYPE_MAP):
+
+            if isinstance(value, base.SimpleAsn1Type):
+                # simple values are immutable, their serialization only
+                # depends on encoding rules and mode
+                cacheKey = (self.__class__, options.get('defMode', True),
+                            options.get('maxChunkSize', 0))
+
+                if value._encodingCache is not None:
+                    try:
+                        return value._encodingCache[cacheKey]
+
+                    except KeyError:
+                        pass
+
+            elif isinstance(value, base.ConstructedAsn1Type):
+                cacheSubstrate = self._isSubstrateCacheable(value, **options)
+
+        concreteEncoder = self._getConcreteEncoder(value, asn1Spec)
 
         if LOG:
             LOG('encoder called in %sdef mode, chunk size %s for type %s, '
@@ -803,11 +1002,36 @@ class SingleItemEncoder(object):
                                 asn1Spec is None and value.prettyPrintType() or
                                 asn1Spec.prettyPrintType(), value))
 
-        if self.fixedDefLengthMode is not None:
-            options.update(defMode=self.fixedDefLengthMode)
+        substrate = concreteEncoder.encode(value, asn1Spec, self, **options)
 
-        if self.fixedChunkSize is not None:
-            options.update(maxChunkSize=self.fixedChunkSize)
+        if cacheKey is not None:
+            if value._encodingCache is None:
+                value._encodingCache = {}
+
+            value._encodingCache[cacheKey] = substrate
+
+        elif cacheSubstrate and substrate:
+            # reused on next encoding till this object or any of its
+            # constructed components gets modified
+            value._substrate = self.encodingRules, memoryview(substrate)
+
+        if LOG:
+            LOG('codec %s built %s octets of substrate: %s\nencoder '
+                'completed' % (concreteEncoder, len(substrate),
+                               debug.hexdump(substrate)))
+
+        return substrate
+
+    def _getConcreteEncoder(self, value, asn1Spec):
+        try:
+            if asn1Spec is None:
+                typeId = value.typeId
+            else:
+                typeId = asn1Spec.typeId
+
+        except AttributeError:
+            raise error.PyAsn1Error('Value %r is not ASN.1 type instance '
+                                    'and "asn1Spec" not given' % (value,))
 
         try:
             concreteEncoder = self._typeMap[typeId]
@@ -835,26 +1059,952 @@ class SingleItemEncoder(object):
                 LOG('using value codec %s chosen by tagSet '
                     '%s' % (concreteEncoder.__class__.__name__, tagSet))
 
-        substrate = concreteEncoder.encode(value, asn1Spec, self, **options)
+        return concreteEncoder
+
+    def _isContextFree(self, options):
+        # these options make serialization depend on the context
+        if 'omitEmptyOptionals' in options or 'wrapType' in options:
+            return False
+
+        if self.fixedDefLengthMode is None and (
+                not options.get('defMode', True) or
+                options.get('maxChunkSize', 0)):
+            return False
+
+        return True
+
+    def _isSubstrateCacheable(self, value, **options):
+        if not self._isContextFree(options):
+            return False
+
+        # do not shadow the serialization object has been decoded from
+        if value._substrate is not None and value._hasValidSubstrate():
+            return False
+
+        return True
+
+    def _isSubstrateReusable(self, value, **options):
+        encodingRules, substrate = value._substrate
+
+        if encodingRules not in self.reusableEncodingRules:
+            return False
+
+        if options.get('ifNotEmpty', False):
+            return False
+
+        if not self._isContextFree(options):
+            return False
+
+        if not value._hasValidSubstrate():
+            return False
 
         if LOG:
-            LOG('codec %s built %s octets of substrate: %s\nencoder '
-                'completed' % (concreteEncoder, len(substrate),
-                               debug.hexdump(substrate)))
+            LOG('reusing %s serialization of %s' % (
+                encodingRules, value.__class__.__name__))
+
+        return True
+
+
+class AbstractComponentsEncoder(object):
+    SINGLE_ITEM_ENCODER = SingleItemEncoder
+
+    def __init__(self, **options):
+        self._singleItemEncoder = self.SINGLE_ITEM_ENCODER(**options)
+
+    def _fixOptions(self, options):
+        if self._singleItemEncoder.fixedDefLengthMode is not None:
+            options.update(defMode=self._singleItemEncoder.fixedDefLengthMode)
+
+        if self._singleItemEncoder.fixedChunkSize is not None:
+            options.update(maxChunkSize=self._singleItemEncoder.fixedChunkSize)
+
+        return options
+
+    def _getComponents(self, value, asn1Spec, **options):
+        """Return concrete encoder and components of a value to stream.
+
+        Returns `None` instead of components iterator if value has to
+        be encoded as a whole.
+        """
+        encodeFun = self._singleItemEncoder
+
+        if (asn1Spec is None and
+                getattr(value, '_substrate', None) is not None and
+                encodeFun._isSubstrateReusable(value, **options)):
+            return None, None
+
+        concreteEncoder = encodeFun._getConcreteEncoder(value, asn1Spec)
+
+        if not concreteEncoder.supportComponentsStreaming:
+            return concreteEncoder, None
+
+        if (not options.get('defMode', True) and
+                not concreteEncoder.supportIndefLenMode):
+            return concreteEncoder, None
+
+        return concreteEncoder, concreteEncoder._iterComponents(
+            value, asn1Spec, **options)
+
+    def _encodeValue(self, concreteEncoder, value, asn1Spec, **options):
+        """Encode a value as a whole, with its concrete encoder if known."""
+        if concreteEncoder is None:
+            return self._singleItemEncoder(value, asn1Spec, **options)
+
+        return concreteEncoder.encode(
+            value, asn1Spec, self._singleItemEncoder, **options)
+
+    def _encodeComponent(self, value, asn1Spec, wrapType, **options):
+        substrate = self._singleItemEncoder(value, asn1Spec, **options)
+
+        if wrapType is not None:
+            substrate = self._singleItemEncoder(substrate, wrapType, **options)
 
         return substrate
 
+    @staticmethod
+    def _encodeHeaders(concreteEncoder, tagSet, length, defMode):
+        """Encode constructed value headers, outermost first.
+
+        Returns headers along with the total serialization length.
+        """
+        headers = []
+
+        for singleTag in tagSet.superTags:
+            header = ints2octs(
+                concreteEncoder.encodeTag(singleTag, True) +
+                concreteEncoder.encodeLength(length, defMode))
+
+            length += len(header)
+
+            headers.insert(0, header)
+
+        return headers, length
+
+
+class StreamingEncoder(AbstractComponentsEncoder):
+    """Create an iterator that turns ASN.1 object into BER octet stream chunks.
+
+    Walks `value` and yields its serialization piece by piece as soon as
+    it is produced, rather than building one octet string holding the
+    whole serialization. Constructed values are never encoded as a whole.
+
+    In indefinite length mode, constructed values are framed by
+    indefinite length headers and end-of-octets sentinels, so memory
+    footprint is bounded by the largest scalar component. In definite
+    length mode, lengths of constructed values are computed beforehand,
+    in a separate pass over `value` which does not retain any
+    serialization. These lengths are kept till their headers are
+    yielded, that takes one integer per constructed component of
+    `value` on top of the largest scalar component. Definite length
+    mode is also about twice as slow.
+
+    Constructed values whose component ordering depends on component
+    serialization (e.g. CER SET OF) are encoded as a whole.
+
+    Parameters
+    ----------
+    value: either a Python or pyasn1 object (e.g. :py:class:`~pyasn1.type.base.PyAsn1Item` derivative)
+        A Python or pyasn1 object to encode. If Python object is given, `asnSpec`
+        parameter is required to guide the encoding process.
+
+    Keyword Args
+    ------------
+    asn1Spec:
+        Optional ASN.1 schema or value object e.g. :py:class:`~pyasn1.type.base.PyAsn1Item` derivative
+
+    defMode: :py:class:`bool`
+        If :obj:`False`, produces indefinite length encoding
+
+    maxChunkSize: :py:class:`int`
+        Maximum chunk size in chunked encoding mode (0 denotes unlimited chunk size)
+
+    Yields
+    ------
+    : :py:class:`bytes` (Python 3) or :py:class:`str` (Python 2)
+        Consecutive pieces of given ASN.1 object serialization
+
+    Raises
+    ------
+    ~pyasn1.error.PyAsn1Error
+        On encoding errors
+
+    Examples
+    --------
+
+    .. code-block:: pycon
+
+        >>> seq = SequenceOf(componentType=Integer())
+        >>> seq.extend([1, 2, 3])
+        >>> list(StreamingEncoder(seq, defMode=False))
+        [b'0\x80', b'\x02\x01\x01', b'\x02\x01\x02', b'\x02\x01\x03', b'\x00\x00']
+
+    """
+    def __init__(self, value, asn1Spec=None, **options):
+        AbstractComponentsEncoder.__init__(self, **options)
+        self._value = value
+        self._asn1Spec = asn1Spec
+        self._options = options
+
+    def __iter__(self):
+        options = self._fixOptions(self._options.copy())
+
+        if options.get('defMode', True):
+            lengths = []
+
+            self._measure(self._value, self._asn1Spec, lengths, **options)
+
+            lengths = iter(lengths)
+
+        else:
+            lengths = None
+
+        for chunk in self._iterEncode(
+                self._value, self._asn1Spec, lengths, **options):
+            yield chunk
+
+    def _measure(self, value, asn1Spec, lengths, **options):
+        """Compute serialization length of a value.
+
+        Lengths of constructed values contents are collected into
+        `lengths` in the order of their headers in the serialization.
+        """
+        concreteEncoder, components = self._getComponents(
+            value, asn1Spec, **options)
+
+        if components is None:
+            return len(self._encodeValue(
+                concreteEncoder, value, asn1Spec, **options))
+
+        idx = len(lengths)
+
+        lengths.append(None)
+
+        length = 0
+
+        for component, componentSpec, wrapType, componentOptions in components:
+            if wrapType is None:
+                length += self._measure(
+                    component, componentSpec, lengths, **componentOptions)
+
+            else:
+                length += len(self._encodeComponent(
+                    component, componentSpec, wrapType, **componentOptions))
+
+        lengths[idx] = length
+
+        if asn1Spec is None:
+            tagSet = value.tagSet
+
+        else:
+            tagSet = asn1Spec.tagSet
+
+        if not tagSet or not length and options.get('ifNotEmpty', False):
+            return length
+
+        headers, length = self._encodeHeaders(
+            concreteEncoder, tagSet, length, True)
+
+        return length
+
+    def _iterEncode(self, value, asn1Spec, lengths, **options):
+        concreteEncoder, components = self._getComponents(
+            value, asn1Spec, **options)
+
+        if components is None:
+            yield self._encodeValue(concreteEncoder, value, asn1Spec, **options)
+            return
+
+        chunks = self._iterComponentsEncode(components, lengths)
+
+        if asn1Spec is None:
+            tagSet = value.tagSet
+
+        else:
+            tagSet = asn1Spec.tagSet
+
+        if lengths is not None:
+            length = next(lengths)
+
+            if tagSet and (length or not options.get('ifNotEmpty', False)):
+                headers, length = self._encodeHeaders(
+                    concreteEncoder, tagSet, length, True)
+
+                for header in headers:
+                    yield header
+
+            # empty components still consume their lengths
+            for chunk in chunks:
+                yield chunk
+
+            return
+
+        if not tagSet:
+            for chunk in chunks:
+                yield chunk
+
+            return
+
+        # headers are deferred till there is any content to frame
+        headers, length = self._encodeHeaders(
+            concreteEncoder, tagSet, 0, False)
+
+        for chunk in chunks:
+            if not chunk:
+                continue
+
+            if headers:
+                yield null.join(headers)
+                headers = None
+
+            yield chunk
+
+        if headers:
+            if options.get('ifNotEmpty', False):
+                return
+
+            yield null.join(headers)
+
+        yield concreteEncoder.eooOctetsSubstrate * len(tagSet.superTags)
+
+    def _iterComponentsEncode(self, components, lengths):
+        for component, componentSpec, wrapType, componentOptions in components:
+            if wrapType is None:
+                for chunk in self._iterEncode(
+                        component, componentSpec, lengths, **componentOptions):
+                    yield chunk
+
+            else:
+                yield self._encodeComponent(
+                    component, componentSpec, wrapType, **componentOptions)
+
+
+class TwoPassEncoder(AbstractComponentsEncoder):
+    """Turns ASN.1 object into BER octet stream in two passes.
+
+    The first pass walks `value` encoding its scalar components and
+    computing lengths of its constructed components. The second pass
+    joins all the pieces into one octet stream of pre-computed size.
+
+    Unlike :py:class:`Encoder`, which prepends tag and length to the
+    serialization of every constructed component, this encoder copies
+    each piece of serialization only once regardless of nesting depth.
+    That pays off for deeply nested values.
+
+    Keyword Args
+    ------------
+    tagMap: :py:class:`dict`
+        Optional map of ASN.1 tags to value encoders
+
+    typeMap: :py:class:`dict`
+        Optional map of ASN.1 type IDs to value encoders
+
+    Examples
+    --------
+
+    .. code-block:: pycon
+
+        >>> seq = SequenceOf(componentType=Integer())
+        >>> seq.extend([1, 2, 3])
+        >>> encode = TwoPassEncoder()
+        >>> encode(seq)
+        b'0\t\x02\x01\x01\x02\x01\x02\x02\x01\x03'
+
+    """
+    def __call__(self, value, asn1Spec=None, **options):
+        chunks = []
+
+        self._plan(value, asn1Spec, chunks, **self._fixOptions(options))
+
+        return null.join(chunks)
+
+    def encodeInto(self, value, buffer, offset=0, asn1Spec=None, **options):
+        chunks = []
+
+        length = self._plan(
+            value, asn1Spec, chunks, **self._fixOptions(options))
+
+        if _PY2 and isinstance(buffer, mmap.mmap):
+            # Python 2 mmap is not exposed through memoryview, but
+            # supports slice assignment and len() as well
+            view = buffer
+
+        else:
+            view = memoryview(buffer)
+
+        if not 0 <= offset <= len(view):
+            raise error.PyAsn1Error(
+                'Offset %d is out of %d octets buffer' % (offset, len(view)))
+
+        if offset + length > len(view):
+            raise error.SubstrateOverflowError(
+                '%d octets of serialization do not fit %d octets buffer at '
+                'offset %d' % (length, len(view), offset),
+                context={'length': length, 'offset': offset})
+
+        for chunk in chunks:
+            end = offset + len(chunk)
+            view[offset:end] = chunk
+            offset = end
+
+        return length
+
+    def _plan(self, value, asn1Spec, chunks, **options):
+        """Collect serialization pieces of a value, in order.
+
+        Returns total length of the pieces.
+        """
+        concreteEncoder, components = self._getComponents(
+            value, asn1Spec, **options)
+
+        if components is None:
+            substrate = self._encodeValue(
+                concreteEncoder, value, asn1Spec, **options)
+            chunks.append(substrate)
+            return len(substrate)
+
+        idx = len(chunks)
+
+        # placeholder for the headers
+        chunks.append(null)
+
+        length = 0
+
+        for component, componentSpec, wrapType, componentOptions in components:
+            if wrapType is None:
+                length += self._plan(
+                    component, componentSpec, chunks, **componentOptions)
+
+            else:
+                substrate = self._encodeComponent(
+                    component, componentSpec, wrapType, **componentOptions)
+                chunks.append(substrate)
+                length += len(substrate)
+
+        if asn1Spec is None:
+            tagSet = value.tagSet
+
+        else:
+            tagSet = asn1Spec.tagSet
+
+        if not tagSet or not length and options.get('ifNotEmpty', False):
+            return length
+
+        defMode = options.get('defMode', True)
+
+        headers, length = self._encodeHeaders(
+            concreteEncoder, tagSet, length, defMode)
+
+        chunks[idx] = null.join(headers)
+
+        if not defMode:
+            eoo = concreteEncoder.eooOctetsSubstrate * len(headers)
+            chunks.append(eoo)
+            length += len(eoo)
+
+        return length
+
+
+(planGeneric,
+ planScalar,
+ planSequence,
+ planSequenceOf,
+ planChoice) = [x for x in range(5)]
+
+
+class EncodingPlan(object):
+    """Precomputed encoding instructions for one ASN.1 schema node."""
+    def __init__(self, asn1Spec):
+        self.asn1Spec = asn1Spec
+        self.kind = planGeneric
+        self.concreteEncoder = None
+        # encoded tags of all tagging layers, base tag first, for
+        # primitive and constructed serialization
+        self.identifiers = ((), ())
+        self.omitEmptyOptionals = False
+        self.components = ()
+        # names of SEQUENCE, SET and CHOICE components
+        self.names = ()
+        self.optional = ()
+        # DEFAULT values, `noValue` for non-defaulted components
+        self.defaults = ()
+        self.choices = None
+
+
+class CompiledEncoder(AbstractComponentsEncoder):
+    """Create a BER encoder specialized for one ASN.1 schema.
+
+    Walks `asn1Spec` once and precomputes what the generic encoder
+    would otherwise figure out for every component of every value:
+    the payload encoder of each component, the encoded tags and the
+    OPTIONAL/DEFAULT components omission rules.
+
+    The resulting object encodes values of `asn1Spec` type, given either
+    as ASN.1 objects or as Python built-in values. The parts of the
+    schema that can not be planned in advance (e.g. ANY type, open types
+    or SET components ordering) are handed over to the generic encoder.
+
+    Parameters
+    ----------
+    asn1Spec: :py:class:`~pyasn1.type.base.PyAsn1Item`
+        A pyasn1 type object to specialize the encoder for
+
+    Keyword Args
+    ------------
+    tagMap: :py:class:`dict`
+        Optional map of ASN.1 tags to value encoders
+
+    typeMap: :py:class:`dict`
+        Optional map of ASN.1 type IDs to value encoders
+
+    Any other keyword arguments are used as default encoding options
+    (e.g. `defMode`) for each value.
+
+    Examples
+    --------
+
+    .. code-block:: pycon
+
+        >>> encodeSeq = CompiledEncoder(SequenceOf(componentType=Integer()))
+        >>> encodeSeq([1, 2, 3])
+        b'0\t\x02\x01\x01\x02\x01\x02\x02\x01\x03'
+
+    """
+    def __init__(self, asn1Spec, **options):
+        AbstractComponentsEncoder.__init__(self, **options)
+        self._tagMap = options.pop('tagMap', self._singleItemEncoder.TAG_MAP)
+        self._typeMap = options.pop('typeMap', self._singleItemEncoder.TYPE_MAP)
+        self._plans = {}
+        self._plan = self._compile(asn1Spec)
+        self._options = self._fixOptions(options)
+
+        # serializations made with custom codecs are not to be cached
+        self._canCacheEncoding = (
+            self._tagMap is self._singleItemEncoder.TAG_MAP and
+            self._typeMap is self._singleItemEncoder.TYPE_MAP)
+
+        if LOG:
+            LOG('compiled encoding plan for %s' % asn1Spec.prettyPrintType())
+
+    def __call__(self, value, **options):
+        """Turn a value of the compiled schema into BER octet stream.
+
+        Parameters
+        ----------
+        value: either a Python or pyasn1 object (e.g. :py:class:`~pyasn1.type.base.PyAsn1Item` derivative)
+            A value of the ASN.1 type the encoder has been compiled for
+
+        Keyword Args
+        ------------
+        Encoding options (e.g. `defMode`) overriding the ones given
+        at compilation time
+
+        Returns
+        -------
+        : :py:class:`bytes` (Python 3) or :py:class:`str` (Python 2)
+            Given value encoded into BER octet stream
+
+        Raises
+        ------
+        ~pyasn1.error.PyAsn1Error
+            On encoding errors
+        """
+        if options:
+            options = self._fixOptions(dict(self._options, **options))
+
+        else:
+            options = self._options
+
+        ifNotEmpty = options.get('ifNotEmpty', False)
+
+        if ifNotEmpty:
+            options = dict(options)
+            del options['ifNotEmpty']
+
+        return self._encodeComponent(self._plan, value, ifNotEmpty, options)
+
+    def _compile(self, asn1Spec):
+        try:
+            return self._plans[id(asn1Spec)]
+
+        except KeyError:
+            pass
+
+        plan = self._plans[id(asn1Spec)] = EncodingPlan(asn1Spec)
+
+        tagSet = asn1Spec.tagSet
+        typeId = asn1Spec.typeId
+
+        try:
+            concreteEncoder = self._typeMap[typeId]
+
+        except KeyError:
+            baseTagSet = tag.TagSet(tagSet.baseTag, tagSet.baseTag)
+            concreteEncoder = self._tagMap.get(baseTagSet)
+
+        if concreteEncoder is None or typeId == univ.Any.typeId:
+            return plan
+
+        plan.concreteEncoder = concreteEncoder
+
+        plan.identifiers = tuple(
+            [ints2octs(concreteEncoder.encodeTag(singleTag, isConstructed))
+             for singleTag in tagSet.superTags]
+            for isConstructed in (False, True))
+
+        if typeId in (univ.Sequence.typeId, univ.Set.typeId):
+            namedTypes = asn1Spec.componentType
+
+            # components order depends on anything but the schema
+            if (not isinstance(concreteEncoder, SequenceEncoder) or
+                    not concreteEncoder.supportComponentsStreaming):
+                return plan
+
+            # schema-less or with open types to wrap
+            if not namedTypes or any(
+                    namedType.openType for namedType in namedTypes.namedTypes):
+                return plan
+
+            plan.kind = planSequence
+            plan.omitEmptyOptionals = concreteEncoder.omitEmptyOptionals
+
+            components = []
+            defaults = []
+
+            for namedType in namedTypes.namedTypes:
+                components.append(self._compile(namedType.asn1Object))
+
+                if namedType.isDefaulted:
+                    defaults.append(namedType.asn1Object)
+
+                else:
+                    defaults.append(univ.noValue)
+
+            plan.components = tuple(components)
+            plan.names = tuple(
+                namedType.name for namedType in namedTypes.namedTypes)
+            plan.optional = tuple(
+                namedType.isOptional for namedType in namedTypes.namedTypes)
+            plan.defaults = tuple(defaults)
+
+        elif typeId in (univ.SequenceOf.typeId, univ.SetOf.typeId):
+            if (not isinstance(concreteEncoder, SequenceOfEncoder) or
+                    not concreteEncoder.supportComponentsStreaming or
+                    asn1Spec.componentType is None):
+                return plan
+
+            plan.kind = planSequenceOf
+            plan.components = self._compile(asn1Spec.componentType),
+
+        elif typeId == univ.Choice.typeId:
+            namedTypes = asn1Spec.componentType
+
+            if (not isinstance(concreteEncoder, ChoiceEncoder) or
+                    not namedTypes):
+                return plan
+
+            plan.kind = planChoice
+            plan.components = tuple(
+                self._compile(namedType.asn1Object)
+                for namedType in namedTypes.namedTypes)
+            plan.names = tuple(
+                namedType.name for namedType in namedTypes.namedTypes)
+            plan.choices = dict(zip(plan.names, plan.components))
+
+        elif not isinstance(asn1Spec, base.ConstructedAsn1Type):
+            plan.kind = planScalar
+
+        return plan
+
+    def _encodeComponent(self, plan, value, ifNotEmpty, options):
+        kind = plan.kind
+
+        if kind is planScalar:
+            return self._encodeScalar(plan, value, ifNotEmpty, options)
+
+        if kind is planGeneric:
+            return self._encodeGeneric(plan, value, ifNotEmpty, options)
+
+        isObject = isinstance(value, base.Asn1Item)
+
+        if isObject and getattr(value, '_substrate', None) is not None:
+            if (not ifNotEmpty and
+                    self._singleItemEncoder._isSubstrateReusable(
+                        value, **options)):
+                return value._substrate[1].tobytes()
+
+        if kind is planSequence:
+            substrate = self._encodeSequence(plan, value, isObject, options)
+
+        elif kind is planSequenceOf:
+            substrate = self._encodeSequenceOf(
+                plan, value, isObject, ifNotEmpty, options)
+
+        else:
+            substrate = self._encodeChoice(
+                plan, value, isObject, ifNotEmpty, options)
+
+        identifiers = plan.identifiers[True]
+
+        if identifiers:
+            if not substrate and ifNotEmpty:
+                return substrate
+
+            substrate = plan.concreteEncoder.addHeaders(
+                substrate, True, identifiers, options.get('defMode', True))
+
+        if (substrate and isObject and self._canCacheEncoding and
+                options.get('cacheEncoding', False) and
+                self._singleItemEncoder._isSubstrateCacheable(
+                    value, **options)):
+            value._substrate = (self._singleItemEncoder.encodingRules,
+                                memoryview(substrate))
+
+        return substrate
+
+    def _encodeGeneric(self, plan, value, ifNotEmpty, options):
+        if isinstance(value, base.Asn1Item):
+            asn1Spec = None
+
+        else:
+            asn1Spec = plan.asn1Spec
+
+        if ifNotEmpty:
+            options = dict(options, ifNotEmpty=ifNotEmpty)
+
+        return self._singleItemEncoder(value, asn1Spec, **options)
+
+    def _encodeScalar(self, plan, value, ifNotEmpty, options):
+        concreteEncoder = plan.concreteEncoder
+
+        if isinstance(value, base.Asn1Item):
+            asn1Spec = None
+
+        else:
+            asn1Spec = plan.asn1Spec
+
+        try:
+            substrate, isConstructed, isOctets = concreteEncoder.encodeValue(
+                value, asn1Spec, self._singleItemEncoder, **options)
+
+        except error.PyAsn1Error:
+            exc = sys.exc_info()
+            raise error.PyAsn1Error(
+                'Error encoding %r: %s' % (value, exc[1]))
+
+        if not isOctets:
+            substrate = ints2octs(substrate)
+
+        identifiers = plan.identifiers[isConstructed]
+
+        if not identifiers:
+            return substrate
+
+        if not substrate and isConstructed and ifNotEmpty:
+            return substrate
+
+        return concreteEncoder.addHeaders(
+            substrate, isConstructed, identifiers,
+            options.get('defMode', True))
+
+    def _encodeSequence(self, plan, value, isObject, options):
+        omitEmptyOptionals = options.get(
+            'omitEmptyOptionals', plan.omitEmptyOptionals)
+
+        chunks = []
+
+        if isObject:
+            inconsistency = value.isInconsistent
+            if inconsistency:
+                raise inconsistency
+
+            for idx, componentPlan in enumerate(plan.components):
+                component = value.getComponentByPosition(
+                    idx, instantiate=False)
+
+                isOptional = plan.optional[idx]
+                defaultValue = plan.defaults[idx]
+
+                if component is univ.noValue:
+                    if isOptional or defaultValue is not univ.noValue:
+                        continue
+
+                    # let the encoder complain about missing component
+                    component = value.getComponentByPosition(idx)
+
+                elif isOptional and not component.isValue:
+                    continue
+
+                elif (defaultValue is not univ.noValue and
+                        component == defaultValue):
+                    continue
+
+                chunks.append(self._encodeComponent(
+                    componentPlan, component,
+                    omitEmptyOptionals and isOptional, options))
+
+        else:
+            for idx, componentPlan in enumerate(plan.components):
+                name = plan.names[idx]
+
+                isOptional = plan.optional[idx]
+                defaultValue = plan.defaults[idx]
+
+                try:
+                    component = value[name]
+
+                except KeyError:
+                    if isOptional or defaultValue is not univ.noValue:
+                        continue
+
+                    raise error.PyAsn1Error(
+                        'Component name "%s" not found in %r' % (name, value))
+
+                if (defaultValue is not univ.noValue and
+                        component == defaultValue):
+                    continue
+
+                chunks.append(self._encodeComponent(
+                    componentPlan, component,
+                    omitEmptyOptionals and isOptional, options))
+
+        return null.join(chunks)
+
+    def _encodeSequenceOf(self, plan, value, isObject, ifNotEmpty, options):
+        if isObject:
+            inconsistency = value.isInconsistent
+            if inconsistency:
+                raise inconsistency
+
+        componentPlan, = plan.components
+
+        encodeComponent = self._encodeComponent
+
+        return null.join(
+            [encodeComponent(componentPlan, component, ifNotEmpty, options)
+             for component in value])
+
+    def _encodeChoice(self, plan, value, isObject, ifNotEmpty, options):
+        if isObject:
+            name = value.getName()
+
+        else:
+            names = [name for name in plan.names if name in value]
+
+            if len(names) != 1:
+                raise error.PyAsn1Error(
+                    '%s components for Choice at %r' % (
+                        len(names) and 'Multiple ' or 'None ', value))
+
+            name, = names
+
+        return self._encodeComponent(
+            plan.choices[name], value[name], ifNotEmpty, options)
+
 
 class Encoder(object):
     SINGLE_ITEM_ENCODER = SingleItemEncoder
+    TWO_PASS_ENCODER = TwoPassEncoder
+    COMPILED_ENCODER = CompiledEncoder
 
     def __init__(self, **options):
         self._singleItemEncoder = self.SINGLE_ITEM_ENCODER(**options)
+        self._twoPassEncoder = self.TWO_PASS_ENCODER(**options)
+        self._options = options
 
     def __call__(self, pyObject, asn1Spec=None, **options):
         return self._singleItemEncoder(
             pyObject, asn1Spec=asn1Spec, **options)
 
+    def encodeInto(self, pyObject, buffer, offset=0, asn1Spec=None, **options):
+        """Encode ASN.1 object into a writable buffer.
+
+        Serialization is written into `buffer` starting at `offset`
+        without creating an intermediate octet string holding the
+        whole serialization.
+
+        Parameters
+        ----------
+        pyObject: either a Python or pyasn1 object (e.g. :py:class:`~pyasn1.type.base.PyAsn1Item` derivative)
+            A Python or pyasn1 object to encode. If Python object is given, `asnSpec`
+            parameter is required to guide the encoding process.
+
+        buffer: :py:class:`bytearray`, :py:class:`memoryview` or :py:class:`mmap.mmap`
+            Writable buffer to put serialization into
+
+        offset: :py:class:`int`
+            Position in `buffer` to start writing serialization at
+
+        Keyword Args
+        ------------
+        asn1Spec:
+            Optional ASN.1 schema or value object e.g. :py:class:`~pyasn1.type.base.PyAsn1Item` derivative
+
+        Returns
+        -------
+        : :py:class:`int`
+            Number of octets written into `buffer`
+
+        Raises
+        ------
+        ~pyasn1.error.SubstrateOverflowError
+            If serialization does not fit `buffer`, in which case
+            `buffer` is left intact
+
+        ~pyasn1.error.PyAsn1Error
+            On other encoding errors
+
+        Examples
+        --------
+
+        .. code-block:: pycon
+
+            >>> seq = SequenceOf(componentType=Integer())
+            >>> seq.extend([1, 2, 3])
+            >>> buffer = bytearray(16)
+            >>> encode.encodeInto(seq, buffer, offset=2)
+            11
+            >>> buffer
+            bytearray(b'\x00\x000\t\x02\x01\x01\x02\x01\x02\x02\x01\x03\x00\x00\x00')
+
+        """
+        return self._twoPassEncoder.encodeInto(
+            pyObject, buffer, offset, asn1Spec=asn1Spec, **options)
+
+    def compile(self, asn1Spec, **options):
+        """Create an encoder specialized for the given ASN.1 schema.
+
+        The returned callable behaves as this encoder called with
+        the same `asn1Spec` over and over again, but does not repeat
+        schema dispatch for every value it encodes.
+
+        Parameters
+        ----------
+        asn1Spec: :py:class:`~pyasn1.type.base.PyAsn1Item`
+            A pyasn1 type object to specialize the encoder for
+
+        Keyword Args
+        ------------
+        Encoding options (e.g. `defMode`) to apply to each value
+
+        Returns
+        -------
+        : :py:class:`CompiledEncoder`
+            Callable taking a Python or pyasn1 value of `asn1Spec` type
+            and returning its serialization
+
+        Examples
+        --------
+
+        .. code-block:: pycon
+
+            >>> encodeSeq = encode.compile(SequenceOf(componentType=Integer()))
+            >>> encodeSeq([1, 2, 3])
+            b'0\t\x02\x01\x01\x02\x01\x02\x02\x01\x03'
+
+        """
+        return self.COMPILED_ENCODER(
+            asn1Spec, **dict(self._options, **options))
+
 
 #: Turns ASN.1 object into BER octet stream.
 #:
@@ -878,6 +2028,15 @@ class Encoder(object):
 #: maxChunkSize: :py:class:`int`
 #:     Maximum chunk size in chunked encoding mode (0 denotes unlimited chunk size)
 #:
+#: cacheEncoding: :py:class:`bool`
+#:     If :obj:`True`, ASN.1 objects being encoded remember their
+#:     serialization so that encoding the same objects again, perhaps
+#:     as components of other messages, mostly copies octets. Simple
+#:     objects (e.g. :py:class:`~pyasn1.type.univ.ObjectIdentifier`)
+#:     never change, constructed ones get re-encoded only if they or
+#:     any of their constructed components have been modified since
+#:     serialization
+#:
 #: Returns
 #: -------
 #: : :py:class:`bytes` (Python 3) or :py:class:`str` (Python 2)
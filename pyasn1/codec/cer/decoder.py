@@ -10,7 +10,8 @@ from pyasn1.codec.ber import decoder
 from pyasn1.compat.octets import oct2int
 from pyasn1.type import univ
 
-__all__ = ['decode', 'StreamingDecoder']
+__all__ = ['decode', 'StreamingDecoder', 'CompiledDecoder', 'IterativeDecoder',
+           'PushDecoder']
 
 SubstrateUnderrunError = error.SubstrateUnderrunError
 
@@ -30,7 +31,13 @@ class BooleanPayloadDecoder(decoder.AbstractSimplePayloadDecoder):
             if isinstance(chunk, SubstrateUnderrunError):
                 yield chunk
 
-        byte = oct2int(chunk[0])
+        yield self.primitiveValueDecoder(chunk, asn1Spec, tagSet, **options)
+
+    def primitiveValueDecoder(self, octets, asn1Spec, tagSet=None, **options):
+        if len(octets) != 1:
+            raise error.PyAsn1Error('Not single-octet Boolean payload')
+
+        byte = oct2int(octets[0])
 
         # CER/DER specifies encoding of TRUE as 0xFF and FALSE as 0x0, while
         # BER allows any non-zero value as TRUE; cf. sections 8.2.2. and 11.1 
@@ -44,7 +51,7 @@ class BooleanPayloadDecoder(decoder.AbstractSimplePayloadDecoder):
         else:
             raise error.PyAsn1Error('Unexpected Boolean payload: %s' % byte)
 
-        yield self._createComponent(asn1Spec, tagSet, value, **options)
+        return self._createComponent(asn1Spec, tagSet, value, **options)
 
 
 # TODO: prohibit non-canonical encoding
@@ -76,6 +83,8 @@ class SingleItemDecoder(decoder.SingleItemDecoder):
     TAG_MAP = TAG_MAP
     TYPE_MAP = TYPE_MAP
 
+    encodingRules = 'cer'
+
 
 class StreamingDecoder(decoder.StreamingDecoder):
     __doc__ = decoder.StreamingDecoder.__doc__
@@ -83,10 +92,29 @@ class StreamingDecoder(decoder.StreamingDecoder):
     SINGLE_ITEM_DECODER = SingleItemDecoder
 
 
+class CompiledDecoder(decoder.CompiledDecoder):
+    __doc__ = decoder.CompiledDecoder.__doc__
+
+    SINGLE_ITEM_DECODER = SingleItemDecoder
+
+
+class IterativeDecoder(decoder.IterativeDecoder):
+    __doc__ = decoder.IterativeDecoder.__doc__
+
+    SINGLE_ITEM_DECODER = SingleItemDecoder
+
+
 class Decoder(decoder.Decoder):
     __doc__ = decoder.Decoder.__doc__
 
     STREAMING_DECODER = StreamingDecoder
+    COMPILED_DECODER = CompiledDecoder
+
+
+class PushDecoder(decoder.PushDecoder):
+    __doc__ = decoder.PushDecoder.__doc__
+
+    DECODER = Decoder
 
 
 #: Turns CER octet stream into an ASN.1 object.
@@ -6,11 +6,12 @@
 #
 from pyasn1 import error
 from pyasn1.codec.ber import encoder
-from pyasn1.compat.octets import str2octs, null
+from pyasn1.compat.octets import str2octs, null, ints2octs, octs2ints
 from pyasn1.type import univ
 from pyasn1.type import useful
 
-__all__ = ['Encoder', 'encode']
+__all__ = ['Encoder', 'StreamingEncoder', 'TwoPassEncoder', 'CompiledEncoder',
+           'encode']
 
 
 class BooleanEncoder(encoder.IntegerEncoder):
@@ -49,10 +50,11 @@ class TimeEncoderMixIn(object):
         # - time in UTC (Z)
         # - only dot is allowed for fractions
 
-        if asn1Spec is not None:
-            value = asn1Spec.clone(value)
+        if asn1Spec is None:
+            numbers = value.asNumbers()
 
-        numbers = value.asNumbers()
+        else:
+            numbers = tuple(octs2ints(self._getOctets(value, asn1Spec)))
 
         if self.PLUS_CHAR in numbers or self.MINUS_CHAR in numbers:
             raise error.PyAsn1Error('Must be UTC time: %r' % value)
@@ -65,8 +67,6 @@ class TimeEncoderMixIn(object):
 
         if self.DOT_CHAR in numbers:
 
-            isModified = False
-
             numbers = list(numbers)
 
             searchIndex = min(numbers.index(self.DOT_CHAR) + 4, len(numbers) - 1)
@@ -74,7 +74,6 @@ class TimeEncoderMixIn(object):
             while numbers[searchIndex] != self.DOT_CHAR:
                 if numbers[searchIndex] == self.ZERO_CHAR:
                     del numbers[searchIndex]
-                    isModified = True
 
                 searchIndex -= 1
 
@@ -84,19 +83,11 @@ class TimeEncoderMixIn(object):
                 if numbers[searchIndex] == self.Z_CHAR:
                     # drop hanging comma
                     del numbers[searchIndex - 1]
-                    isModified = True
-
-            if isModified:
-                value = value.clone(numbers)
 
         if not self.MIN_LENGTH < len(numbers) < self.MAX_LENGTH:
             raise error.PyAsn1Error('Length constraint violated: %r' % value)
 
-        options.update(maxChunkSize=1000)
-
-        return encoder.OctetStringEncoder.encodeValue(
-            self, value, asn1Spec, encodeFun, **options
-        )
+        return ints2octs(numbers), False, True
 
 
 class GeneralizedTimeEncoder(TimeEncoderMixIn, encoder.OctetStringEncoder):
@@ -110,6 +101,9 @@ class UTCTimeEncoder(TimeEncoderMixIn, encoder.OctetStringEncoder):
 
 
 class SetOfEncoder(encoder.SequenceOfEncoder):
+    # components order depends on their serialization
+    supportComponentsStreaming = False
+
     def encodeValue(self, value, asn1Spec, encodeFun, **options):
         chunks = self._encodeComponents(
             value, asn1Spec, encodeFun, **options)
@@ -141,6 +135,9 @@ class SequenceOfEncoder(encoder.SequenceOfEncoder):
 
 
 class SetEncoder(encoder.SequenceEncoder):
+    # components order depends on their tags
+    supportComponentsStreaming = False
+
     @staticmethod
     def _componentSortKey(componentAndType):
         """Sort SET components by tag
@@ -162,7 +159,7 @@ class SetEncoder(encoder.SequenceEncoder):
 
     def encodeValue(self, value, asn1Spec, encodeFun, **options):
 
-        substrate = null
+        chunks = []
 
         comps = []
         compsMap = {}
@@ -175,15 +172,25 @@ class SetEncoder(encoder.SequenceEncoder):
 
             namedTypes = value.componentType
 
-            for idx, component in enumerate(value.values()):
+            for idx, name in enumerate(value):
+                # absent components are not instantiated to keep
+                # serialization cached in `value` valid
+                component = value.getComponentByPosition(
+                    idx, instantiate=False)
+
                 if namedTypes:
                     namedType = namedTypes[idx]
 
-                    if namedType.isOptional and not component.isValue:
-                            continue
+                    if ((namedType.isOptional or namedType.isDefaulted) and
+                            component is univ.noValue):
+                        continue
+
+                if component is univ.noValue:
+                    component = value.getComponentByPosition(idx)
 
+                if namedTypes:
                     if namedType.isDefaulted and component == namedType.asn1Object:
-                            continue
+                        continue
 
                     compsMap[id(component)] = namedType
 
@@ -225,9 +232,9 @@ class SetEncoder(encoder.SequenceEncoder):
                 if wrapType.tagSet and not wrapType.isSameTypeWith(comp):
                     chunk = encodeFun(chunk, wrapType, **options)
 
-            substrate += chunk
+            chunks.append(chunk)
 
-        return substrate, True, True
+        return null.join(chunks), True, True
 
 
 class SequenceEncoder(encoder.SequenceEncoder):
@@ -268,9 +275,32 @@ class SingleItemEncoder(encoder.SingleItemEncoder):
     TAG_MAP = TAG_MAP
     TYPE_MAP = TYPE_MAP
 
+    reusableEncodingRules = ('cer',)
+    encodingRules = 'cer'
+
+
+class TwoPassEncoder(encoder.TwoPassEncoder):
+    __doc__ = encoder.TwoPassEncoder.__doc__
+
+    SINGLE_ITEM_ENCODER = SingleItemEncoder
+
+
+class StreamingEncoder(encoder.StreamingEncoder):
+    __doc__ = encoder.StreamingEncoder.__doc__
+
+    SINGLE_ITEM_ENCODER = SingleItemEncoder
+
+
+class CompiledEncoder(encoder.CompiledEncoder):
+    __doc__ = encoder.CompiledEncoder.__doc__
+
+    SINGLE_ITEM_ENCODER = SingleItemEncoder
+
 
 class Encoder(encoder.Encoder):
     SINGLE_ITEM_ENCODER = SingleItemEncoder
+    TWO_PASS_ENCODER = TwoPassEncoder
+    COMPILED_ENCODER = CompiledEncoder
 
 
 #: Turns ASN.1 object into CER octet stream.
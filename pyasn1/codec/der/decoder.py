@@ -7,7 +7,8 @@
 from pyasn1.codec.cer import decoder
 from pyasn1.type import univ
 
-__all__ = ['decode', 'StreamingDecoder']
+__all__ = ['decode', 'StreamingDecoder', 'CompiledDecoder', 'IterativeDecoder',
+           'PushDecoder']
 
 
 class BitStringPayloadDecoder(decoder.BitStringPayloadDecoder):
@@ -46,6 +47,8 @@ class SingleItemDecoder(decoder.SingleItemDecoder):
 
     supportIndefLength = False
 
+    encodingRules = 'der'
+
 
 class StreamingDecoder(decoder.StreamingDecoder):
     __doc__ = decoder.StreamingDecoder.__doc__
@@ -53,10 +56,29 @@ class StreamingDecoder(decoder.StreamingDecoder):
     SINGLE_ITEM_DECODER = SingleItemDecoder
 
 
+class CompiledDecoder(decoder.CompiledDecoder):
+    __doc__ = decoder.CompiledDecoder.__doc__
+
+    SINGLE_ITEM_DECODER = SingleItemDecoder
+
+
+class IterativeDecoder(decoder.IterativeDecoder):
+    __doc__ = decoder.IterativeDecoder.__doc__
+
+    SINGLE_ITEM_DECODER = SingleItemDecoder
+
+
 class Decoder(decoder.Decoder):
     __doc__ = decoder.Decoder.__doc__
 
     STREAMING_DECODER = StreamingDecoder
+    COMPILED_DECODER = CompiledDecoder
+
+
+class PushDecoder(decoder.PushDecoder):
+    __doc__ = decoder.PushDecoder.__doc__
+
+    DECODER = Decoder
 
 
 #: Turns DER octet stream into an ASN.1 object.
@@ -8,7 +8,7 @@ from pyasn1 import error
 from pyasn1.codec.cer import encoder
 from pyasn1.type import univ
 
-__all__ = ['Encoder', 'encode']
+__all__ = ['Encoder', 'TwoPassEncoder', 'CompiledEncoder', 'encode']
 
 
 class SetEncoder(encoder.SetEncoder):
@@ -65,9 +65,26 @@ class SingleItemEncoder(encoder.SingleItemEncoder):
     TAG_MAP = TAG_MAP
     TYPE_MAP = TYPE_MAP
 
+    reusableEncodingRules = ('der',)
+    encodingRules = 'der'
+
+
+class TwoPassEncoder(encoder.TwoPassEncoder):
+    __doc__ = encoder.TwoPassEncoder.__doc__
+
+    SINGLE_ITEM_ENCODER = SingleItemEncoder
+
+
+class CompiledEncoder(encoder.CompiledEncoder):
+    __doc__ = encoder.CompiledEncoder.__doc__
+
+    SINGLE_ITEM_ENCODER = SingleItemEncoder
+
 
 class Encoder(encoder.Encoder):
     SINGLE_ITEM_ENCODER = SingleItemEncoder
+    TWO_PASS_ENCODER = TwoPassEncoder
+    COMPILED_ENCODER = CompiledEncoder
 
 
 #: Turns ASN.1 object into DER octet stream.
@@ -0,0 +1,240 @@
+#
+# This file is part of pyasn1 software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pyasn1/license.html
+#
+import mmap
+import multiprocessing
+import os
+import sys
+
+try:
+    from concurrent import futures
+
+except ImportError:  # Python 2 without `futures` backport
+    futures = None
+
+from pyasn1 import error
+from pyasn1.codec.ber import decoder as ber_decoder
+from pyasn1.codec.native import encoder as native_encoder
+from pyasn1.type import univ
+
+_PY2 = sys.version_info < (3,)
+
+__all__ = ['iterRecords', 'ParallelDecoder']
+
+
+def iterRecords(substrate, offset=0):
+    """Split BER/CER/DER serialization into top-level TLVs.
+
+    Only TLV headers are parsed, values are skipped by length. Nested
+    TLVs are walked only inside indefinite length TLVs.
+
+    Parameters
+    ----------
+    substrate: :py:class:`bytes`, :py:class:`bytearray`, :py:class:`memoryview` or :py:class:`mmap.mmap`
+        Concatenated BER/CER/DER serializations
+
+    Keyword Args
+    ------------
+    offset: :py:class:`int`
+        Position of the first record within `substrate`
+
+    Yields
+    ------
+    : :py:class:`tuple`
+        Start and end positions of each top-level TLV in `substrate`
+
+    Raises
+    ------
+    ~pyasn1.error.SubstrateUnderrunError
+        If the last record is truncated
+    """
+    if isinstance(substrate, univ.OctetString):
+        substrate = substrate.asOctets()
+
+    try:
+        substrate = memoryview(substrate)
+
+    except TypeError:
+        raise error.UnsupportedSubstrateError(
+            'Cannot split ' + substrate.__class__.__name__)
+
+    try:
+        while offset < len(substrate):
+            end = ber_decoder.skipTlv(substrate, offset)
+
+            yield offset, end
+
+            offset = end
+
+    finally:
+        # traceback would otherwise keep the buffer exported
+        if not _PY2:
+            substrate.release()
+
+
+def _decodeRecords(decode, records, asn1Spec, native, options):
+    results = []
+
+    for result in decode.decodeMany(records, asn1Spec=asn1Spec, **options):
+        if not isinstance(result, error.PyAsn1Error):
+            result = result[0]
+
+            if native:
+                result = native_encoder.encode(result)
+
+        results.append(result)
+
+    return results
+
+
+class ParallelDecoder(object):
+    """Create a decoder spreading records over a pool of processes.
+
+    Splits a serialization made of many concatenated top-level
+    BER/CER/DER TLVs (records) at records boundaries and decodes the
+    records in worker processes. Records splitting only parses TLV
+    headers, so the calling process does not do much more than copying
+    records to the workers.
+
+    Decoded records are transferred back to the calling process by
+    pickling. Optionally, they can be converted into Python built-in
+    types by the native encoder prior to that which is usually cheaper
+    to pickle and unpickle.
+
+    Parameters
+    ----------
+    asn1Spec: :py:class:`~pyasn1.type.base.PyAsn1Item`
+        ASN.1 schema of each record
+
+    Keyword Args
+    ------------
+    decoder: :py:class:`~pyasn1.codec.ber.decoder.Decoder`
+        Decoder to run in worker processes, BER decoder by default
+
+    workers: :py:class:`int`
+        Number of worker processes, defaults to the number of CPUs
+
+    batchSize: :py:class:`int`
+        Number of records to send to a worker process at once
+
+    native: :py:class:`bool`
+        If :obj:`True`, yield Python built-in objects rather than ASN.1
+        objects
+
+    Raises
+    ------
+    ~pyasn1.error.PyAsn1Error
+        If :py:mod:`concurrent.futures` is not available
+
+    Examples
+    --------
+
+    .. code-block:: pycon
+
+        >>> decodeRecords = ParallelDecoder(CallDataRecord(), decoder=decode)
+        >>> with open('cdr.ber', 'rb') as cdrFile:
+        ...     for cdr in decodeRecords(cdrFile):
+        ...         print(cdr['callingNumber'])
+
+    """
+    def __init__(self, asn1Spec, decoder=ber_decoder.decode, workers=None,
+                 batchSize=256, native=False, **options):
+        if futures is None:
+            raise error.PyAsn1Error(
+                'Parallel decoding requires concurrent.futures module')
+
+        self._asn1Spec = asn1Spec
+        self._decoder = decoder
+        self._workers = workers or multiprocessing.cpu_count()
+        self._batchSize = batchSize
+        self._native = native
+        self._options = options
+
+    def __call__(self, substrate, offset=0):
+        """Decode each record of BER/CER/DER serialization.
+
+        Parameters
+        ----------
+        substrate: :py:class:`file`, :py:class:`bytes`, :py:class:`bytearray`, :py:class:`memoryview` or :py:class:`mmap.mmap`
+            Concatenated BER/CER/DER serializations. Files get memory-mapped.
+
+        Keyword Args
+        ------------
+        offset: :py:class:`int`
+            Position of the first record within `substrate`
+
+        Yields
+        ------
+        : :py:class:`~pyasn1.type.base.PyAsn1Item`, :py:class:`~pyasn1.error.PyAsn1Error`
+            For each record, in order, either decoded object or the
+            exception object describing decoding failure
+
+        Raises
+        ------
+        ~pyasn1.error.SubstrateUnderrunError
+            If the last record is truncated
+        """
+        if hasattr(substrate, 'fileno'):
+            # empty files can not be mapped
+            if not os.fstat(substrate.fileno()).st_size:
+                return
+
+            substrate = mmap.mmap(
+                substrate.fileno(), 0, access=mmap.ACCESS_READ)
+
+            try:
+                for result in self._decode(substrate, offset):
+                    yield result
+
+            finally:
+                substrate.close()
+
+        else:
+            for result in self._decode(substrate, offset):
+                yield result
+
+    def _decode(self, substrate, offset):
+        substrate = memoryview(substrate)
+
+        # bounds memory taken by records in flight
+        maxPending = self._workers * 2
+
+        try:
+            with futures.ProcessPoolExecutor(max_workers=self._workers) as executor:
+                pending = []
+
+                records = []
+
+                for start, end in iterRecords(substrate, offset):
+                    records.append(substrate[start:end].tobytes())
+
+                    if len(records) < self._batchSize:
+                        continue
+
+                    pending.append(self._submit(executor, records))
+
+                    records = []
+
+                    if len(pending) >= maxPending:
+                        for result in pending.pop(0).result():
+                            yield result
+
+                if records:
+                    pending.append(self._submit(executor, records))
+
+                for future in pending:
+                    for result in future.result():
+                        yield result
+
+        finally:
+            # memory-mapped file can only be closed once not exported
+            if not _PY2:
+                substrate.release()
+
+    def _submit(self, executor, records):
+        return executor.submit(
+            _decodeRecords, self._decoder, records, self._asn1Spec,
+            self._native, self._options)
@@ -5,6 +5,7 @@
 # License: http://snmplabs.com/pyasn1/license.html
 #
 import io
+import mmap
 import os
 import sys
 
@@ -21,17 +22,38 @@ class CachingStreamWrapper(io.IOBase):
     not checking for dangerous arguments for the sake
     of performance.
 
-    The read bytes are kept in an internal cache until
-    setting _markedPosition which may reset the cache.
+    The read bytes are kept in an internal buffer until
+    setting `markedPosition` past them. Stream positions
+    are absolute, they do not change when the buffer gets
+    compacted.
+
+    Parameters
+    ----------
+    raw: :py:class:`io.IOBase`
+        Non-seekable stream to read from
+
+    Keyword Args
+    ------------
+    maxLookback: :py:class:`int`
+        Maximum number of octets to keep buffered past `markedPosition`,
+        unlimited by default
     """
-    def __init__(self, raw):
+    def __init__(self, raw, maxLookback=None):
         self._raw = raw
-        self._cache = io.BytesIO()
+        self._maxLookback = maxLookback
+        self._buffer = bytearray()
+        # stream position of the first octet in the buffer
+        self._bufferPosition = 0
+        # number of leading buffer octets that are no longer needed
+        self._discarded = 0
+        self._position = 0
         self._markedPosition = 0
+        self._discardedOctets = 0
+        self._compactedOctets = 0
 
     def peek(self, n):
         result = self.read(n)
-        self._cache.seek(-len(result), os.SEEK_CUR)
+        self._position -= len(result)
         return result
 
     def seekable(self):
@@ -39,18 +61,52 @@ class CachingStreamWrapper(io.IOBase):
 
     def seek(self, n=-1, whence=os.SEEK_SET):
         # Note that this not safe for seeking forward.
-        return self._cache.seek(n, whence)
+        if whence == os.SEEK_CUR:
+            n += self._position
+
+        elif whence == os.SEEK_END:
+            n += self._bufferPosition + len(self._buffer)
+
+        if n < self._bufferPosition + self._discarded:
+            raise error.PyAsn1Error(
+                'Cannot seek to discarded stream position %d' % n)
+
+        self._position = n
+
+        return n
 
     def read(self, n=-1):
-        read_from_cache = self._cache.read(n)
-        if n != -1:
-            n -= len(read_from_cache)
-            if not n:  # 0 bytes left to read
-                return read_from_cache
+        start = self._position - self._bufferPosition
+
+        if start < len(self._buffer):
+            if n is None or n < 0:
+                end = len(self._buffer)
+
+            else:
+                end = min(start + n, len(self._buffer))
+
+            read_from_cache = bytes(self._buffer[start:end])
+
+            self._position += len(read_from_cache)
+
+            if n is not None and n >= 0:
+                n -= len(read_from_cache)
+                if not n:  # 0 bytes left to read
+                    return read_from_cache
+
+        else:
+            read_from_cache = b''
 
         read_from_raw = self._raw.read(n)
 
-        self._cache.write(read_from_raw)
+        if read_from_raw:
+            self._buffer.extend(read_from_raw)
+            self._position += len(read_from_raw)
+
+            if (self._maxLookback is not None and
+                    len(self._buffer) - self._discarded > self._maxLookback):
+                raise error.PyAsn1Error(
+                    'Stream lookback buffer exceeds %d octets' % self._maxLookback)
 
         return read_from_cache + read_from_raw
 
@@ -73,21 +129,166 @@ class CachingStreamWrapper(io.IOBase):
 
         # Whenever we set _marked_position, we know for sure
         # that we will not return back, and thus it is
-        # safe to drop all cached data.
-        if self._cache.tell() > io.DEFAULT_BUFFER_SIZE:
-            self._cache = io.BytesIO(self._cache.read())
-            self._markedPosition = 0
+        # safe to drop all buffered data before it.
+        discarded = value - self._bufferPosition
+
+        if discarded > self._discarded:
+            self._discardedOctets += discarded - self._discarded
+            self._discarded = discarded
+
+        # Move the rest of the buffer only once it is outweighed by
+        # discarded octets, so that each octet gets moved a constant
+        # number of times on average
+        if (self._discarded > io.DEFAULT_BUFFER_SIZE and
+                self._discarded * 2 > len(self._buffer)):
+            del self._buffer[:self._discarded]
+            self._compactedOctets += len(self._buffer)
+            self._bufferPosition += self._discarded
+            self._discarded = 0
+
+    @property
+    def bufferedOctets(self):
+        """Number of octets currently kept for backtracking."""
+        return len(self._buffer) - self._discarded
+
+    @property
+    def discardedOctets(self):
+        """Total number of octets dropped from the buffer."""
+        return self._discardedOctets
+
+    @property
+    def compactedOctets(self):
+        """Total number of octets moved while compacting the buffer."""
+        return self._compactedOctets
 
     def tell(self):
-        return self._cache.tell()
+        return self._position
+
+
+class MemoryViewStream(io.IOBase):
+    """Seekable read-only stream over in-memory buffer.
+
+    Serves reads by index right off the buffer (e.g. `bytearray`,
+    `memoryview` or `mmap`) rather than copying it into
+    :py:class:`io.BytesIO` first. Only the octets being returned
+    by :py:meth:`read` get materialized.
+    """
+    def __init__(self, raw):
+        self._view = memoryview(raw)
+        self._position = 0
+        self.markedPosition = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, n=0, whence=os.SEEK_SET):
+        # this is on the decoder hot path, hence plain integer checks
+        if whence:
+            if whence == os.SEEK_CUR:
+                n += self._position
 
+            else:
+                n += len(self._view)
 
-def asSeekableStream(substrate):
+        if n < 0:
+            n = 0
+
+        self._position = n
+
+        return n
+
+    def tell(self):
+        return self._position
+
+    def read(self, n=-1):
+        start = self._position
+
+        if n is None or n < 0:
+            end = len(self._view)
+
+        else:
+            end = start + n
+
+            if end > len(self._view):
+                end = max(start, len(self._view))
+
+        self._position = end
+
+        return self._view[start:end].tobytes()
+
+    def peek(self, n=-1):
+        result = self.read(n)
+        self._position -= len(result)
+        return result
+
+    def getbuffer(self):
+        """Return read-only view over the underlying buffer.
+
+        Returns
+        -------
+        : :py:class:`memoryview`
+            The whole buffer regardless of the current stream position
+        """
+        return self._view
+
+    def close(self):
+        """Release the underlying buffer.
+
+        Buffers like :py:class:`mmap.mmap` can not be closed while
+        being exported to a memory view.
+        """
+        if not _PY2:
+            self._view.release()
+
+        io.IOBase.close(self)
+
+
+class _MmapStream(MemoryViewStream):
+    """Seekable read-only stream over Python 2 :py:class:`mmap.mmap`.
+
+    Python 2 `mmap` does not support new-style buffer interface hence
+    can not be viewed through :py:class:`memoryview`. Slicing `mmap`
+    yields the octets being read right away though.
+    """
+    def __init__(self, raw):
+        self._view = raw
+        self._position = 0
+        self.markedPosition = 0
+
+    def read(self, n=-1):
+        start = self._position
+
+        if n is None or n < 0:
+            end = len(self._view)
+
+        else:
+            end = start + n
+
+            if end > len(self._view):
+                end = max(start, len(self._view))
+
+        self._position = end
+
+        return self._view[start:end]
+
+
+def asSeekableStream(substrate, maxLookback=None):
     """Convert object to seekable byte-stream.
 
     Parameters
     ----------
     substrate: :py:class:`bytes` or :py:class:`io.IOBase` or :py:class:`univ.OctetString`
+        or buffer object such as :py:class:`bytearray`, :py:class:`memoryview`
+        or :py:class:`mmap.mmap`
+
+    Keyword Args
+    ------------
+    maxLookback: :py:class:`int`
+        Maximum number of octets to buffer when reading non-seekable
+        stream, unlimited by default
 
     Returns
     -------
@@ -101,11 +302,14 @@ def asSeekableStream(substrate):
     if isinstance(substrate, io.BytesIO):
         return substrate
 
-    elif isinstance(substrate, bytes):
-        return io.BytesIO(substrate)
+    elif _PY2 and isinstance(substrate, mmap.mmap):
+        return _MmapStream(substrate)
+
+    elif isinstance(substrate, (bytes, bytearray, memoryview, mmap.mmap)):
+        return MemoryViewStream(substrate)
 
     elif isinstance(substrate, univ.OctetString):
-        return io.BytesIO(substrate.asOctets())
+        return MemoryViewStream(substrate.asOctets())
 
     try:
         # Special case: impossible to set attributes on `file` built-in
@@ -116,7 +320,7 @@ def asSeekableStream(substrate):
             return substrate
 
         else:
-            return CachingStreamWrapper(substrate)
+            return CachingStreamWrapper(substrate, maxLookback=maxLookback)
 
     except AttributeError:
         raise error.UnsupportedSubstrateError(
@@ -139,7 +343,7 @@ def isEndOfStream(substrate):
     -------
     : :py:class:`bool`
     """
-    if isinstance(substrate, io.BytesIO):
+    if isinstance(substrate, (io.BytesIO, MemoryViewStream)):
         cp = substrate.tell()
         substrate.seek(0, os.SEEK_END)
         result = substrate.tell() == cp
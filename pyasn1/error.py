@@ -71,6 +71,23 @@ class EndOfStreamError(SubstrateUnderrunError):
     """
 
 
+class SubstrateOverflowError(PyAsn1Error):
+    """ASN.1 data structure serialization error
+
+    The `SubstrateOverflowError` exception indicates insufficient room
+    in the output buffer of a serialization codec.
+    """
+
+
+class DecodingLimitError(PyAsn1Error):
+    """ASN.1 data structure deserialization error
+
+    The `DecodingLimitError` exception indicates that serialised data
+    on input of a de-serialization codec exceeds one of the configured
+    resource limits.
+    """
+
+
 class UnsupportedSubstrateError(PyAsn1Error):
     """Unsupported substrate type to parse as ASN.1 data."""
 
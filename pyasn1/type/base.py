@@ -47,6 +47,10 @@ class Asn1Type(Asn1Item):
     # Disambiguation ASN.1 types identification
     typeId = None
 
+    # Encoding rules name and serialization this object has been
+    # decoded from, set by decoders when it is safe to reuse
+    _substrate = None
+
     def __init__(self, **kwargs):
         readOnly = {
             'tagSet': self.tagSet,
@@ -258,6 +262,10 @@ class SimpleAsn1Type(Asn1Type):
     #: Default payload value
     defaultValue = noValue
 
+    # Serializations of this object keyed by encoder and encoding
+    # mode, filled in by encoders on request
+    _encodingCache = None
+
     def __init__(self, value=noValue, **kwargs):
         Asn1Type.__init__(self, **kwargs)
         if value is noValue:
@@ -515,6 +523,102 @@ class ConstructedAsn1Type(Asn1Type):
 
         Asn1Type.__init__(self, **readOnly)
 
+    def __getattr__(self, attr):
+        # lazily decoded object materializes its components on first access
+        if attr == '_componentValues':
+            try:
+                materialize = self.__dict__.pop('_lazyComponents')
+
+            except KeyError:
+                pass
+
+            else:
+                try:
+                    componentValues = materialize()
+
+                except error.PyAsn1Error:
+                    # stay lazy so that the decoding error is not masked
+                    self.__dict__['_lazyComponents'] = materialize
+                    raise
+
+                self.__dict__[attr] = componentValues
+                return componentValues
+
+        raise AttributeError(attr)
+
+    def __setattr__(self, name, value):
+        if name == '_componentValues':
+            # new components invalidate lazy state and original serialization
+            self.__dict__.pop('_lazyComponents', None)
+            self.__dict__.pop('_substrate', None)
+            self.__dict__.pop('_absentInSubstrate', None)
+
+        Asn1Type.__setattr__(self, name, value)
+
+    def __getstate__(self):
+        # lazy state and original serialization refer to the buffer
+        # being decoded, pickle decoded components instead
+        if '_lazyComponents' in self.__dict__:
+            self._componentValues
+
+        state = self.__dict__.copy()
+        state.pop('_substrate', None)
+
+        return state
+
+    @property
+    def substrate(self):
+        """Return the serialization this |ASN.1| object has been decoded from.
+
+        Decoders retain original serialization of constructed objects
+        when called with `keepSubstrate` (or `lazy`) option, encoders
+        retain the serialization they produce when called with
+        `cacheEncoding` option. The serialization is only available till
+        this object or any of its constructed components gets modified.
+
+        Returns
+        -------
+        : :py:class:`memoryview` or :obj:`None`
+            Complete TLV this object has been decoded from, verbatim,
+            or :obj:`None` if unknown
+
+        Examples
+        --------
+
+        .. code-block:: pycon
+
+            >>> cert, _ = decode(substrate, asn1Spec=Certificate(), keepSubstrate=True)
+            >>> tbsCertificate = cert['tbsCertificate'].substrate
+        """
+        if self._substrate is not None and self._hasValidSubstrate():
+            return self._substrate[1]
+
+    def _hasValidSubstrate(self):
+        # original serialization is valid till this object or any
+        # of its constructed components gets modified, components
+        # instantiated on read were absent from it
+        if (self._substrate is None and
+                '_absentInSubstrate' not in self.__dict__):
+            return False
+
+        if '_lazyComponents' in self.__dict__:
+            return True
+
+        componentValues = self._componentValues
+
+        if componentValues is noValue:
+            return True
+
+        if isinstance(componentValues, dict):
+            componentValues = componentValues.values()
+
+        for componentValue in componentValues:
+            if (isinstance(componentValue, ConstructedAsn1Type) and
+                    not componentValue._hasValidSubstrate()):
+                return False
+
+        return True
+
     def _moveSizeSpec(self, **kwargs):
         # backward compatibility, unused
         sizeSpec = kwargs.pop('sizeSpec', self.sizeSpec)
@@ -2014,6 +2014,10 @@ class SequenceOfAndSetOfBase(base.ConstructedAsn1Type):
         The PyASN1 value objects can **additionally** participate in many operations
         involving regular Python objects (e.g. arithmetic, comprehension etc).
         """
+        if '_lazyComponents' in self.__dict__:
+            # lazily decoded object is a value, no need to decode it
+            return True
+
         if self._componentValues is noValue:
             return False
 
@@ -2282,7 +2286,7 @@ class SequenceAndSetBase(base.ConstructedAsn1Type):
         built-in.
         """
         self._componentValues = []
-        self._dynamicNames = self.DynamicNames()
+        self._dynamicNames = self._componentTypeLen or self.DynamicNames()
         return self
 
     def reset(self):
@@ -2292,7 +2296,7 @@ class SequenceAndSetBase(base.ConstructedAsn1Type):
         distinction between value and schema objects.
         """
         self._componentValues = noValue
-        self._dynamicNames = self.DynamicNames()
+        self._dynamicNames = self._componentTypeLen or self.DynamicNames()
         return self
 
     @property
@@ -2482,15 +2486,39 @@ class SequenceAndSetBase(base.ConstructedAsn1Type):
                 return componentValue
 
         if componentValue is noValue:
-            self.setComponentByPosition(idx)
+            componentValue = self._instantiateComponent(idx)
 
-        componentValue = self._componentValues[idx]
+        else:
+            componentValue = self._componentValues[idx]
 
         if default is noValue or componentValue.isValue:
             return componentValue
         else:
             return default
 
+    def _instantiateComponent(self, idx):
+        substrate = self.__dict__.get('_substrate')
+        absentInSubstrate = self.__dict__.get('_absentInSubstrate')
+
+        self.setComponentByPosition(idx)
+
+        componentValue = self._componentValues[idx]
+
+        if substrate is None and not absentInSubstrate:
+            return componentValue
+
+        # instantiation on read keeps original serialization valid
+        if substrate is not None:
+            self._substrate = substrate
+
+        else:
+            self._absentInSubstrate = True
+
+        if isinstance(componentValue, base.ConstructedAsn1Type):
+            componentValue._absentInSubstrate = True
+
+        return componentValue
+
     def setComponentByPosition(self, idx, value=noValue,
                                verifyConstraints=True,
                                matchTags=True,
@@ -2632,6 +2660,10 @@ class SequenceAndSetBase(base.ConstructedAsn1Type):
         value objects, |ASN.1| object is still considered as a value object. Defaulted
         components are normally value objects by default.
         """
+        if '_lazyComponents' in self.__dict__:
+            # lazily decoded object is a value, no need to decode it
+            return True
+
         if self._componentValues is noValue:
             return False
 
@@ -3062,6 +3094,12 @@ class Choice(Set):
 
         return self._componentValues[idx]
 
+    def _instantiateComponent(self, idx):
+        # choosing another alternative modifies the object
+        self.setComponentByPosition(idx)
+
+        return self._componentValues[idx]
+
     def setComponentByPosition(self, idx, value=noValue,
                                verifyConstraints=True,
                                matchTags=True,
@@ -8,6 +8,8 @@ import unittest
 
 suite = unittest.TestLoader().loadTestsFromNames(
     ['tests.codec.test_streaming.suite',
+     'tests.codec.test_parallel.suite',
+     'tests.codec.test_asyncstreaming.suite',
      'tests.codec.ber.__main__.suite',
      'tests.codec.cer.__main__.suite',
      'tests.codec.der.__main__.suite',
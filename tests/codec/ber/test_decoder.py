@@ -6,6 +6,7 @@
 #
 import gzip
 import io
+import mmap
 import os
 import sys
 import tempfile
@@ -21,7 +22,9 @@ from pyasn1.type import univ
 from pyasn1.type import char
 from pyasn1.codec import streaming
 from pyasn1.codec.ber import decoder
+from pyasn1.codec.ber import encoder
 from pyasn1.codec.ber import eoo
+from pyasn1.codec.der import encoder as der_encoder
 from pyasn1.compat.octets import ints2octs, str2octs, null
 from pyasn1 import error
 
@@ -38,6 +41,12 @@ class LargeTagDecoderTestCase(BaseTestCase):
         assert decoder.decode(ints2octs((0x9f, 0x80, 0x00, 0x02, 0x01, 0x02)), asn1Spec=integer) == decoder.decode(
             ints2octs((0x9f, 0x00, 0x02, 0x01, 0x02)), asn1Spec=integer)
 
+    def testLongTagInStream(self):
+        integer = univ.Integer().subtype(implicitTag=tag.Tag(tag.tagClassContext, 0, 31))
+        substrate = ints2octs((0x9f, 0x1f, 0x01, 0x0c))
+        assert decoder.decode(substrate, asn1Spec=integer) == decoder.decode(
+            io.BytesIO(substrate), asn1Spec=integer) == (12, null)
+
 
 class DecoderCacheTestCase(BaseTestCase):
     def testCache(self):
@@ -1628,6 +1637,59 @@ class ErrorOnDecodingTestCase(BaseTestCase):
             'Unexpected rest of substrate after raw dump %r' % rest)
 
 
+class DispatchTableTestCase(BaseTestCase):
+
+    def testShortTags(self):
+        for firstOctet in (2, 48, 160, 255 - 0x1F):
+            tagSet = decoder.SHORT_TAG_SETS[firstOctet]
+            assert decoder.decodeHeader(ints2octs((firstOctet, 0)))[:3] == (
+                tagSet[0].tagClass, tagSet[0].tagFormat, tagSet[0].tagId)
+
+        assert decoder.SHORT_TAG_SETS[31] is None
+
+    def testTagMapGrowth(self):
+        tagMap = dict(decoder.TAG_MAP)
+
+        substrate = ints2octs((67, 1, 12))
+
+        try:
+            decoder.decode(substrate, tagMap=tagMap)
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert False, 'unknown tag tolerated'
+
+        tagMap[univ.Integer.tagSet.tagImplicitly(
+            tag.Tag(tag.tagClassApplication, tag.tagFormatSimple, 3))] = (
+            decoder.IntegerPayloadDecoder())
+
+        assert decoder.decode(substrate, tagMap=tagMap)[0] == 12
+
+    def testTagMapEntryReplaced(self):
+        tagMap = dict(decoder.TAG_MAP)
+
+        substrate = ints2octs((2, 1, 12))
+
+        assert decoder.decode(substrate, tagMap=tagMap)[0] == 12
+
+        class NegatingDecoder(decoder.IntegerPayloadDecoder):
+            def primitiveValueDecoder(self, *args, **kwargs):
+                return -decoder.IntegerPayloadDecoder.primitiveValueDecoder(
+                    self, *args, **kwargs)
+
+        tagMap[univ.Integer.tagSet] = NegatingDecoder()
+
+        assert decoder.decode(substrate, tagMap=tagMap)[0] == -12
+
+    def testTablesBounded(self):
+        for _ in range(decoder._DISPATCH_TABLES_LIMIT * 2):
+            decoder.decode(ints2octs((2, 1, 12)), tagMap=dict(decoder.TAG_MAP))
+
+        assert len(decoder._DISPATCH_TABLES) <= decoder._DISPATCH_TABLES_LIMIT
+
+
 class BinaryFileTestCase(BaseTestCase):
     """Assure that decode works on open binary files."""
     def testOneObject(self):
@@ -1673,6 +1735,63 @@ class BinaryFileTestCase(BaseTestCase):
             os.remove(path)
 
 
+class FromPathTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+        _, self.path = tempfile.mkstemp()
+
+    def tearDown(self):
+        os.remove(self.path)
+        BaseTestCase.tearDown(self)
+
+    def testMoreObjects(self):
+        with open(self.path, "wb") as out:
+            out.write(ints2octs((2, 1, 12, 35, 128, 3, 2, 0, 169, 3, 2, 1, 138, 0, 0)))
+
+        values = list(decoder.StreamingDecoder.fromPath(self.path))
+
+        assert values == [12, (1, 0, 1, 0, 1, 0, 0, 1, 1, 0, 0, 0, 1, 0, 1)]
+
+    def testWithSchema(self):
+        with open(self.path, "wb") as out:
+            out.write(ints2octs((4, 2, 102, 111) * 2))
+
+        values = list(decoder.StreamingDecoder.fromPath(
+            self.path, asn1Spec=univ.OctetString()))
+
+        assert values == [str2octs('fo')] * 2
+
+    def testEmptyFile(self):
+        assert list(decoder.StreamingDecoder.fromPath(self.path)) == []
+
+    def testTruncatedFile(self):
+        with open(self.path, "wb") as out:
+            out.write(ints2octs((2, 1, 12, 2, 2, 1)))
+
+        values = decoder.StreamingDecoder.fromPath(self.path)
+
+        assert next(values) == 12
+
+        try:
+            next(values)
+
+        except error.SubstrateUnderrunError:
+            pass
+
+        else:
+            assert False, 'Tolerated truncated file'
+
+    def testEarlyClose(self):
+        with open(self.path, "wb") as out:
+            out.write(ints2octs((2, 1, 12) * 2))
+
+        values = decoder.StreamingDecoder.fromPath(self.path)
+
+        assert next(values) == 12
+
+        values.close()
+
+
 class BytesIOTestCase(BaseTestCase):
     def testRead(self):
         source = ints2octs((2, 1, 12, 35, 128, 3, 2, 0, 169, 3, 2, 1, 138, 0, 0))
@@ -1695,6 +1814,325 @@ class UnicodeTestCase(BaseTestCase):
             assert False, 'Tolerated parsing broken unicode strings'
 
 
+class BufferTestCase(BaseTestCase):
+    substrate = ints2octs((48, 13, 2, 1, 12, 36, 8, 4, 2, 102, 111, 4, 2, 120, 33))
+
+    def testBytearray(self):
+        assert decoder.decode(bytearray(self.substrate)) == decoder.decode(self.substrate)
+
+    def testMemoryview(self):
+        substrate = memoryview(ints2octs((1, 2)) + self.substrate)[2:]
+        assert decoder.decode(substrate) == decoder.decode(self.substrate)
+
+    def testMmap(self):
+        _, path = tempfile.mkstemp()
+        try:
+            with open(path, 'wb') as out:
+                out.write(self.substrate)
+
+            with open(path, 'rb') as source:
+                substrate = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    asn1Object, rest = decoder.decode(substrate)
+                    assert (asn1Object, rest) == decoder.decode(self.substrate)
+
+                finally:
+                    substrate.close()
+
+        finally:
+            os.remove(path)
+
+    def testStreamingDecoder(self):
+        values = list(decoder.StreamingDecoder(bytearray(self.substrate * 2)))
+        assert values == [decoder.decode(self.substrate)[0]] * 2
+
+    def testTruncatedHeader(self):
+        try:
+            decoder.decode(bytearray(self.substrate[:1]))
+
+        except error.SubstrateUnderrunError:
+            pass
+
+        else:
+            assert False, 'Tolerated truncated TLV header'
+
+    def testTruncatedValue(self):
+        values = iter(decoder.StreamingDecoder(bytearray(self.substrate[:-1])))
+
+        assert isinstance(next(values), error.SubstrateUnderrunError)
+
+
+class NonSeekableStreamTestCase(BaseTestCase):
+
+    class NonSeekableStream(io.RawIOBase):
+        def __init__(self, substrate):
+            self._stream = io.BytesIO(substrate)
+
+        def readable(self):
+            return True
+
+        def read(self, size=-1):
+            return self._stream.read(size)
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        self.s = univ.SequenceOf(componentType=univ.OctetString())
+        for idx in range(io.DEFAULT_BUFFER_SIZE // 10):
+            self.s.setComponentByPosition(idx, univ.OctetString('quick brown'))
+
+        self.substrate = encoder.encode(self.s)
+
+    def testLargeDefLenValue(self):
+        stream = self.NonSeekableStream(self.substrate * 3)
+        values = list(decoder.StreamingDecoder(stream, asn1Spec=self.s))
+        assert values == [self.s] * 3
+
+    def testMaxLookback(self):
+        stream = self.NonSeekableStream(
+            encoder.encode(univ.OctetString(null.join([self.substrate] * 2))))
+
+        try:
+            list(decoder.StreamingDecoder(stream, maxLookback=1024))
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert False, 'Tolerated lookback buffer overflow'
+
+
+class DecodingLimitsTestCase(BaseTestCase):
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        # SEQUENCE OF (SEQUENCE OF (INTEGER 1, INTEGER 2)), indefinite length
+        self.substrate = ints2octs(
+            (48, 128, 48, 128, 2, 1, 1, 2, 1, 2, 0, 0, 0, 0))
+
+    def assertExceeds(self, substrate, **options):
+        try:
+            decoder.decode(substrate, **options)
+
+        except error.DecodingLimitError:
+            pass
+
+        else:
+            assert False, 'Tolerated limit violation at %s' % (options,)
+
+    def testWithinLimits(self):
+        asn1Object, rest = decoder.decode(
+            self.substrate, maxDepth=2, maxComponents=4, maxValueLength=1,
+            maxTotalLength=2)
+
+        assert asn1Object[0] == [1, 2]
+        assert not rest
+
+    def testMaxDepth(self):
+        self.assertExceeds(self.substrate, maxDepth=1)
+
+    def testMaxDepthExplicitTag(self):
+        self.assertExceeds(ints2octs((163, 5, 163, 3, 2, 1, 1)), maxDepth=1)
+
+    def testMaxComponents(self):
+        self.assertExceeds(self.substrate, maxComponents=3)
+
+    def testMaxValueLength(self):
+        self.assertExceeds(ints2octs((2, 2, 1, 2)), maxValueLength=1)
+
+    def testMaxValueLengthOfConstructedString(self):
+        self.assertExceeds(
+            ints2octs((36, 128, 4, 2, 97, 98, 4, 2, 99, 100, 0, 0)),
+            maxValueLength=3)
+
+    def testMaxValueLengthOfConstructedBitString(self):
+        self.assertExceeds(
+            ints2octs((35, 128, 3, 2, 0, 169, 3, 2, 1, 138, 0, 0)),
+            maxValueLength=1)
+
+    def testMaxTotalLength(self):
+        self.assertExceeds(self.substrate, maxTotalLength=1)
+
+    def testHugeLengthNotRead(self):
+        requested = []
+
+        class Stream(NonSeekableStreamTestCase.NonSeekableStream):
+            def read(self, size=-1):
+                requested.append(size)
+                return self._stream.read(size)
+
+        # OCTET STRING claiming 2**63 - 1 octets
+        stream = Stream(ints2octs(
+            (4, 136, 127, 255, 255, 255, 255, 255, 255, 255, 0)))
+
+        try:
+            list(decoder.StreamingDecoder(stream, maxValueLength=1024))
+
+        except error.DecodingLimitError:
+            pass
+
+        else:
+            assert False, 'Tolerated huge value length'
+
+        assert max(requested) <= io.DEFAULT_BUFFER_SIZE
+
+    def testLimitsPerObject(self):
+        values = list(decoder.StreamingDecoder(
+            self.substrate * 3, maxComponents=4, maxTotalLength=2))
+
+        assert len(values) == 3
+
+
+class CompiledDecodingLimitsTestCase(BaseTestCase):
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        self.s = univ.SequenceOf(
+            componentType=univ.SequenceOf(componentType=univ.Integer()))
+
+        # SEQUENCE OF (SEQUENCE OF (INTEGER 1, INTEGER 2))
+        self.substrate = ints2octs((48, 8, 48, 6, 2, 1, 1, 2, 1, 2))
+
+    def assertExceeds(self, decodeFun, *args, **options):
+        try:
+            decodeFun(*args, **options)
+
+        except error.DecodingLimitError:
+            pass
+
+        else:
+            assert False, 'Tolerated limit violation at %s' % (options,)
+
+    def testWithinLimits(self):
+        asn1Object, rest = decoder.decode.compile(self.s)(
+            self.substrate, maxDepth=2, maxComponents=4, maxValueLength=8,
+            maxTotalLength=2)
+
+        assert asn1Object[0] == [1, 2]
+        assert not rest
+
+    def testCompiledMaxDepth(self):
+        self.assertExceeds(
+            decoder.decode.compile(self.s), self.substrate, maxDepth=1)
+
+    def testCompiledMaxDepthExplicitTag(self):
+        s = univ.Integer().subtype(
+            explicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatConstructed, 3))
+        s = s.subtype(
+            explicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatConstructed, 3))
+
+        substrate = ints2octs((163, 5, 163, 3, 2, 1, 1))
+
+        assert decoder.decode.compile(s)(substrate, maxDepth=2)[0] == 1
+
+        self.assertExceeds(decoder.decode.compile(s), substrate, maxDepth=1)
+
+    def testCompiledMaxComponents(self):
+        self.assertExceeds(
+            decoder.decode.compile(self.s), self.substrate, maxComponents=3)
+
+    def testCompiledMaxValueLength(self):
+        self.assertExceeds(
+            decoder.decode.compile(self.s), self.substrate, maxValueLength=7)
+
+    def testCompiledMaxTotalLength(self):
+        self.assertExceeds(
+            decoder.decode.compile(self.s), self.substrate, maxTotalLength=1)
+
+    def testCompiledLimitsPerObject(self):
+        decodeSeq = decoder.decode.compile(self.s, maxComponents=4)
+
+        for _ in range(3):
+            assert decodeSeq(self.substrate)[0][0] == [1, 2]
+
+    def testCompiledConstructedString(self):
+        # OCTET STRING assembled by the generic decoder
+        substrate = ints2octs((36, 128, 4, 2, 97, 98, 4, 2, 99, 100, 0, 0))
+
+        self.assertExceeds(
+            decoder.decode.compile(univ.OctetString()), substrate,
+            maxValueLength=3)
+
+    def testDecodeMany(self):
+        results = list(decoder.decode.decodeMany(
+            [self.substrate, ints2octs((48, 5, 48, 3, 2, 1, 1))],
+            asn1Spec=self.s, maxComponents=3))
+
+        assert isinstance(results[0], error.DecodingLimitError)
+        assert results[1][0][0] == [1]
+
+    def testExtract(self):
+        assert decoder.decode.extract(
+            self.substrate, self.s, ['0.1'], maxDepth=2)['0.1'] == 2
+
+        self.assertExceeds(
+            decoder.decode.extract, self.substrate, self.s, ['0.1'],
+            maxDepth=1)
+
+    def testExtractSkippedComponents(self):
+        substrate = ints2octs((48, 13, 48, 3, 2, 1, 1, 48, 6, 2, 1, 2, 2, 1, 3))
+
+        self.assertExceeds(
+            decoder.decode.extract, substrate, self.s, ['1.0'],
+            maxComponents=3)
+
+    def testLazy(self):
+        asn1Object, rest = decoder.decode(
+            self.substrate, asn1Spec=self.s, lazy=True, maxDepth=1)
+
+        try:
+            asn1Object[0].getComponentByPosition(0)
+
+        except error.DecodingLimitError:
+            pass
+
+        else:
+            assert False, 'Tolerated limit violation in lazy mode'
+
+    def testLazyWithinLimits(self):
+        asn1Object, rest = decoder.decode(
+            self.substrate, asn1Spec=self.s, lazy=True, maxDepth=2)
+
+        assert asn1Object[0] == [1, 2]
+
+    def testSkipComponents(self):
+        self.assertExceeds(
+            decoder.decode, self.substrate, asn1Spec=self.s,
+            skipComponents=['0.1'], maxDepth=1)
+
+    def testRawComponents(self):
+        self.assertExceeds(
+            decoder.decode, self.substrate, asn1Spec=self.s,
+            rawComponents=['0'], maxValueLength=5)
+
+    def testIterativeMaxComponents(self):
+        self.assertExceeds(
+            decoder.IterativeDecoder(), self.substrate, maxComponents=3)
+
+    def testIterativeMaxValueLength(self):
+        self.assertExceeds(
+            decoder.IterativeDecoder(maxValueLength=7), self.substrate)
+
+    def testIterativeMaxValueLengthOfConstructedString(self):
+        self.assertExceeds(
+            decoder.IterativeDecoder(),
+            ints2octs((36, 128, 4, 2, 97, 98, 4, 2, 99, 100, 0, 0)),
+            maxValueLength=3)
+
+    def testIterativeMaxTotalLength(self):
+        self.assertExceeds(
+            decoder.IterativeDecoder(), self.substrate, maxTotalLength=1)
+
+    def testIterativeWithinLimits(self):
+        asn1Object, rest = decoder.IterativeDecoder()(
+            self.substrate, maxDepth=2, maxComponents=4, maxValueLength=8,
+            maxTotalLength=2)
+
+        assert asn1Object[0] == [1, 2]
+
+
 class RestartableDecoderTestCase(BaseTestCase):
 
     class NonBlockingStream(io.BytesIO):
@@ -1840,6 +2278,1137 @@ class CompressedFilesTestCase(BaseTestCase):
             os.remove(path)
 
 
+class CompiledDecoderTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        openType = opentype.OpenType(
+            'id',
+            {1: univ.Integer(),
+             2: univ.OctetString()}
+        )
+
+        self.s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('id', univ.Integer()),
+                namedtype.OptionalNamedType('null', univ.Null()),
+                namedtype.DefaultedNamedType(
+                    'flag', univ.Boolean(False).subtype(
+                        implicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatSimple, 0))),
+                namedtype.NamedType(
+                    'blob', univ.OctetString().subtype(
+                        explicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatConstructed, 1))),
+                namedtype.NamedType(
+                    'choice', univ.Choice(
+                        componentType=namedtype.NamedTypes(
+                            namedtype.NamedType('oid', univ.ObjectIdentifier()),
+                            namedtype.NamedType('real', univ.Real())))),
+                namedtype.NamedType(
+                    'ints', univ.SequenceOf(componentType=univ.Integer())),
+                namedtype.NamedType(
+                    'any', univ.Any().subtype(
+                        explicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatConstructed, 2))),
+                namedtype.NamedType(
+                    'blob2', univ.Any(), openType=openType)
+            )
+        )
+
+        self.substrates = (
+            ints2octs((48, 32, 2, 1, 1, 128, 1, 255, 161, 5, 4, 3, 102, 111, 120,
+                       6, 2, 42, 3, 48, 6, 2, 1, 1, 2, 1, 2, 162, 2, 5, 0, 2, 1, 12)),
+            ints2octs((48, 24, 2, 1, 2, 5, 0, 161, 4, 4, 2, 102, 111, 9, 0,
+                       48, 0, 162, 2, 5, 0, 4, 3, 98, 97, 114)),
+            ints2octs((48, 128, 2, 1, 1, 161, 128, 36, 128, 4, 1, 102, 4, 2, 111, 120, 0, 0,
+                       0, 0, 6, 2, 42, 3, 48, 128, 2, 1, 1, 0, 0, 162, 128, 5, 0, 0, 0,
+                       2, 1, 12, 0, 0)),
+        )
+
+    def testSameAsGeneric(self):
+        compiled = decoder.decode.compile(self.s)
+
+        for substrate in self.substrates:
+            assert compiled(substrate) == decoder.decode(substrate, asn1Spec=self.s)
+
+    def testOpenTypes(self):
+        compiled = decoder.decode.compile(self.s)
+
+        for substrate in self.substrates:
+            assert compiled(substrate, decodeOpenTypes=True) == decoder.decode(
+                substrate, asn1Spec=self.s, decodeOpenTypes=True)
+
+        s, rest = compiled(self.substrates[1], decodeOpenTypes=True)
+        assert s['blob2'] == str2octs('bar')
+
+    def testTail(self):
+        compiled = decoder.decode.compile(self.s)
+
+        assert compiled(self.substrates[0] + ints2octs((1, 2, 3)))[1] == ints2octs((1, 2, 3))
+
+    def testBuffers(self):
+        compiled = decoder.decode.compile(self.s)
+
+        for substrate in (bytearray(self.substrates[0]),
+                          univ.OctetString(self.substrates[0])):
+            assert compiled(substrate) == decoder.decode(self.substrates[0], asn1Spec=self.s)
+
+    def testCompiledOnce(self):
+        assert decoder.decode.compile(self.s) is decoder.decode.compile(self.s)
+        assert decoder.decode.compile(self.s) is not decoder.decode.compile(
+            self.s, lazy=True)
+        assert decoder.decode.compile(self.s) is not decoder.decode.compile(
+            self.s, tagMap=dict(decoder.TAG_MAP))
+
+    def testSet(self):
+        s = univ.Set(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('place-holder', univ.Null()),
+                namedtype.OptionalNamedType('first-name', univ.OctetString()),
+                namedtype.DefaultedNamedType('age', univ.Integer(33))
+            )
+        )
+        substrate = ints2octs((49, 13, 2, 1, 1, 4, 6, 113, 117, 105, 99, 107, 32, 5, 0))
+
+        assert decoder.decode.compile(s)(substrate) == decoder.decode(substrate, asn1Spec=s)
+
+    def testMissingComponent(self):
+        try:
+            decoder.decode.compile(self.s)(ints2octs((48, 3, 2, 1, 1)))
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert False, 'missing mandatory component tolerated'
+
+    def testTagMismatch(self):
+        try:
+            decoder.decode.compile(self.s)(ints2octs((49, 3, 2, 1, 1)))
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert False, 'tag mismatch tolerated'
+
+    def testShortSubstrate(self):
+        try:
+            decoder.decode.compile(self.s)(self.substrates[0][:-1])
+
+        except error.SubstrateUnderrunError:
+            pass
+
+        else:
+            assert False, 'short substrate tolerated'
+
+
+
+class CompiledUntaggedAnyTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        self.s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('a', univ.Integer()),
+                namedtype.OptionalNamedType('any', univ.Any()),
+                namedtype.OptionalNamedType('t', univ.OctetString()),
+                namedtype.NamedType('b', univ.Boolean())
+            )
+        )
+
+        self.substrates = (
+            ints2octs((48, 9, 2, 1, 0, 4, 1, 120, 1, 1, 255)),
+            ints2octs((48, 8, 2, 1, 0, 5, 0, 1, 1, 255)),
+            ints2octs((48, 11, 2, 1, 0, 5, 0, 4, 1, 120, 1, 1, 255)),
+            ints2octs((48, 6, 2, 1, 0, 1, 1, 255)),
+            ints2octs((48, 12, 2, 1, 0, 4, 1, 121, 4, 1, 120, 1, 1, 255)),
+        )
+
+    def _decode(self, decodeFun, substrate):
+        try:
+            asn1Object, rest = decodeFun(substrate)
+
+            # lazily decoded components
+            asn1Object.prettyPrint()
+
+        except error.PyAsn1Error:
+            return error.PyAsn1Error
+
+        return asn1Object, rest
+
+    def testSameAsGeneric(self):
+        compiled = decoder.decode.compile(self.s)
+
+        for substrate in self.substrates:
+            expected = self._decode(
+                lambda x: decoder.decode(x, asn1Spec=self.s), substrate)
+
+            for decodeFun in (
+                    compiled,
+                    lambda x: decoder.decode(x, asn1Spec=self.s, lazy=True),
+                    lambda x: decoder.decode(
+                        x, asn1Spec=self.s, skipComponents=['b'])):
+                result = self._decode(decodeFun, substrate)
+
+                if expected is error.PyAsn1Error:
+                    assert result is expected, substrate
+
+                else:
+                    assert result[0]['t'] == expected[0]['t'], substrate
+                    assert result[0]['any'] == expected[0]['any'], substrate
+
+
+class LazyDecoderTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        inner = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('id', univ.Integer()),
+                namedtype.NamedType(
+                    'blobs', univ.SequenceOf(componentType=univ.OctetString()))
+            )
+        )
+
+        self.s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('id', univ.Integer()),
+                namedtype.OptionalNamedType(
+                    'inner', inner.subtype(
+                        explicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatConstructed, 0))),
+                namedtype.NamedType(
+                    'ints', univ.SequenceOf(componentType=univ.Integer()))
+            )
+        )
+
+        # non-minimal length encoding of the [0] tag
+        self.substrate = ints2octs(
+            (48, 27, 2, 1, 1, 160, 129, 13, 48, 11, 2, 1, 5, 48, 6, 4, 1, 113,
+             4, 1, 119, 48, 6, 2, 1, 1, 2, 1, 2))
+
+    def testDeferred(self):
+        s, rest = decoder.decode(self.substrate, asn1Spec=self.s, lazy=True)
+
+        assert '_lazyComponents' in s.__dict__
+        assert not rest
+
+    def testFileObject(self):
+        s, rest = decoder.decode(
+            io.BytesIO(self.substrate + ints2octs((5, 0))), asn1Spec=self.s,
+            lazy=True)
+
+        assert s == decoder.decode(self.substrate, asn1Spec=self.s)[0]
+        assert rest == ints2octs((5, 0))
+
+    def testSameAsEager(self):
+        s, rest = decoder.decode(self.substrate, asn1Spec=self.s, lazy=True)
+
+        assert s == decoder.decode(self.substrate, asn1Spec=self.s)[0]
+
+    def testComponentAccess(self):
+        s, rest = decoder.decode(self.substrate, asn1Spec=self.s, lazy=True)
+
+        assert s['id'] == 1
+        assert '_lazyComponents' in s['inner'].__dict__
+        assert list(s['ints']) == [1, 2]
+        assert s['inner']['blobs'][1] == str2octs('w')
+
+    def testReencodeUntouched(self):
+        s, rest = decoder.decode(self.substrate, asn1Spec=self.s, lazy=True)
+
+        assert encoder.encode(s) == self.substrate
+
+    def testReencodeTouched(self):
+        s, rest = decoder.decode(self.substrate, asn1Spec=self.s, lazy=True)
+
+        assert s['id'] == 1
+
+        assert encoder.encode(s) == self.substrate
+
+    def testReencodeModified(self):
+        s, rest = decoder.decode(self.substrate, asn1Spec=self.s, lazy=True)
+
+        s['inner']['id'] = 6
+
+        assert encoder.encode(s) == ints2octs(
+            (48, 26, 2, 1, 1, 160, 13, 48, 11, 2, 1, 6, 48, 6, 4, 1, 113,
+             4, 1, 119, 48, 6, 2, 1, 1, 2, 1, 2))
+
+    def testReencodeCleared(self):
+        s, rest = decoder.decode(self.substrate, asn1Spec=self.s, lazy=True)
+
+        s['ints'].clear()
+
+        assert encoder.encode(s) == ints2octs(
+            (48, 21, 2, 1, 1, 160, 129, 13, 48, 11, 2, 1, 5, 48, 6, 4, 1, 113,
+             4, 1, 119, 48, 0))
+
+    def testReencodeOtherRules(self):
+        s, rest = decoder.decode(self.substrate, asn1Spec=self.s, lazy=True)
+
+        assert der_encoder.encode(s) == ints2octs(
+            (48, 26, 2, 1, 1, 160, 13, 48, 11, 2, 1, 5, 48, 6, 4, 1, 113,
+             4, 1, 119, 48, 6, 2, 1, 1, 2, 1, 2))
+
+    def testDeferredError(self):
+        substrate = ints2octs((48, 10, 2, 1, 1, 48, 5, 2, 1, 1, 5, 0))
+
+        s, rest = decoder.decode(substrate, asn1Spec=self.s, lazy=True)
+
+        assert s['id'] == 1
+
+        try:
+            list(s['ints'])
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert False, 'broken component decoded'
+
+
+class KeepSubstrateTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        self.s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('id', univ.Integer()),
+                namedtype.NamedType(
+                    'inner', univ.SequenceOf(componentType=univ.Integer()))
+            )
+        )
+
+        # non-minimal length encoding of the inner SEQUENCE OF
+        self.substrate = ints2octs(
+            (48, 12, 2, 1, 1, 48, 129, 6, 2, 1, 1, 2, 1, 2))
+
+        self.indefSubstrate = ints2octs(
+            (48, 128, 2, 1, 1, 48, 128, 2, 1, 1, 2, 1, 2, 0, 0, 0, 0))
+
+    def testDefault(self):
+        s, rest = decoder.decode(self.substrate, asn1Spec=self.s)
+
+        assert s.substrate is None
+
+    def testDefMode(self):
+        s, rest = decoder.decode(
+            self.substrate, asn1Spec=self.s, keepSubstrate=True)
+
+        assert s.substrate == self.substrate
+        assert s['inner'].substrate == self.substrate[5:]
+
+    def testIndefMode(self):
+        s, rest = decoder.decode(
+            self.indefSubstrate, asn1Spec=self.s, keepSubstrate=True)
+
+        assert s.substrate == self.indefSubstrate
+        assert s['inner'].substrate == self.indefSubstrate[5:15]
+
+    def testSchemaless(self):
+        s, rest = decoder.decode(self.substrate, keepSubstrate=True)
+
+        assert s.substrate == self.substrate
+        assert s[1].substrate == self.substrate[5:]
+
+    def testCompiled(self):
+        decode = decoder.decode.compile(self.s, keepSubstrate=True)
+
+        s, rest = decode(self.substrate)
+
+        assert s.substrate == self.substrate
+        assert s['inner'].substrate == self.substrate[5:]
+
+    def testLazy(self):
+        s, rest = decoder.decode(
+            self.substrate, asn1Spec=self.s, lazy=True, keepSubstrate=True)
+
+        assert s['inner'].substrate == self.substrate[5:]
+        assert list(s['inner']) == [1, 2]
+        assert s.substrate == self.substrate
+
+    def testReencode(self):
+        s, rest = decoder.decode(
+            self.substrate, asn1Spec=self.s, keepSubstrate=True)
+
+        assert encoder.encode(s) == self.substrate
+
+    def testReencodeOtherRules(self):
+        s, rest = decoder.decode(
+            self.substrate, asn1Spec=self.s, keepSubstrate=True)
+
+        assert der_encoder.encode(s) == ints2octs(
+            (48, 11, 2, 1, 1, 48, 6, 2, 1, 1, 2, 1, 2))
+
+    def testModified(self):
+        s, rest = decoder.decode(
+            self.substrate, asn1Spec=self.s, keepSubstrate=True)
+
+        s['inner'][0] = 3
+
+        assert s.substrate is None
+        assert s['inner'].substrate is None
+        assert encoder.encode(s) == ints2octs(
+            (48, 11, 2, 1, 1, 48, 6, 2, 1, 3, 2, 1, 2))
+
+    def testComponentCleared(self):
+        s, rest = decoder.decode(
+            self.substrate, asn1Spec=self.s, keepSubstrate=True)
+
+        s['inner'].clear()
+
+        assert s.substrate is None
+        assert encoder.encode(s) == ints2octs((48, 5, 2, 1, 1, 48, 0))
+
+    def testComponentReset(self):
+        s, rest = decoder.decode(
+            self.substrate, asn1Spec=self.s, keepSubstrate=True)
+
+        s['inner'].reset()
+
+        assert s.substrate is None
+        assert encoder.encode(s) == ints2octs((48, 5, 2, 1, 1, 48, 0))
+
+    def testAbsentComponentRead(self):
+        optional = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('id', univ.Integer()),
+                namedtype.OptionalNamedType('any', univ.Any()),
+                namedtype.OptionalNamedType(
+                    'inner', univ.SequenceOf(componentType=univ.Integer()))
+            )
+        )
+
+        substrate = ints2octs((48, 4, 2, 2, 0, 1))
+
+        s, rest = decoder.decode(
+            substrate, asn1Spec=optional, keepSubstrate=True)
+
+        assert not s['any'].isValue
+        assert not s['inner'].isValue
+        assert s.substrate == substrate
+        assert s['inner'].substrate is None
+        assert encoder.encode(s) == substrate
+
+        s['inner'].append(1)
+
+        assert s.substrate is None
+        assert encoder.encode(s) == ints2octs(
+            (48, 8, 2, 1, 1, 48, 3, 2, 1, 1))
+
+    def testFromFile(self):
+        fd, path = tempfile.mkstemp()
+
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                out.write(self.substrate * 2)
+
+            values = list(decoder.StreamingDecoder.fromPath(
+                path, asn1Spec=self.s, keepSubstrate=True))
+
+            assert len(values) == 2
+            assert values[1].substrate == self.substrate
+
+            del values
+
+        finally:
+            os.remove(path)
+
+
+class IndexSubstrateTestCase(BaseTestCase):
+    def testDefMode(self):
+        index = decoder.indexSubstrate(
+            ints2octs((48, 9, 2, 1, 1, 2, 1, 2, 2, 1, 3)))
+
+        assert len(index) == 4
+        assert index[0] == (0, tag.tagClassUniversal, tag.tagFormatConstructed, 16, 0, 2, 9)
+        assert index[3] == (1, tag.tagClassUniversal, tag.tagFormatSimple, 2, 8, 10, 1)
+        assert list(index.children(0)) == [1, 2, 3]
+
+    def testIndefMode(self):
+        index = decoder.indexSubstrate(
+            ints2octs((48, 128, 2, 1, 1, 36, 128, 4, 1, 102, 0, 0, 48, 0, 0, 0,
+                       2, 1, 5)))
+
+        assert [index[x] for x in range(len(index))] == [
+            (0, 0, 32, 16, 0, 2, 12),
+            (1, 0, 0, 2, 2, 4, 1),
+            (1, 0, 32, 4, 5, 7, 3),
+            (2, 0, 0, 4, 7, 9, 1),
+            (1, 0, 32, 16, 12, 14, 0),
+            (0, 0, 0, 2, 16, 18, 1)
+        ]
+        assert list(index.children()) == [0, 5]
+        assert list(index.children(0)) == [1, 2, 4]
+
+    def testLongTag(self):
+        index = decoder.indexSubstrate(
+            ints2octs((127, 141, 245, 182, 253, 47, 3, 2, 1, 1)))
+
+        assert index[0][:4] == (0, tag.tagClassApplication, tag.tagFormatConstructed, 3735928495)
+        assert index[1] == (1, 0, 0, 2, 7, 9, 1)
+
+    def testBuffers(self):
+        substrate = ints2octs((48, 3, 2, 1, 1))
+
+        for buffer in (bytearray(substrate), memoryview(substrate),
+                       univ.OctetString(substrate)):
+            assert len(decoder.indexSubstrate(buffer)) == 2
+
+    def testShortSubstrate(self):
+        try:
+            decoder.indexSubstrate(ints2octs((48, 9, 2, 1, 1, 2, 1, 2, 2, 1)))
+
+        except error.SubstrateUnderrunError:
+            pass
+
+        else:
+            assert False, 'short substrate tolerated'
+
+    def testOverrun(self):
+        try:
+            decoder.indexSubstrate(ints2octs((48, 2, 2, 1, 1)))
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert False, 'TLV overrun tolerated'
+
+    def testIndefModeOverrun(self):
+        for substrate in ((48, 3, 48, 128, 2, 1, 1, 0, 0),
+                          (48, 4, 48, 128, 2, 1, 1, 0, 0, 0, 0),
+                          (48, 6, 48, 128, 2, 1, 1, 0, 0)):
+            try:
+                decoder.indexSubstrate(ints2octs(substrate))
+
+            except error.PyAsn1Error:
+                pass
+
+            else:
+                assert False, 'TLV overrun tolerated at %s' % (substrate,)
+
+    def testIndefModeWithinDefMode(self):
+        index = decoder.indexSubstrate(
+            ints2octs((48, 7, 48, 128, 2, 1, 1, 0, 0)))
+
+        assert list(index.children(0)) == [1]
+
+    def testHugeLength(self):
+        try:
+            decoder.indexSubstrate(ints2octs((4, 137) + (255,) * 9))
+
+        except error.SubstrateUnderrunError:
+            pass
+
+        else:
+            assert False, 'huge length tolerated'
+
+    def testHugeTagId(self):
+        try:
+            decoder.indexSubstrate(ints2octs((31,) + (255,) * 10 + (127, 0)))
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert False, 'huge tag ID tolerated'
+
+    def testMissingEndOfOctets(self):
+        try:
+            decoder.indexSubstrate(ints2octs((48, 128, 2, 1, 1)))
+
+        except error.SubstrateUnderrunError:
+            pass
+
+        else:
+            assert False, 'missing end-of-octets tolerated'
+
+    def testMaxDepth(self):
+        substrate = ints2octs((48, 5, 48, 3, 2, 1, 1))
+
+        assert len(decoder.indexSubstrate(substrate, maxDepth=2)) == 3
+
+        try:
+            decoder.indexSubstrate(substrate, maxDepth=1)
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert False, 'too deep nesting tolerated'
+
+
+class IterativeDecoderTestCase(BaseTestCase):
+    substrates = [
+        ints2octs((2, 1, 12)),
+        ints2octs((48, 9, 2, 1, 1, 2, 1, 2, 2, 1, 3)),
+        ints2octs((48, 6, 2, 1, 1, 4, 1, 113)),
+        ints2octs((49, 128, 2, 1, 1, 4, 1, 113, 0, 0)),
+        ints2octs((161, 5, 48, 3, 2, 1, 5)),
+        ints2octs((161, 128, 2, 1, 5, 0, 0)),
+        ints2octs((127, 141, 245, 182, 253, 47, 3, 2, 1, 1)),
+        ints2octs((36, 128, 36, 128, 4, 1, 97, 0, 0, 4, 1, 98, 0, 0)),
+        ints2octs((35, 8, 3, 2, 0, 1, 3, 2, 0, 2)),
+        ints2octs((44, 128, 12, 1, 97, 0, 0)),
+        ints2octs((48, 14, 6, 3, 43, 6, 1, 5, 0, 1, 1, 255, 23, 2, 57, 57)),
+    ]
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        self.decode = decoder.IterativeDecoder()
+
+    def testSameAsGeneric(self):
+        for substrate in self.substrates:
+            asn1Object, rest = self.decode(substrate + ints2octs((1,)))
+            expected, _ = decoder.decode(substrate)
+
+            assert asn1Object == expected
+            assert asn1Object.tagSet == expected.tagSet
+            assert type(asn1Object) == type(expected)
+            assert rest == ints2octs((1,))
+
+    def testEmptyConstructed(self):
+        asn1Object, rest = self.decode(ints2octs((48, 2, 48, 0)))
+
+        assert len(asn1Object) == 1
+        assert len(asn1Object[0]) == 0
+
+    def testNestedDefLenString(self):
+        asn1Object, rest = self.decode(
+            ints2octs((36, 8, 36, 3, 4, 1, 97, 4, 1, 98)))
+
+        assert asn1Object == str2octs('ab')
+
+    def testDeepNesting(self):
+        depth = sys.getrecursionlimit() * 2
+
+        substrate = (ints2octs((48, 128)) * depth + ints2octs((2, 1, 7)) +
+                     ints2octs((0, 0)) * depth)
+
+        asn1Object, rest = self.decode(substrate)
+
+        for _ in range(depth):
+            asn1Object = asn1Object[0]
+
+        assert asn1Object == 7
+
+    def testMaxDepth(self):
+        substrate = ints2octs((48, 5, 48, 3, 2, 1, 1))
+
+        assert self.decode(substrate, maxDepth=2)[0][0][0] == 1
+
+        try:
+            decoder.IterativeDecoder(maxDepth=1)(substrate)
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert False, 'too deep nesting tolerated'
+
+    def testShortSubstrate(self):
+        for substrate in (ints2octs((48, 9, 2, 1, 1, 2, 1, 2, 2, 1)),
+                          ints2octs((48, 128, 2, 1, 1))):
+            try:
+                self.decode(substrate)
+
+            except error.SubstrateUnderrunError:
+                pass
+
+            else:
+                assert False, 'short substrate tolerated'
+
+    def testOverrun(self):
+        try:
+            self.decode(ints2octs((48, 2, 2, 1, 1)))
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert False, 'TLV overrun tolerated'
+
+    def testIndefModeOverrun(self):
+        for substrate in ((48, 3, 48, 128, 2, 1, 1, 0, 0),
+                          (48, 4, 48, 128, 2, 1, 1, 0, 0, 0, 0),
+                          (48, 6, 48, 128, 2, 1, 1, 0, 0)):
+            try:
+                self.decode(ints2octs(substrate))
+
+            except error.PyAsn1Error:
+                pass
+
+            else:
+                assert False, 'TLV overrun tolerated at %s' % (substrate,)
+
+    def testIndefModeWithinDefMode(self):
+        asn1Object, rest = self.decode(
+            ints2octs((48, 7, 48, 128, 2, 1, 1, 0, 0)))
+
+        assert asn1Object[0][0] == 1
+        assert not rest
+
+    def testUnknownTag(self):
+        try:
+            self.decode(ints2octs((0x81, 1, 1)))
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert False, 'unknown tag tolerated'
+
+
+class ComponentPathsTestCaseBase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        inner = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('id', univ.Integer()),
+                namedtype.NamedType(
+                    'blobs', univ.SequenceOf(componentType=univ.OctetString()))
+            )
+        )
+
+        self.s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('id', univ.Integer()),
+                namedtype.OptionalNamedType('null', univ.Null()),
+                namedtype.NamedType(
+                    'inner', inner.subtype(
+                        explicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatConstructed, 0))),
+                namedtype.NamedType(
+                    'choice', univ.Choice(
+                        componentType=namedtype.NamedTypes(
+                            namedtype.NamedType('int', univ.Integer()),
+                            namedtype.NamedType('str', univ.OctetString()))))
+            )
+        )
+
+        self.substrate = ints2octs(
+            (48, 24, 2, 1, 1, 160, 13, 48, 11, 2, 1, 5, 48, 6, 4, 1, 113,
+             4, 1, 119, 4, 4, 102, 111, 120, 33))
+
+        self.indefSubstrate = ints2octs(
+            (48, 128, 2, 1, 1, 160, 128, 48, 128, 2, 1, 5, 48, 128, 4, 1, 113,
+             36, 128, 4, 1, 119, 0, 0, 0, 0, 0, 0, 0, 0, 4, 4, 102, 111, 120, 33,
+             0, 0))
+
+
+class ExtractTestCase(ComponentPathsTestCaseBase):
+
+    def testPaths(self):
+        for substrate in (self.substrate, self.indefSubstrate):
+            values = decoder.decode.extract(
+                substrate, self.s,
+                ['id', 'inner.blobs.1', 'choice.str', 'choice.int'])
+
+            assert values == {
+                'id': 1,
+                'inner.blobs.1': str2octs('w'),
+                'choice.str': str2octs('fox!')
+            }
+
+    def testOverlappingPaths(self):
+        values = decoder.decode.extract(
+            self.substrate, self.s, ['inner', 'inner.id', 'inner.blobs.0'])
+
+        assert values['inner'] == decoder.decode(
+            self.substrate, asn1Spec=self.s)[0]['inner']
+        assert values['inner.id'] == 5
+        assert values['inner.blobs.0'] == str2octs('q')
+
+    def testAbsentComponents(self):
+        values = decoder.decode.extract(
+            self.substrate, self.s, ['null', 'inner.blobs.2'])
+
+        assert values == {}
+
+    def testSkipped(self):
+        # broken INTEGER in place of SEQUENCE OF
+        substrate = ints2octs(
+            (48, 24, 2, 1, 1, 160, 13, 48, 11, 2, 1, 5, 2, 6, 4, 1, 113,
+             4, 1, 119, 4, 4, 102, 111, 120, 33))
+
+        values = decoder.decode.extract(
+            substrate, self.s, ['id', 'inner.id', 'choice'])
+
+        assert values == {'id': 1, 'inner.id': 5, 'choice': str2octs('fox!')}
+
+    def testCompiled(self):
+        extract = decoder.decode.compile(self.s).extract
+
+        assert extract(self.substrate, ['inner.id']) == {'inner.id': 5}
+        assert extract(self.indefSubstrate, ['inner.id']) == {'inner.id': 5}
+
+    def testUnknownName(self):
+        try:
+            decoder.decode.extract(self.substrate, self.s, ['inner.name'])
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert False, 'unknown component name tolerated'
+
+    def testScalarPath(self):
+        try:
+            decoder.decode.extract(self.substrate, self.s, ['id.value'])
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert False, 'path into scalar tolerated'
+
+
+class ComponentFilterTestCase(ComponentPathsTestCaseBase):
+
+    def testSkip(self):
+        for substrate in (self.substrate, self.indefSubstrate):
+            s, rest = decoder.decode(
+                substrate, asn1Spec=self.s,
+                skipComponents=['inner.blobs.0', 'choice'])
+
+            assert s['id'] == 1
+            assert list(s['inner']['blobs']) == [str2octs('w')]
+            assert not s['choice'].isValue
+            assert not rest
+
+    def testSkipAll(self):
+        s, rest = decoder.decode(
+            self.substrate, asn1Spec=self.s,
+            skipComponents=['inner.blobs.*', 'choice.str'])
+
+        assert s['inner']['blobs'] == []
+        assert not s['choice'].isValue
+
+    def testRaw(self):
+        s, rest = decoder.decode(
+            self.substrate, asn1Spec=self.s, rawComponents=['inner'])
+
+        assert isinstance(s['inner'], univ.Any)
+        assert s['inner'] == self.substrate[5:20]
+        assert encoder.encode(s) == self.substrate
+
+    def testRawIndefMode(self):
+        s, rest = decoder.decode(
+            self.indefSubstrate, asn1Spec=self.s, rawComponents=['inner'])
+
+        inner, rest = decoder.decode(
+            s['inner'], asn1Spec=self.s.componentType['inner'].asn1Object)
+
+        assert inner['id'] == 5
+        assert not rest
+
+    def testSameAsGeneric(self):
+        s, rest = decoder.decode(
+            self.substrate, asn1Spec=self.s, skipComponents=['null'])
+
+        assert s == decoder.decode(self.substrate, asn1Spec=self.s)[0]
+
+    def testCompiled(self):
+        decode = decoder.decode.compile(self.s, skipComponents=['inner'])
+
+        assert not decode(self.substrate)[0]['inner'].isValue
+        assert decode(self.substrate, skipComponents=[])[0]['inner'].isValue
+
+    def testUnknownComponent(self):
+        for paths in (['nope'], ['id.nope'], ['inner.blobs.first']):
+            try:
+                decoder.decode(self.substrate, asn1Spec=self.s,
+                               skipComponents=paths)
+
+            except error.PyAsn1Error:
+                pass
+
+            else:
+                assert False, 'bad path %s tolerated' % paths
+
+    def testConflict(self):
+        try:
+            decoder.decode(self.substrate, asn1Spec=self.s,
+                           skipComponents=['id'], rawComponents=['id'])
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert False, 'conflicting paths tolerated'
+
+    def testSkipDeepNesting(self):
+        s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('blob', univ.Any()),
+                namedtype.NamedType('id', univ.Integer())
+            )
+        )
+
+        depth = sys.getrecursionlimit() * 2
+
+        blob = (ints2octs((48, 128)) * depth + ints2octs((5, 0)) +
+                ints2octs((0, 0)) * depth)
+
+        substrate = ints2octs((48, 128)) + blob + ints2octs((2, 1, 7, 0, 0))
+
+        asn1Object, rest = decoder.decode(
+            substrate, asn1Spec=s, skipComponents=['blob'])
+
+        assert not asn1Object['blob'].isValue
+        assert asn1Object['id'] == 7
+
+        asn1Object, rest = decoder.decode(
+            substrate, asn1Spec=s, rawComponents=['blob'])
+
+        assert asn1Object['blob'] == blob
+
+        assert decoder.decode.extract(substrate, s, ['id'])['id'] == 7
+
+    def testCompiledOnce(self):
+        assert (decoder.decode.compile(self.s, skipComponents=['id']) is
+                decoder.decode.compile(self.s, skipComponents=['id']))
+
+    def testFileObject(self):
+        try:
+            decoder.decode(io.BytesIO(self.substrate), asn1Spec=self.s,
+                           skipComponents=['id'])
+
+        except error.UnsupportedSubstrateError:
+            pass
+
+        else:
+            assert False, 'file object tolerated'
+
+
+class DecodeManyTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        self.s = univ.SequenceOf(componentType=univ.Integer())
+
+        self.substrates = [
+            ints2octs((48, 3, 2, 1, 1)),
+            ints2octs((48, 3, 2)),
+            bytearray(ints2octs((48, 6, 2, 1, 2, 2, 1, 3, 5, 0)))
+        ]
+
+    def testWithoutSchema(self):
+        results = list(decoder.decode.decodeMany(self.substrates))
+
+        assert len(results) == 3
+        assert results[0] == ([1], null)
+        assert isinstance(results[1], error.SubstrateUnderrunError)
+        assert results[2] == ([2, 3], ints2octs((5, 0)))
+
+    def testWithSchema(self):
+        results = list(decoder.decode.decodeMany(
+            self.substrates, asn1Spec=self.s))
+
+        assert len(results) == 3
+        assert results[0] == ([1], null)
+        assert isinstance(results[1], error.SubstrateUnderrunError)
+        assert results[2] == ([2, 3], ints2octs((5, 0)))
+        assert results[2][0].isSameTypeWith(self.s)
+
+    def testWithSchemaAndSubstrateFun(self):
+        results = list(decoder.decode.decodeMany(
+            self.substrates[::2], asn1Spec=self.s,
+            substrateFun=lambda a, b, c, d: streaming.readFromStream(b, c)))
+
+        assert results == [
+            (ints2octs((2, 1, 1)), null),
+            (ints2octs((2, 1, 2, 2, 1, 3)), ints2octs((5, 0)))]
+
+    def testWithSchemaAndLimits(self):
+        results = list(decoder.decode.decodeMany(
+            self.substrates[::2], asn1Spec=self.s, maxComponents=2))
+
+        assert results[0] == ([1], null)
+        assert isinstance(results[1], error.DecodingLimitError)
+
+    def testSchemaMismatch(self):
+        results = list(decoder.decode.decodeMany(
+            [ints2octs((5, 0)), ints2octs((48, 0))], asn1Spec=self.s))
+
+        assert isinstance(results[0], error.PyAsn1Error)
+        assert results[1] == ([], null)
+
+    def testLazy(self):
+        results = list(decoder.decode.decodeMany(
+            self.substrates, asn1Spec=self.s, lazy=True))
+
+        assert results[0] == ([1], null)
+        assert isinstance(results[1], error.SubstrateUnderrunError)
+        assert results[2] == ([2, 3], ints2octs((5, 0)))
+
+    def testSameAsDecode(self):
+        s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('a', univ.Integer()),
+                namedtype.OptionalNamedType('any', univ.Any()),
+                namedtype.OptionalNamedType('t', univ.OctetString()),
+                namedtype.NamedType('b', univ.Boolean())
+            )
+        )
+
+        substrates = [
+            ints2octs((48, 9, 2, 1, 0, 4, 1, 120, 1, 1, 255)),
+            ints2octs((48, 11, 2, 1, 0, 5, 0, 4, 1, 120, 1, 1, 255)),
+            ints2octs((48, 12, 2, 1, 0, 4, 1, 121, 4, 1, 120, 1, 1, 255))
+        ]
+
+        results = list(decoder.decode.decodeMany(substrates, asn1Spec=s))
+
+        assert len(results) == len(substrates)
+
+        for substrate, result in zip(substrates, results):
+            try:
+                expected = decoder.decode(substrate, asn1Spec=s)
+
+            except error.PyAsn1Error:
+                assert isinstance(result, error.PyAsn1Error), substrate
+
+            else:
+                assert result == expected, substrate
+                assert result[0]['t'] == expected[0]['t'], substrate
+                assert result[0]['any'] == expected[0]['any'], substrate
+
+    def testIterator(self):
+        results = decoder.decode.decodeMany(iter(self.substrates))
+
+        assert next(results) == ([1], null)
+
+
+class PushDecoderTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        self.s = univ.SequenceOf(componentType=univ.OctetString())
+        self.s.extend(['x' * 300, 'y'])
+
+        self.substrate = (
+            encoder.encode(self.s) +
+            encoder.encode(self.s, defMode=False, maxChunkSize=7) +
+            ints2octs((5, 0)) +
+            encoder.encode(univ.Integer(5)))
+
+    def testByteByByte(self):
+        decoder_ = decoder.PushDecoder()
+
+        results = []
+
+        for idx in range(len(self.substrate)):
+            decoder_.feed(self.substrate[idx:idx + 1])
+            results.extend(decoder_.popDecoded())
+
+        assert results == [self.s, self.s, univ.Null(''), 5]
+
+    def testAtOnce(self):
+        decoder_ = decoder.PushDecoder()
+
+        decoder_.feed(bytearray(self.substrate))
+
+        assert decoder_.popDecoded() == [self.s, self.s, univ.Null(''), 5]
+        assert decoder_.popDecoded() == []
+
+    def testPartial(self):
+        decoder_ = decoder.PushDecoder(asn1Spec=self.s.clone())
+
+        decoder_.feed(self.substrate[:100])
+
+        assert decoder_.popDecoded() == []
+
+        decoder_.feed(self.substrate[100:len(encoder.encode(self.s))])
+
+        results = decoder_.popDecoded()
+
+        assert results == [self.s]
+        assert results[0].isSameTypeWith(self.s)
+
+    def testError(self):
+        decoder_ = decoder.PushDecoder(asn1Spec=univ.Integer())
+
+        try:
+            decoder_.feed(ints2octs((5, 0, 2, 1)))
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert 0, 'schema mismatch tolerated'
+
+        decoder_.feed(ints2octs((7,)))
+
+        assert decoder_.popDecoded() == [7]
+
+    def testDrainAfterError(self):
+        decoder_ = decoder.PushDecoder(asn1Spec=univ.Integer())
+
+        try:
+            decoder_.feed(ints2octs((5, 0, 2, 1, 1, 4, 0, 2, 1, 2, 2)))
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert 0, 'schema mismatch tolerated'
+
+        assert decoder_.popDecoded() == [1, 2]
+
+        decoder_.feed(ints2octs((1, 3)))
+
+        assert decoder_.popDecoded() == [3]
+
+    def testValueLengthLimit(self):
+        decoder_ = decoder.PushDecoder(
+            maxValueLength=100, maxTotalLength=1000)
+
+        # 2 GiB OCTET STRING header
+        try:
+            decoder_.feed(ints2octs((4, 132, 127, 255, 255, 255)))
+
+        except error.DecodingLimitError:
+            pass
+
+        else:
+            assert 0, 'value length limit not enforced'
+
+        decoder_.feed(ints2octs((2, 1, 1)))
+
+        assert decoder_.popDecoded() == [1]
+
+    def testTotalLengthLimit(self):
+        decoder_ = decoder.PushDecoder(maxTotalLength=10)
+
+        # indefinite length SEQUENCE OF two 8-octet OCTET STRINGs
+        try:
+            decoder_.feed(ints2octs((48, 128, 4, 8) + (0,) * 8 + (4, 8)))
+
+        except error.DecodingLimitError:
+            pass
+
+        else:
+            assert 0, 'total length limit not enforced'
+
+    def testDepthLimit(self):
+        decoder_ = decoder.PushDecoder(maxDepth=2)
+
+        decoder_.feed(ints2octs((48, 128) * 2 + (5, 0) + (0, 0) * 2))
+
+        assert len(decoder_.popDecoded()) == 1
+
+        try:
+            decoder_.feed(ints2octs((48, 128) * 3 + (5, 0)))
+
+        except error.DecodingLimitError:
+            pass
+
+        else:
+            assert 0, 'depth limit not enforced'
+
+
 suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
 
 if __name__ == '__main__':
@@ -4,6 +4,7 @@
 # Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
 # License: http://snmplabs.com/pyasn1/license.html
 #
+import mmap
 import sys
 import unittest
 
@@ -11,12 +12,15 @@ from tests.base import BaseTestCase
 
 from pyasn1.type import tag
 from pyasn1.type import namedtype
+from pyasn1.type import namedval
 from pyasn1.type import opentype
 from pyasn1.type import univ
 from pyasn1.type import char
+from pyasn1.type import constraint
 from pyasn1.codec.ber import encoder
-from pyasn1.compat.octets import ints2octs
+from pyasn1.compat.octets import ints2octs, null
 from pyasn1.error import PyAsn1Error
+from pyasn1.error import SubstrateOverflowError
 
 
 class LargeTagEncoderTestCase(BaseTestCase):
@@ -76,6 +80,22 @@ class IntegerEncoderWithSchemaTestCase(BaseTestCase):
             0xffffffffffffffff, asn1Spec=univ.Integer()
         ) == ints2octs((2, 9, 0, 255, 255, 255, 255, 255, 255, 255, 255))
 
+    def testNamedValue(self):
+        assert encoder.encode(
+            'two', asn1Spec=univ.Integer(namedValues=namedval.NamedValues(('one', 1), ('two', 2)))
+        ) == ints2octs((2, 1, 2))
+
+    def testConstraintViolation(self):
+        try:
+            encoder.encode(
+                12, asn1Spec=univ.Integer(subtypeSpec=constraint.ValueRangeConstraint(0, 10)))
+
+        except PyAsn1Error:
+            pass
+
+        else:
+            assert 0, 'constraint violation tolerated'
+
 
 class BooleanEncoderTestCase(BaseTestCase):
     def testTrue(self):
@@ -147,6 +167,11 @@ class BitStringEncoderWithSchemaTestCase(BaseTestCase):
     def testEmptyValue(self):
         assert encoder.encode([],  asn1Spec=self.s) == ints2octs((3, 1, 0))
 
+    def testBinString(self):
+        assert encoder.encode(
+            "'101010011000101'B", asn1Spec=self.s
+        ) == ints2octs((3, 3, 1, 169, 138))
+
 
 class OctetStringEncoderTestCase(BaseTestCase):
     def setUp(self):
@@ -202,6 +227,18 @@ class OctetStringEncoderWithSchemaTestCase(BaseTestCase):
         ) == ints2octs((36, 128, 4, 4, 81, 117, 105, 99, 4, 4, 107, 32, 98, 114, 4, 4, 111, 119, 110,
                         32, 4, 3, 102,  111, 120, 0, 0))
 
+    def testConstraintViolation(self):
+        for value in (self.o, ints2octs((81, 117, 105, 99, 107))):
+            try:
+                encoder.encode(
+                    value, asn1Spec=univ.OctetString(subtypeSpec=constraint.ValueSizeConstraint(0, 4)))
+
+            except PyAsn1Error:
+                pass
+
+            else:
+                assert 0, 'constraint violation tolerated'
+
 
 class ExpTaggedOctetStringEncoderTestCase(BaseTestCase):
     def setUp(self):
@@ -349,6 +386,29 @@ class ObjectIdentifierEncoderTestCase(BaseTestCase):
         ) == ints2octs((0x06, 0x13, 0x88, 0x37, 0x83, 0xC6, 0xDF, 0xD4, 0xCC, 0xB3, 0xFF, 0xFF, 0xFE, 0xF0, 0xB8, 0xD6,
                         0xB8, 0xCB, 0xE2, 0xB6, 0x47))
 
+    def testPayloadCache(self):
+        oid = (1, 3, 6, 1, 4, 1, 20408, 0xffffe)
+
+        substrate = encoder.encode(univ.ObjectIdentifier(oid))
+
+        assert oid in encoder.ObjectIdentifierEncoder._payloadCache
+        assert encoder.encode(univ.ObjectIdentifier(oid)) == substrate
+        assert substrate == ints2octs(
+            (6, 11, 43, 6, 1, 4, 1, 129, 159, 56, 191, 255, 126))
+
+    def testPayloadCacheSize(self):
+        encoder.ObjectIdentifierEncoder.payloadCacheSize = 2
+
+        try:
+            for arc in range(3):
+                encoder.encode(univ.ObjectIdentifier((1, 3, 6, arc)))
+
+            assert list(encoder.ObjectIdentifierEncoder._payloadCache) == [
+                (1, 3, 6, 1), (1, 3, 6, 2)]
+
+        finally:
+            encoder.ObjectIdentifierEncoder.payloadCacheSize = 1024
+
 
 class ObjectIdentifierWithSchemaEncoderTestCase(BaseTestCase):
     def testOne(self):
@@ -1491,6 +1551,557 @@ class AnyEncoderWithSchemaTestCase(BaseTestCase):
         assert encoder.encode(self.v, asn1Spec=s) == ints2octs((132, 5, 4, 3, 102, 111, 120))
 
 
+class CacheEncodingTestCase(BaseTestCase):
+    def testDefault(self):
+        value = univ.Integer(12)
+
+        encoder.encode(value)
+
+        assert value._encodingCache is None
+
+    def testCached(self):
+        value = univ.ObjectIdentifier((1, 3, 6, 0, 0xffffe))
+
+        substrate = encoder.encode(value, cacheEncoding=True)
+
+        assert substrate == ints2octs((6, 6, 43, 6, 0, 191, 255, 126))
+        assert encoder.encode(value, cacheEncoding=True) is substrate
+
+    def testModes(self):
+        value = univ.OctetString('Quick brown fox')
+
+        assert encoder.encode(
+            value, cacheEncoding=True
+        ) == ints2octs((4, 15, 81, 117, 105, 99, 107, 32, 98, 114, 111, 119, 110, 32, 102, 111, 120))
+        assert encoder.encode(
+            value, defMode=False, maxChunkSize=4, cacheEncoding=True
+        ) == ints2octs((36, 128, 4, 4, 81, 117, 105, 99, 4, 4, 107, 32, 98, 114, 4, 4, 111, 119, 110, 32, 4, 3,
+                        102, 111, 120, 0, 0))
+        assert len(value._encodingCache) == 2
+
+    def testComponents(self):
+        value = univ.SequenceOf(componentType=univ.Integer())
+        value.extend([1, 2])
+
+        assert encoder.encode(
+            value, cacheEncoding=True
+        ) == ints2octs((48, 6, 2, 1, 1, 2, 1, 2))
+        assert value[0]._encodingCache is not None
+
+        value[0] = 3
+
+        assert encoder.encode(
+            value, cacheEncoding=True
+        ) == ints2octs((48, 6, 2, 1, 3, 2, 1, 2))
+
+    def testClone(self):
+        value = univ.Integer(12)
+
+        encoder.encode(value, cacheEncoding=True)
+
+        value = value.subtype(
+            implicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatSimple, 0))
+
+        assert value._encodingCache is None
+        assert encoder.encode(
+            value, cacheEncoding=True
+        ) == ints2octs((128, 1, 12))
+
+
+class CacheConstructedEncodingTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        inner = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('id', univ.Integer()),
+                namedtype.NamedType(
+                    'blobs', univ.SequenceOf(componentType=univ.OctetString()))
+            )
+        )
+
+        self.s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('counter', univ.Integer()),
+                namedtype.NamedType(
+                    'entries', univ.SequenceOf(componentType=inner)),
+                namedtype.OptionalNamedType(
+                    'extra', inner.subtype(
+                        implicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatConstructed, 0)))
+            )
+        )
+
+        self.s['counter'] = 1
+
+        for idx in range(2):
+            entry = self.s['entries'].getComponentByPosition(idx)
+            entry['id'] = idx
+            entry['blobs'].extend(['q', 'w'])
+
+        self.substrate = ints2octs(
+            (48, 31, 2, 1, 1, 48, 26, 48, 11, 2, 1, 0, 48, 6, 4, 1, 113, 4, 1, 119, 48, 11, 2, 1, 1, 48, 6, 4, 1,
+             113, 4, 1, 119))
+
+    def testDefault(self):
+        encoder.encode(self.s)
+
+        assert self.s._substrate is None
+
+    def testCached(self):
+        assert encoder.encode(self.s, cacheEncoding=True) == self.substrate
+        assert self.s.substrate == self.substrate
+        assert self.s['entries'][1].substrate == self.substrate[-13:]
+
+        assert encoder.encode(self.s) == self.substrate
+
+    def testModified(self):
+        encoder.encode(self.s, cacheEncoding=True)
+
+        clean = self.s['entries'][0]._substrate
+
+        self.s['entries'][1]['blobs'][0] = 'e'
+
+        assert self.s.substrate is None
+        assert self.s['entries'][1].substrate is None
+
+        assert encoder.encode(self.s, cacheEncoding=True) == ints2octs(
+            (48, 31, 2, 1, 1, 48, 26, 48, 11, 2, 1, 0, 48, 6, 4, 1, 113, 4, 1, 119, 48, 11, 2, 1, 1, 48, 6, 4, 1,
+             101, 4, 1, 119))
+        assert self.s['entries'][0]._substrate is clean
+
+    def testAbsentOptional(self):
+        encoder.encode(self.s, cacheEncoding=True)
+
+        assert self.s.substrate == self.substrate
+
+        self.s['extra']['id'] = 2
+        self.s['extra']['blobs'].append('e')
+
+        assert self.s.substrate is None
+        assert encoder.encode(self.s, cacheEncoding=True) == ints2octs(
+            (48, 41, 2, 1, 1, 48, 26, 48, 11, 2, 1, 0, 48, 6, 4, 1, 113, 4, 1, 119, 48, 11, 2, 1, 1, 48, 6, 4, 1,
+             113, 4, 1, 119, 160, 8, 2, 1, 2, 48, 3, 4, 1, 101))
+
+    def testComponentCleared(self):
+        encoder.encode(self.s, cacheEncoding=True)
+
+        self.s['entries'].clear()
+
+        assert self.s.substrate is None
+        assert encoder.encode(self.s) == ints2octs((48, 5, 2, 1, 1, 48, 0))
+
+    def testComponentReset(self):
+        encoder.encode(self.s, cacheEncoding=True)
+
+        self.s['entries'][1]['blobs'].reset()
+
+        assert self.s.substrate is None
+        assert encoder.encode(self.s) == ints2octs(
+            (48, 25, 2, 1, 1, 48, 20, 48, 11, 2, 1, 0, 48, 6, 4, 1, 113, 4, 1, 119, 48, 5, 2, 1, 1, 48, 0))
+
+    def testChoiceCleared(self):
+        s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('choice', univ.Choice(
+                    componentType=namedtype.NamedTypes(
+                        namedtype.NamedType('id', univ.Integer()),
+                        namedtype.NamedType('blobs', univ.SequenceOf(
+                            componentType=univ.OctetString())))))
+            )
+        )
+
+        s['choice']['blobs'].append('q')
+
+        assert encoder.encode(s, cacheEncoding=True) == ints2octs(
+            (48, 5, 48, 3, 4, 1, 113))
+
+        s['choice'].clear()
+        s['choice']['id'] = 1
+
+        assert encoder.encode(s) == ints2octs((48, 3, 2, 1, 1))
+
+    def testIndefMode(self):
+        encoder.encode(self.s, defMode=False, cacheEncoding=True)
+
+        assert self.s._substrate is None
+
+    def testOmitEmptyOptionals(self):
+        s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('id', univ.Integer()),
+                namedtype.OptionalNamedType('inner', univ.Sequence(
+                    componentType=namedtype.NamedTypes(
+                        namedtype.OptionalNamedType('id', univ.Integer())))))
+        )
+
+        s['id'] = 1
+        s['inner'] = s['inner'].clone()
+
+        assert encoder.encode(s, cacheEncoding=True) == ints2octs(
+            (48, 5, 2, 1, 1, 48, 0))
+        assert s.substrate is not None
+
+        assert encoder.encode(s, omitEmptyOptionals=True) == ints2octs(
+            (48, 3, 2, 1, 1))
+        assert encoder.encode(s, defMode=False) == ints2octs(
+            (48, 128, 2, 1, 1, 48, 128, 0, 0, 0, 0))
+
+
+class StreamingEncoderTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        openType = opentype.OpenType(
+            'id',
+            {1: univ.Integer(),
+             2: univ.OctetString()}
+        )
+
+        self.s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('id', univ.Integer()),
+                namedtype.NamedType('blob', univ.Any(), openType=openType),
+                namedtype.OptionalNamedType(
+                    'names', univ.SequenceOf(
+                        componentType=char.IA5String()).subtype(
+                        explicitTag=tag.Tag(tag.tagClassContext,
+                                            tag.tagFormatConstructed, 1))),
+                namedtype.NamedType('choice', univ.Choice(
+                    componentType=namedtype.NamedTypes(
+                        namedtype.NamedType('null', univ.Null()),
+                        namedtype.NamedType('ints', univ.SetOf(
+                            componentType=univ.Integer())))))
+            )
+        )
+
+    def _assertStreamed(self, value, **options):
+        for defMode in (True, False):
+            chunks = list(encoder.StreamingEncoder(
+                value, defMode=defMode, **options))
+
+            assert len(chunks) > 1
+
+            assert null.join(chunks) == encoder.encode(
+                value, defMode=defMode, **options)
+
+    def testDefMode(self):
+        s = univ.SequenceOf(componentType=univ.Integer())
+        s.extend([1, 2, 3])
+
+        assert list(encoder.StreamingEncoder(s)) == [
+            ints2octs((48, 9)), ints2octs((2, 1, 1)),
+            ints2octs((2, 1, 2)), ints2octs((2, 1, 3))
+        ]
+
+    def testIndefMode(self):
+        s = univ.SequenceOf(componentType=univ.Integer())
+        s.extend([1, 2, 3])
+
+        assert list(encoder.StreamingEncoder(s, defMode=False)) == [
+            ints2octs((48, 128)), ints2octs((2, 1, 1)),
+            ints2octs((2, 1, 2)), ints2octs((2, 1, 3)), ints2octs((0, 0))
+        ]
+
+    def testNested(self):
+        self.s['id'] = 2
+        self.s['blob'] = univ.OctetString('quick brown')
+        self.s['names'].extend(['fox'] * 200)
+        self.s['choice']['ints'].extend([1, 2])
+
+        self._assertStreamed(self.s)
+
+    def testChunked(self):
+        self.s['id'] = 2
+        self.s['blob'] = univ.OctetString('quick brown')
+        self.s['names'].extend(['fox' * 10])
+        self.s['choice']['null'] = None
+
+        self._assertStreamed(self.s, maxChunkSize=4)
+
+    def testEmptyOptional(self):
+        self.s['id'] = 1
+        self.s['blob'] = univ.Integer(12)
+        self.s['names'].clear()
+        self.s['choice']['null'] = None
+
+        self._assertStreamed(self.s)
+
+    def testWithSchema(self):
+        value = {'id': 1, 'blob': univ.Integer(12), 'names': ['fox'],
+                 'choice': {'ints': [3, 4]}}
+
+        for defMode in (True, False):
+            assert null.join(encoder.StreamingEncoder(
+                value, asn1Spec=self.s, defMode=defMode)) == encoder.encode(
+                value, asn1Spec=self.s, defMode=defMode)
+
+    def testScalar(self):
+        assert list(encoder.StreamingEncoder(univ.Integer(12))) == [
+            ints2octs((2, 1, 12))
+        ]
+
+    def testNotAsn1(self):
+        try:
+            list(encoder.StreamingEncoder([1, 2, 3]))
+
+        except PyAsn1Error:
+            pass
+
+        else:
+            assert 0, 'non-ASN.1 value tolerated'
+
+
+class TwoPassEncoderTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        self.encode = encoder.TwoPassEncoder()
+
+        self.s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('id', univ.Integer()),
+                namedtype.OptionalNamedType(
+                    'names', univ.SequenceOf(
+                        componentType=char.IA5String()).subtype(
+                        explicitTag=tag.Tag(tag.tagClassContext,
+                                            tag.tagFormatConstructed, 1))),
+                namedtype.NamedType('choice', univ.Choice(
+                    componentType=namedtype.NamedTypes(
+                        namedtype.NamedType('null', univ.Null()),
+                        namedtype.NamedType('ints', univ.SetOf(
+                            componentType=univ.Integer())))))
+            )
+        )
+
+        self.s['id'] = 1
+        self.s['names'].extend(['fox'] * 50)
+        self.s['choice']['ints'].extend([1, 2])
+
+    def testDefMode(self):
+        assert self.encode(self.s) == encoder.encode(self.s)
+
+    def testIndefMode(self):
+        assert self.encode(self.s, defMode=False) == encoder.encode(
+            self.s, defMode=False)
+
+    def testIndefModeChunked(self):
+        self.s['names'][0] = 'fox' * 10
+
+        assert self.encode(
+            self.s, defMode=False, maxChunkSize=4) == encoder.encode(
+            self.s, defMode=False, maxChunkSize=4)
+
+    def testEmptyOptional(self):
+        self.s['names'].clear()
+
+        for defMode in (True, False):
+            assert self.encode(self.s, defMode=defMode) == encoder.encode(
+                self.s, defMode=defMode)
+
+
+class CompiledEncoderTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        self.s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('id', univ.Integer()),
+                namedtype.OptionalNamedType(
+                    'name', univ.OctetString().subtype(
+                        implicitTag=tag.Tag(tag.tagClassContext,
+                                            tag.tagFormatSimple, 0))),
+                namedtype.DefaultedNamedType(
+                    'version', univ.Integer(0).subtype(
+                        explicitTag=tag.Tag(tag.tagClassContext,
+                                            tag.tagFormatSimple, 1))),
+                namedtype.OptionalNamedType(
+                    'names', univ.SequenceOf(
+                        componentType=char.IA5String()).subtype(
+                        explicitTag=tag.Tag(tag.tagClassContext,
+                                            tag.tagFormatConstructed, 2))),
+                namedtype.NamedType('choice', univ.Choice(
+                    componentType=namedtype.NamedTypes(
+                        namedtype.NamedType('null', univ.Null()),
+                        namedtype.NamedType('ints', univ.SetOf(
+                            componentType=univ.Integer())))))
+            )
+        )
+
+        self.encode = encoder.encode.compile(self.s)
+
+    def testDefMode(self):
+        s = self.s.clone()
+        s['id'] = 1
+        s['names'].extend(['fox'] * 3)
+        s['choice']['null'] = null
+
+        assert self.encode(s) == encoder.encode(s)
+
+    def testIndefMode(self):
+        s = self.s.clone()
+        s['id'] = 1
+        s['name'] = 'quick brown fox'
+        s['version'] = 2
+        s['choice']['ints'].extend([2, 1])
+
+        assert self.encode(s, defMode=False) == encoder.encode(
+            s, defMode=False)
+
+    def testIndefModeChunked(self):
+        s = self.s.clone()
+        s['id'] = 1
+        s['names'].extend(['fox' * 10])
+        s['choice']['null'] = null
+
+        assert self.encode(
+            s, defMode=False, maxChunkSize=4) == encoder.encode(
+            s, defMode=False, maxChunkSize=4)
+
+    def testCompileOptions(self):
+        s = self.s.clone()
+        s['id'] = 1
+        s['choice']['null'] = null
+
+        encode = encoder.encode.compile(self.s, defMode=False)
+
+        assert encode(s) == encoder.encode(s, defMode=False)
+        assert encode(s, defMode=True) == encoder.encode(s)
+
+    def testOmittedComponents(self):
+        s = self.s.clone()
+        s['id'] = 1
+        s['version'] = 0
+        s['choice']['null'] = null
+
+        assert self.encode(s) == ints2octs((48, 5, 2, 1, 1, 5, 0))
+
+    def testWithPythonValue(self):
+        value = {'id': 1, 'name': 'fox', 'version': 2,
+                 'names': ['quick', 'brown'], 'choice': {'ints': [1, 2]}}
+
+        assert self.encode(value) == encoder.encode(value, asn1Spec=self.s)
+
+    def testWithPythonValueOmittedComponents(self):
+        value = {'id': 1, 'version': 0, 'choice': {'null': null}}
+
+        assert self.encode(value) == ints2octs((48, 5, 2, 1, 1, 5, 0))
+
+    def testWithPythonValueMissingComponent(self):
+        try:
+            self.encode({'choice': {'null': null}})
+
+        except PyAsn1Error:
+            pass
+
+        else:
+            assert 0, 'missing component tolerated'
+
+    def testScalar(self):
+        encode = encoder.encode.compile(
+            univ.OctetString().subtype(
+                explicitTag=tag.Tag(tag.tagClassContext,
+                                    tag.tagFormatSimple, 3)))
+
+        assert encode('fox') == ints2octs((163, 5, 4, 3, 102, 111, 120))
+
+    def testGenericFallback(self):
+        s = univ.Set(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('blob', univ.Any()),
+                namedtype.NamedType('id', univ.Integer())
+            )
+        )
+
+        encode = encoder.encode.compile(s)
+
+        assert encode({'blob': ints2octs((5, 0)), 'id': 1}) == ints2octs(
+            (49, 5, 5, 0, 2, 1, 1))
+
+    def testReuseSubstrate(self):
+        s = self.s.clone()
+        s['id'] = 1
+        s['choice']['null'] = null
+
+        substrate = self.encode(s, cacheEncoding=True)
+
+        assert s.substrate == substrate
+
+        s['id'] = 2
+
+        assert s.substrate is None
+        assert self.encode(s) == encoder.encode(s)
+
+
+class EncodeIntoTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        self.s = univ.SequenceOf(componentType=univ.Integer())
+        self.s.extend([1, 2, 3])
+
+        self.substrate = ints2octs((48, 9, 2, 1, 1, 2, 1, 2, 2, 1, 3))
+
+    def testBytearray(self):
+        buffer = bytearray(16)
+
+        assert encoder.encode.encodeInto(self.s, buffer, 2) == 11
+        assert bytes(buffer) == ints2octs((0, 0)) + self.substrate + ints2octs((0, 0, 0))
+
+    def testMemoryview(self):
+        buffer = bytearray(11)
+
+        assert encoder.encode.encodeInto(self.s, memoryview(buffer)) == 11
+        assert bytes(buffer) == self.substrate
+
+    def testMmap(self):
+        buffer = mmap.mmap(-1, 20)
+
+        try:
+            assert encoder.encode.encodeInto(self.s, buffer, 9) == 11
+            assert buffer[9:] == self.substrate
+
+        finally:
+            buffer.close()
+
+    def testIndefMode(self):
+        buffer = bytearray(16)
+
+        assert encoder.encode.encodeInto(self.s, buffer, defMode=False) == 13
+        assert bytes(buffer[:13]) == encoder.encode(self.s, defMode=False)
+
+    def testWithSchema(self):
+        buffer = bytearray(11)
+
+        assert encoder.encode.encodeInto(
+            [1, 2, 3], buffer, asn1Spec=self.s) == 11
+        assert bytes(buffer) == self.substrate
+
+    def testOverflow(self):
+        buffer = bytearray(12)
+
+        try:
+            encoder.encode.encodeInto(self.s, buffer, 2)
+
+        except SubstrateOverflowError:
+            exc = sys.exc_info()[1]
+            assert exc.context == {'length': 11, 'offset': 2}
+
+        else:
+            assert 0, 'buffer overflow tolerated'
+
+        assert buffer == bytearray(12)
+
+    def testBadOffset(self):
+        try:
+            encoder.encode.encodeInto(self.s, bytearray(16), 17)
+
+        except PyAsn1Error:
+            pass
+
+        else:
+            assert 0, 'bad offset tolerated'
+
+
 suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
 
 if __name__ == '__main__':
@@ -15,7 +15,7 @@ from pyasn1.type import opentype
 from pyasn1.type import univ
 from pyasn1.type import useful
 from pyasn1.codec.cer import encoder
-from pyasn1.compat.octets import ints2octs
+from pyasn1.compat.octets import ints2octs, null
 from pyasn1.error import PyAsn1Error
 
 
@@ -125,6 +125,21 @@ class GeneralizedTimeEncoderTestCase(BaseTestCase):
                     useful.GeneralizedTime('201708011201Z')
              ) == ints2octs((24, 13, 50, 48, 49, 55, 48, 56, 48, 49, 49, 50, 48, 49, 90))
 
+    def testWithSubsecondsWithZerosWithSchema(self):
+        assert encoder.encode(
+                '20170801120112.090Z', asn1Spec=useful.GeneralizedTime()
+             ) == ints2octs((24, 17, 50, 48, 49, 55, 48, 56, 48, 49, 49, 50, 48, 49, 49, 50, 46, 57, 90))
+
+    def testLocalTimezoneWithSchema(self):
+        try:
+            assert encoder.encode(
+                '20150501120112.1+0200', asn1Spec=useful.GeneralizedTime()
+            )
+        except PyAsn1Error:
+            pass
+        else:
+            assert 0, 'Local timezone tolerated'
+
 
 class UTCTimeEncoderTestCase(BaseTestCase):
     def testFractionOfSecond(self):
@@ -950,6 +965,77 @@ class NestedOptionalSequenceOfEncoderTestCase(BaseTestCase):
         assert encoder.encode(s) == ints2octs((48, 128, 0, 0))
 
 
+class StreamingEncoderTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        self.s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.OptionalNamedType(
+                    'inner', univ.SequenceOf(componentType=univ.OctetString())),
+                namedtype.OptionalNamedType(
+                    'set', univ.SetOf(componentType=univ.OctetString()))
+            )
+        )
+
+    def testIndefMode(self):
+        self.s.clear()
+        self.s['inner'].append('test')
+
+        assert list(encoder.StreamingEncoder(self.s)) == [
+            ints2octs((48, 128)), ints2octs((48, 128)),
+            ints2octs((4, 4, 116, 101, 115, 116)),
+            ints2octs((0, 0)), ints2octs((0, 0))
+        ]
+
+    def testDefModeOverridden(self):
+        self.s.clear()
+        self.s['inner'].append('test')
+
+        assert null.join(encoder.StreamingEncoder(
+            self.s, defMode=True)) == encoder.encode(self.s)
+
+    def testEmptyOptional(self):
+        self.s.clear()
+        self.s['inner'].clear()
+
+        assert null.join(encoder.StreamingEncoder(self.s)) == ints2octs(
+            (48, 128, 0, 0))
+
+    def testChunked(self):
+        self.s.clear()
+        self.s['inner'].append('x' * 2500)
+
+        assert null.join(encoder.StreamingEncoder(self.s)) == encoder.encode(
+            self.s)
+
+    def testSetOfEncodedWhole(self):
+        self.s.clear()
+        self.s['set'].extend(['b', 'a', 'ab'])
+
+        chunks = list(encoder.StreamingEncoder(self.s))
+
+        assert chunks == [
+            ints2octs((48, 128)),
+            ints2octs((49, 128, 4, 1, 97, 4, 1, 98, 4, 2, 97, 98, 0, 0)),
+            ints2octs((0, 0))
+        ]
+
+        assert null.join(chunks) == encoder.encode(self.s)
+
+
+class EncodeIntoTestCase(BaseTestCase):
+    def testSequenceOf(self):
+        s = univ.SequenceOf(componentType=univ.OctetString())
+        s.extend(['x' * 1500])
+
+        buffer = bytearray(1600)
+
+        length = encoder.encode.encodeInto(s, buffer)
+
+        assert bytes(buffer[:length]) == encoder.encode(s)
+
+
 suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
 
 if __name__ == '__main__':
@@ -362,6 +362,105 @@ class SequenceDecoderWithExplicitlyTaggedSetOfOpenTypesTestCase(BaseTestCase):
         assert s[1][0] == univ.OctetString(hexValue='02010C')
 
 
+class CompiledDecoderTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+        self.s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('id', univ.Integer()),
+                namedtype.NamedType('blob', univ.OctetString())
+            )
+        )
+
+    def testDefMode(self):
+        substrate = ints2octs((48, 8, 2, 1, 12, 4, 3, 102, 111, 120))
+
+        assert decoder.decode.compile(self.s)(substrate) == decoder.decode(
+            substrate, asn1Spec=self.s)
+
+    def testIndefMode(self):
+        try:
+            decoder.decode.compile(self.s)(
+                ints2octs((48, 128, 2, 1, 12, 4, 3, 102, 111, 120, 0, 0))
+            )
+        except PyAsn1Error:
+            pass
+        else:
+            assert 0, 'indefinite length encoding tolerated'
+
+
+class DecodeManyTestCase(BaseTestCase):
+    def testIndefMode(self):
+        results = list(decoder.decode.decodeMany(
+            [ints2octs((48, 3, 2, 1, 1)), ints2octs((48, 128, 2, 1, 1, 0, 0))]))
+
+        assert results[0] == ([1], null)
+        assert isinstance(results[1], PyAsn1Error)
+
+
+class PushDecoderTestCase(BaseTestCase):
+    def testDefMode(self):
+        decoder_ = decoder.PushDecoder()
+
+        decoder_.feed(ints2octs((48, 3, 2, 1)))
+        decoder_.feed(ints2octs((1,)))
+
+        assert decoder_.popDecoded() == [[1]]
+
+    def testIndefMode(self):
+        decoder_ = decoder.PushDecoder()
+
+        try:
+            decoder_.feed(ints2octs((48, 128, 2, 1, 1, 0, 0)))
+
+        except PyAsn1Error:
+            pass
+
+        else:
+            assert 0, 'indefinite length tolerated'
+
+    def testIndefModeHeaderDropped(self):
+        decoder_ = decoder.PushDecoder()
+
+        try:
+            decoder_.feed(ints2octs((48, 128, 2, 1, 1)))
+
+        except PyAsn1Error:
+            pass
+
+        else:
+            assert 0, 'indefinite length tolerated'
+
+        assert decoder_.popDecoded() == [1]
+
+
+class IterativeDecoderTestCase(BaseTestCase):
+    def testDefMode(self):
+        substrate = ints2octs((48, 8, 2, 1, 12, 4, 3, 102, 111, 120))
+
+        assert decoder.IterativeDecoder()(substrate) == decoder.decode(substrate)
+
+    def testIndefMode(self):
+        try:
+            decoder.IterativeDecoder()(ints2octs((48, 128, 2, 1, 12, 0, 0)))
+
+        except PyAsn1Error:
+            pass
+
+        else:
+            assert 0, 'indefinite length encoding tolerated'
+
+    def testChunkedMode(self):
+        try:
+            decoder.IterativeDecoder()(ints2octs((36, 6, 4, 1, 97, 4, 1, 98)))
+
+        except PyAsn1Error:
+            pass
+
+        else:
+            assert 0, 'chunked encoding tolerated'
+
+
 suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
 
 if __name__ == '__main__':
@@ -639,6 +639,176 @@ class EmptyInnerFieldOfSequenceEncoderTestCase(BaseTestCase):
         assert encoder.encode(self.s) == ints2octs((48, 0))
 
 
+class CacheEncodingTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        self.s = univ.Set(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('place-holder', univ.Null('')),
+                namedtype.OptionalNamedType(
+                    'inner', univ.SequenceOf(componentType=univ.OctetString())),
+                namedtype.NamedType('first-name', univ.OctetString())
+            )
+        )
+
+        self.s['first-name'] = 'quick'
+        self.s['inner'].clear()
+
+    def testCached(self):
+        assert encoder.encode(self.s, cacheEncoding=True) == ints2octs(
+            (49, 9, 4, 5, 113, 117, 105, 99, 107, 5, 0))
+        assert encoder.encode(self.s) == ints2octs(
+            (49, 9, 4, 5, 113, 117, 105, 99, 107, 5, 0))
+
+    def testModified(self):
+        encoder.encode(self.s, cacheEncoding=True)
+
+        self.s['inner'].append('brown')
+
+        assert encoder.encode(self.s, cacheEncoding=True) == ints2octs(
+            (49, 18, 4, 5, 113, 117, 105, 99, 107, 5, 0, 48, 7, 4, 5, 98, 114, 111, 119, 110))
+        assert self.s.substrate == ints2octs(
+            (49, 18, 4, 5, 113, 117, 105, 99, 107, 5, 0, 48, 7, 4, 5, 98, 114, 111, 119, 110))
+
+
+class TwoPassEncoderTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        self.encode = encoder.TwoPassEncoder()
+
+        openType = opentype.OpenType(
+            'id',
+            {1: univ.Integer(),
+             2: univ.OctetString()}
+        )
+
+        self.s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('id', univ.Integer()),
+                namedtype.NamedType('blob', univ.Any(), openType=openType),
+                namedtype.OptionalNamedType(
+                    'set', univ.SetOf(componentType=univ.OctetString())),
+                namedtype.DefaultedNamedType('flag', univ.Boolean(False)),
+                namedtype.OptionalNamedType(
+                    'nested', univ.SequenceOf(
+                        componentType=univ.OctetString()).subtype(
+                        explicitTag=tag.Tag(tag.tagClassContext,
+                                            tag.tagFormatConstructed, 1)))
+            )
+        )
+
+    def testSequenceOf(self):
+        s = univ.SequenceOf(componentType=univ.Integer())
+        s.extend([1, 2, 3])
+
+        assert self.encode(s) == ints2octs(
+            (48, 9, 2, 1, 1, 2, 1, 2, 2, 1, 3))
+
+    def testNested(self):
+        self.s['id'] = 2
+        self.s['blob'] = univ.OctetString('quick brown')
+        self.s['set'].extend(['b', 'ab', 'a'])
+        self.s['flag'] = False
+        self.s['nested'].extend(['x' * 200] * 3)
+
+        assert self.encode(self.s) == encoder.encode(self.s)
+
+    def testDeeplyNested(self):
+        s = univ.OctetString('x' * 1000)
+
+        for idx in range(20):
+            t = univ.Sequence()
+            t[0] = univ.Integer(idx)
+            t[1] = s
+            s = t
+
+        assert self.encode(s) == encoder.encode(s)
+
+    def testEmptyOptional(self):
+        self.s['id'] = 1
+        self.s['blob'] = univ.Integer(12)
+        self.s['set'].clear()
+        self.s['nested'].clear()
+
+        assert self.encode(self.s) == encoder.encode(self.s)
+
+    def testWithSchema(self):
+        value = {'id': 1, 'blob': univ.Integer(12), 'set': ['b', 'a'],
+                 'flag': True, 'nested': ['fox']}
+
+        assert self.encode(value, asn1Spec=self.s) == encoder.encode(
+            value, asn1Spec=self.s)
+
+    def testDefModeOverridden(self):
+        s = univ.SequenceOf(componentType=univ.Integer())
+        s.extend([1, 2, 3])
+
+        assert self.encode(s, defMode=False) == encoder.encode(s)
+
+
+class CompiledEncoderTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        self.s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('id', univ.Integer()),
+                namedtype.OptionalNamedType(
+                    'set', univ.SetOf(componentType=univ.OctetString())),
+                namedtype.DefaultedNamedType('flag', univ.Boolean(False)),
+                namedtype.OptionalNamedType(
+                    'nested', univ.SequenceOf(
+                        componentType=univ.OctetString()).subtype(
+                        explicitTag=tag.Tag(tag.tagClassContext,
+                                            tag.tagFormatConstructed, 1)))
+            )
+        )
+
+        self.encode = encoder.encode.compile(self.s)
+
+    def testNested(self):
+        s = self.s.clone()
+        s['id'] = 2
+        s['set'].extend(['b', 'ab', 'a'])
+        s['flag'] = True
+        s['nested'].extend(['x' * 200] * 3)
+
+        assert self.encode(s) == encoder.encode(s)
+
+    def testDefModeOverridden(self):
+        s = self.s.clone()
+        s['id'] = 1
+        s['nested'].extend(['x' * 2000])
+
+        assert self.encode(
+            s, defMode=False, maxChunkSize=100) == encoder.encode(s)
+
+    def testWithSchema(self):
+        value = {'id': 1, 'set': ['b', 'a'], 'flag': False, 'nested': []}
+
+        assert self.encode(value) == ints2octs(
+            (48, 11, 2, 1, 1, 49, 6, 4, 1, 97, 4, 1, 98))
+
+    def testEmptyOptionals(self):
+        value = {'id': 1, 'set': [], 'nested': []}
+
+        assert self.encode(value, omitEmptyOptionals=False) == ints2octs(
+            (48, 9, 2, 1, 1, 49, 0, 161, 2, 48, 0))
+
+
+class EncodeIntoTestCase(BaseTestCase):
+    def testSetOf(self):
+        s = univ.SetOf(componentType=univ.OctetString())
+        s.extend(['b', 'ab', 'a'])
+
+        buffer = bytearray(13)
+
+        assert encoder.encode.encodeInto(s, buffer, 1) == 12
+        assert bytes(buffer[1:]) == encoder.encode(s)
+
+
 suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
 
 if __name__ == '__main__':
@@ -0,0 +1,182 @@
+#
+# This file is part of pyasn1 software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pyasn1/license.html
+#
+import sys
+import unittest
+
+from tests.base import BaseTestCase
+
+from pyasn1.type import univ
+from pyasn1.codec.ber import decoder as ber_decoder
+from pyasn1.codec.ber import encoder
+from pyasn1.codec.der import decoder as der_decoder
+from pyasn1.compat.octets import ints2octs
+from pyasn1 import error
+
+try:
+    import asyncio
+
+    from pyasn1.codec import asyncstreaming
+
+except (ImportError, SyntaxError):
+    asyncstreaming = None
+
+
+class Reader(object):
+    """Stream handing out at most `chunkSize` octets per read."""
+    def __init__(self, loop, substrate, chunkSize):
+        self.loop = loop
+        self.substrate = substrate
+        self.chunkSize = chunkSize
+
+    def read(self, size):
+        chunk = self.substrate[:min(size, self.chunkSize)]
+        self.substrate = self.substrate[len(chunk):]
+
+        future = self.loop.create_future()
+        future.set_result(chunk)
+
+        return future
+
+
+@unittest.skipIf(asyncstreaming is None, 'asyncio not available')
+class AsyncStreamingDecoderTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        self.s = univ.SequenceOf(componentType=univ.OctetString())
+        self.s.extend(['x' * 200, 'y'])
+
+        self.substrate = (
+            encoder.encode(self.s) +
+            encoder.encode(self.s, defMode=False, maxChunkSize=64) +
+            ints2octs((5, 0)))
+
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+        BaseTestCase.tearDown(self)
+
+    def _decode(self, decoder):
+        results = []
+
+        iterator = decoder.__aiter__()
+
+        while True:
+            try:
+                results.append(
+                    self.loop.run_until_complete(iterator.__anext__()))
+
+            except StopAsyncIteration:
+                return results
+
+    def testStreamReader(self):
+        reader = asyncio.StreamReader(loop=self.loop)
+        reader.feed_data(self.substrate)
+        reader.feed_eof()
+
+        results = self._decode(asyncstreaming.AsyncStreamingDecoder(reader))
+
+        assert results == [self.s, self.s, univ.Null('')]
+
+    def testShortReads(self):
+        results = self._decode(asyncstreaming.AsyncStreamingDecoder(
+            Reader(self.loop, self.substrate[:-2], 3),
+            asn1Spec=self.s.clone()))
+
+        assert results == [self.s, self.s]
+        assert results[1].isSameTypeWith(self.s)
+
+    def testNoOvershoot(self):
+        reader = Reader(self.loop, self.substrate + ints2octs((2, 1)), 1000)
+
+        decoder = asyncstreaming.AsyncStreamingDecoder(reader).__aiter__()
+
+        assert self.loop.run_until_complete(decoder.__anext__()) == self.s
+        assert len(reader.substrate) == len(self.substrate) - len(
+            encoder.encode(self.s)) + 2
+
+    def testDecoder(self):
+        decoder = asyncstreaming.AsyncStreamingDecoder(
+            Reader(self.loop, self.substrate, 1000),
+            decoder=der_decoder.decode).__aiter__()
+
+        assert self.loop.run_until_complete(decoder.__anext__()) == self.s
+
+        try:
+            self.loop.run_until_complete(decoder.__anext__())
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert 0, 'indefinite length tolerated by DER decoder'
+
+    def testEndOfStream(self):
+        try:
+            self._decode(asyncstreaming.AsyncStreamingDecoder(
+                Reader(self.loop, self.substrate[:-1], 1000)))
+
+        except error.EndOfStreamError:
+            pass
+
+        else:
+            assert 0, 'premature end of stream tolerated'
+
+    def testDeepNesting(self):
+        depth = sys.getrecursionlimit() * 2
+
+        substrate = (ints2octs((48, 128)) * depth + ints2octs((2, 1, 7)) +
+                     ints2octs((0, 0)) * depth)
+
+        def decode(substrate, asn1Spec, **options):
+            return ber_decoder.IterativeDecoder()(substrate, **options)
+
+        results = self._decode(asyncstreaming.AsyncStreamingDecoder(
+            Reader(self.loop, substrate, 1000), decoder=decode,
+            maxDepth=depth))
+
+        asn1Object = results[0]
+
+        for _ in range(depth):
+            asn1Object = asn1Object[0]
+
+        assert asn1Object == 7
+
+    def testMaxDepth(self):
+        substrate = ints2octs((48, 128)) * 4 + ints2octs((0, 0)) * 4
+
+        try:
+            self._decode(asyncstreaming.AsyncStreamingDecoder(
+                Reader(self.loop, substrate, 1000), maxDepth=2))
+
+        except error.DecodingLimitError:
+            pass
+
+        else:
+            assert 0, 'too deep nesting tolerated'
+
+    def testMaxValueLength(self):
+        # OCTET STRING claiming 2**31 - 1 octets
+        reader = Reader(self.loop, ints2octs((4, 132, 127, 255, 255, 255)), 1000)
+
+        try:
+            self._decode(asyncstreaming.AsyncStreamingDecoder(
+                reader, maxValueLength=1024))
+
+        except error.DecodingLimitError:
+            pass
+
+        else:
+            assert 0, 'huge value length tolerated'
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,175 @@
+#
+# This file is part of pyasn1 software.
+#
+# Copyright (c) 2005-2020, Ilya Etingof <etingof@gmail.com>
+# License: http://snmplabs.com/pyasn1/license.html
+#
+import sys
+import tempfile
+import unittest
+
+from tests.base import BaseTestCase
+
+from pyasn1.type import namedtype
+from pyasn1.type import univ
+from pyasn1.codec import parallel
+from pyasn1.codec.ber import encoder
+from pyasn1.codec.der import decoder as der_decoder
+from pyasn1.compat.octets import ints2octs, str2octs, null
+from pyasn1 import error
+
+
+class IterRecordsTestCase(BaseTestCase):
+    def testDefMode(self):
+        substrate = ints2octs((2, 1, 1, 48, 3, 2, 1, 2, 5, 0))
+
+        assert list(parallel.iterRecords(substrate)) == [
+            (0, 3), (3, 8), (8, 10)]
+
+    def testIndefMode(self):
+        substrate = ints2octs((48, 128, 48, 128, 5, 0, 0, 0, 0, 0, 2, 1, 1))
+
+        assert list(parallel.iterRecords(bytearray(substrate))) == [
+            (0, 10), (10, 13)]
+
+    def testOffset(self):
+        substrate = ints2octs((0, 0, 2, 1, 1))
+
+        assert list(parallel.iterRecords(substrate, 2)) == [(2, 5)]
+
+    def testTruncated(self):
+        records = parallel.iterRecords(ints2octs((2, 1, 1, 48, 3, 2, 1)))
+
+        assert next(records) == (0, 3)
+
+        try:
+            next(records)
+
+        except error.SubstrateUnderrunError:
+            pass
+
+        else:
+            assert 0, 'truncated record tolerated'
+
+    def testMissingEndOfOctets(self):
+        try:
+            list(parallel.iterRecords(ints2octs((48, 128, 5, 0))))
+
+        except error.SubstrateUnderrunError:
+            pass
+
+        else:
+            assert 0, 'missing end-of-octets tolerated'
+
+    def testDeepNesting(self):
+        depth = sys.getrecursionlimit() * 2
+
+        substrate = ints2octs((48, 128)) * depth + ints2octs((0, 0)) * depth
+
+        assert list(parallel.iterRecords(substrate + ints2octs((5, 0)))) == [
+            (0, depth * 4), (depth * 4, depth * 4 + 2)]
+
+
+@unittest.skipIf(parallel.futures is None, 'concurrent.futures not available')
+class ParallelDecoderTestCase(BaseTestCase):
+    def setUp(self):
+        BaseTestCase.setUp(self)
+
+        self.s = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('id', univ.Integer()),
+                namedtype.NamedType('name', univ.OctetString())
+            )
+        )
+
+        self.substrate = null
+
+        for idx in range(50):
+            self.s['id'] = idx
+            self.s['name'] = 'x' * idx
+            self.substrate += encoder.encode(self.s, defMode=bool(idx % 2))
+
+        self.decode = parallel.ParallelDecoder(
+            self.s, workers=2, batchSize=8)
+
+    def testBuffer(self):
+        results = list(self.decode(self.substrate))
+
+        assert len(results) == 50
+
+        for idx, result in enumerate(results):
+            assert result['id'] == idx
+            assert result['name'] == str2octs('x' * idx)
+            assert result.isSameTypeWith(self.s)
+
+    def testFile(self):
+        with tempfile.TemporaryFile() as substrate:
+            substrate.write(self.substrate)
+            substrate.flush()
+
+            results = list(self.decode(substrate))
+
+        assert [result['id'] for result in results] == list(range(50))
+
+    def testTruncatedFile(self):
+        with tempfile.TemporaryFile() as substrate:
+            substrate.write(self.substrate[:-1])
+            substrate.flush()
+
+            try:
+                list(self.decode(substrate))
+
+            except error.SubstrateUnderrunError:
+                pass
+
+            else:
+                assert 0, 'truncated record tolerated'
+
+    def testEmptyFile(self):
+        with tempfile.TemporaryFile() as substrate:
+            assert list(self.decode(substrate)) == []
+
+    def testNative(self):
+        decode = parallel.ParallelDecoder(
+            self.s, workers=2, batchSize=8, native=True)
+
+        results = list(decode(self.substrate))
+
+        assert results[3] == {'id': 3, 'name': str2octs('xxx')}
+
+    def testLazy(self):
+        decode = parallel.ParallelDecoder(
+            self.s, workers=2, batchSize=8, lazy=True)
+
+        results = list(decode(self.substrate))
+
+        assert [result['id'] for result in results] == list(range(50))
+
+    def testKeepSubstrate(self):
+        decode = parallel.ParallelDecoder(
+            self.s, workers=2, batchSize=8, keepSubstrate=True)
+
+        results = list(decode(self.substrate))
+
+        assert [result['id'] for result in results] == list(range(50))
+
+    def testErrors(self):
+        decode = parallel.ParallelDecoder(
+            self.s, decoder=der_decoder.decode, workers=2, batchSize=8)
+
+        results = list(decode(self.substrate))
+
+        assert len(results) == 50
+
+        for idx, result in enumerate(results):
+            if idx % 2:
+                assert result['id'] == idx
+
+            else:
+                assert isinstance(result, error.PyAsn1Error)
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == '__main__':
+    unittest.TextTestRunner(verbosity=2).run(suite)
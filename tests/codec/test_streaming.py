@@ -5,7 +5,10 @@
 # License: http://snmplabs.com/pyasn1/license.html
 #
 import io
+import mmap
+import os
 import sys
+import tempfile
 
 try:
     import unittest2 as unittest
@@ -15,6 +18,7 @@ except ImportError:
 
 from tests.base import BaseTestCase
 
+from pyasn1 import error
 from pyasn1.codec import streaming
 
 
@@ -65,8 +69,131 @@ class CachingStreamWrapperTestCase(BaseTestCase):
 
         # The following should clear the cache
         wrapper.markedPosition = wrapper.tell()
-        assert wrapper.markedPosition == 0
-        assert len(wrapper._cache.getvalue()) == 0
+        assert wrapper.markedPosition == 10 + io.DEFAULT_BUFFER_SIZE
+        assert wrapper.bufferedOctets == 0
+        assert wrapper.discardedOctets == 10 + io.DEFAULT_BUFFER_SIZE
+        assert wrapper.compactedOctets == 0
+
+        # Positions survive compaction
+        assert wrapper.tell() == 10 + io.DEFAULT_BUFFER_SIZE
+        wrapper.seek(wrapper.markedPosition)
+        assert wrapper.read(4) == self.longText[10 + io.DEFAULT_BUFFER_SIZE:][:4]
+
+    def testCompaction(self):
+        wrapper = streaming.CachingStreamWrapper(self.longStream)
+        wrapper.read(io.DEFAULT_BUFFER_SIZE + 10)
+        wrapper.markedPosition = io.DEFAULT_BUFFER_SIZE + 5
+        assert wrapper.bufferedOctets == 5
+        assert wrapper.compactedOctets == 5
+
+        wrapper.seek(io.DEFAULT_BUFFER_SIZE + 5)
+        assert wrapper.read(3) == self.longText[io.DEFAULT_BUFFER_SIZE + 5:][:3]
+
+    def testSeekBeforeMarkedPosition(self):
+        wrapper = streaming.CachingStreamWrapper(self.longStream)
+        wrapper.read(io.DEFAULT_BUFFER_SIZE + 10)
+        wrapper.markedPosition = wrapper.tell()
+
+        try:
+            wrapper.seek(0)
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert 0, 'seeking into discarded data tolerated'
+
+    def testMaxLookback(self):
+        wrapper = streaming.CachingStreamWrapper(
+            self.longStream, maxLookback=100)
+        wrapper.read(60)
+        wrapper.markedPosition = wrapper.tell()
+        wrapper.read(60)
+
+        try:
+            wrapper.read(60)
+
+        except error.PyAsn1Error:
+            pass
+
+        else:
+            assert 0, 'lookback overflow tolerated'
+
+
+class MemoryViewStreamTestCase(BaseTestCase):
+    def setUp(self):
+        self.buffer = bytearray(b"abcdefghij")
+
+    def testRead(self):
+        stream = streaming.MemoryViewStream(self.buffer)
+        assert stream.read(4) == b"abcd"
+        assert stream.tell() == 4
+        assert stream.read() == b"efghij"
+        assert stream.read(1) == b""
+
+    def testSeek(self):
+        stream = streaming.MemoryViewStream(self.buffer)
+        stream.seek(-3, io.SEEK_END)
+        assert stream.read(2) == b"hi"
+        stream.seek(-4, io.SEEK_CUR)
+        assert stream.read(1) == b"f"
+
+    def testPeek(self):
+        stream = streaming.MemoryViewStream(self.buffer)
+        stream.read(2)
+        assert stream.peek(3) == b"cde"
+        assert stream.tell() == 2
+
+    def testSeek(self):
+        stream = streaming.MemoryViewStream(self.buffer)
+        assert stream.seek(-3, os.SEEK_END) == 7
+        assert stream.read(5) == b"hij"
+        assert stream.tell() == 10
+        assert stream.seek(-20, os.SEEK_CUR) == 0
+        assert stream.read(2) == b"ab"
+
+    def testInPlace(self):
+        stream = streaming.MemoryViewStream(self.buffer)
+        self.buffer[0:1] = b"z"
+        assert stream.read(1) == b"z"
+
+    def testAsSeekableStream(self):
+        for substrate in (self.buffer, memoryview(self.buffer)):
+            stream = streaming.asSeekableStream(substrate)
+            assert isinstance(stream, streaming.MemoryViewStream)
+            assert stream.read() == b"abcdefghij"
+
+
+class MmapStreamTestCase(BaseTestCase):
+    def setUp(self):
+        self.file = tempfile.TemporaryFile()
+        self.file.write(b"abcdefghij")
+        self.file.flush()
+
+        self.mmap = mmap.mmap(
+            self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def tearDown(self):
+        self.mmap.close()
+        self.file.close()
+
+    def testRead(self):
+        stream = streaming._MmapStream(self.mmap)
+        assert stream.read(4) == b"abcd"
+        assert stream.tell() == 4
+        assert stream.peek(2) == b"ef"
+        assert stream.read() == b"efghij"
+        assert stream.read(1) == b""
+
+    def testSeek(self):
+        stream = streaming._MmapStream(self.mmap)
+        assert stream.seek(-3, os.SEEK_END) == 7
+        assert stream.read(5) == b"hij"
+
+    def testAsSeekableStream(self):
+        stream = streaming.asSeekableStream(self.mmap)
+        assert stream.read() == b"abcdefghij"
+        stream.close()
 
 
 suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
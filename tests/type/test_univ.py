@@ -17,6 +17,8 @@ from pyasn1.type import constraint
 from pyasn1.type import namedtype
 from pyasn1.type import namedval
 from pyasn1.type import error
+from pyasn1.codec.ber import decoder
+from pyasn1.codec.ber import encoder
 from pyasn1.compat.octets import str2octs, ints2octs, octs2ints, octs2str
 from pyasn1.error import PyAsn1Error
 from pyasn1.error import PyAsn1UnicodeEncodeError, PyAsn1UnicodeDecodeError
@@ -1800,6 +1802,39 @@ class SequencePicklingTestCase(unittest.TestCase):
         assert new_asn1
         assert new_asn1['name'] == str2octs('test')
 
+    def testLazyValuePickling(self):
+        old_asn1 = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('name', univ.OctetString()),
+                namedtype.NamedType(
+                    'ids', univ.SequenceOf(componentType=univ.Integer()))
+            )
+        )
+        old_asn1['name'] = 'test'
+        old_asn1['ids'].extend([1, 2])
+        old_asn1, _ = decoder.decode(
+            encoder.encode(old_asn1), asn1Spec=old_asn1, lazy=True)
+        serialised = pickle.dumps(old_asn1)
+        assert serialised
+        new_asn1 = pickle.loads(serialised)
+        assert new_asn1['name'] == str2octs('test')
+        assert list(new_asn1['ids']) == [1, 2]
+
+    def testValueWithSubstratePickling(self):
+        old_asn1 = univ.Sequence(
+            componentType=namedtype.NamedTypes(
+                namedtype.NamedType('name', univ.OctetString())
+            )
+        )
+        old_asn1['name'] = 'test'
+        old_asn1, _ = decoder.decode(
+            encoder.encode(old_asn1), asn1Spec=old_asn1, keepSubstrate=True)
+        serialised = pickle.dumps(old_asn1)
+        assert serialised
+        new_asn1 = pickle.loads(serialised)
+        assert new_asn1['name'] == str2octs('test')
+        assert new_asn1.substrate is None
+
 
 class SetOf(BaseTestCase):
     def setUp(self):